@@ -0,0 +1,38 @@
+"""Measure the cold import cost of the package in fresh interpreters.
+
+Run from the repository root with ``python -m benchmarks.bench_import``.
+"""
+import statistics
+import subprocess
+import sys
+
+SNIPPET = """
+import sys, time
+t = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - t
+heavy = [m for m in ("requests", "tenacity", "pytz", "soliscloud.models") if m in sys.modules]
+print(elapsed, ",".join(heavy))
+"""
+
+MODULES = ["soliscloud", "soliscloud.soliscloud", "soliscloud.session"]
+
+
+def measure(module: str, runs: int = 15) -> tuple[float, str]:
+    timings = []
+    heavy = ""
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", SNIPPET.format(module=module)], capture_output=True, text=True, check=True)
+        elapsed, heavy = out.stdout.strip().split(" ") if " " in out.stdout.strip() else (out.stdout.strip(), "")
+        timings.append(float(elapsed))
+    return statistics.median(timings), heavy
+
+
+def main():
+    for module in MODULES:
+        elapsed, heavy = measure(module)
+        print(f"import {module:<24} {elapsed * 1000:8.2f} ms  loaded: {heavy or '-'}")
+
+
+if __name__ == "__main__":
+    main()
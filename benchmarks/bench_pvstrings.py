@@ -0,0 +1,32 @@
+"""Time PV string underperformance detection for a large fleet.
+
+Run from the repository root with ``python -m benchmarks.bench_pvstrings``.
+"""
+import random
+import timeit
+
+from soliscloud.pvstrings import StringMatrix, find_underperforming_strings
+
+
+def make_details(count: int, strings: int = 4) -> list[dict]:
+    rng = random.Random(1)
+    details = []
+    for x in range(count):
+        data = {"sn": f"SN{x:08d}", "stationId": f"st{x // 4}", "dcInputtype": strings - 1}
+        for channel in range(1, strings + 1):
+            current = rng.uniform(7.5, 8.5) * (0.1 if rng.random() < 0.01 else 1.0)
+            data.update({f"uPv{channel}": rng.uniform(300, 400), f"uPv{channel}Str": "V", f"iPv{channel}": current, f"iPv{channel}Str": "A"})
+        details.append(data)
+    return details
+
+
+def main(count: int = 10000, number: int = 5):
+    details = make_details(count)
+    load = min(timeit.repeat(lambda: StringMatrix.from_inverters(details), number=number, repeat=3)) / number * 1e3
+    matrix = StringMatrix.from_inverters(details)
+    detect = min(timeit.repeat(lambda: find_underperforming_strings(matrix), number=number, repeat=3)) / number * 1e3
+    print(f"{count} inverters: load {load:.1f} ms, detect {detect:.1f} ms, {len(find_underperforming_strings(matrix))} strings flagged")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Compare the original per-request signing with ``RequestSigner``.
+
+The legacy path is ``SolisCloud.__generate_authorization__`` and the body
+handling around it, copied from the code ``RequestSigner`` replaced
+(``pytz`` included, so it is skipped when ``pytz`` is not installed).
+
+Run from the repository root with ``python -m benchmarks.bench_signing``.
+"""
+from base64 import b64encode
+from datetime import datetime
+import hashlib
+import hmac
+import json
+import timeit
+
+from soliscloud.signing import RequestSigner
+
+try:
+    import pytz
+except ImportError:
+    pytz = None
+
+
+KEY_ID = "1300386381676488888"
+KEY_SECRET = "304faa2ae6d2475ba7b6d5e4b5c8d4a0"
+URI = "/v1/api/inverterDetail"
+BODY = {"id": "1308675217944611083", "sn": "120B40198150131"}
+
+
+class LegacySigner():
+    def __init__(self, key_id: str, key_secret: str):
+        self.key_id: str = key_id
+        self.key_secret: str = key_secret
+        self.headers = {}
+
+    # verbatim from the original SolisCloud client
+    def __generate_authorization__(self, verb: str = "POST", body: str = "", content_type: str = "application/json", uri: str = "/"):
+        now = datetime.now(pytz.UTC).strftime("%a, %d %b %Y %H:%M:%S GMT")
+        content_md5 = b64encode(hashlib.md5(body.encode()).digest()).decode()
+        message = ("\n".join([verb, content_md5, content_type, now, uri]))
+        sign = b64encode(hmac.new(self.key_secret.encode(), msg=message.encode(), digestmod=hashlib.sha1).digest())
+        self.headers = {
+            "Authorization": f"API {self.key_id}:{sign.decode()}",
+            "Content-Type": content_type,
+            "Content-MD5": content_md5,
+            "Date": now
+        }
+
+
+def legacy_sign(signer: LegacySigner, body: dict) -> tuple[dict, bytes]:
+    signer.__generate_authorization__("POST", json.dumps(body, separators=(',',':')), "application/json", URI)
+    # the original sent ``json=body``, which requests serialises a second time
+    return signer.headers, json.dumps(body, allow_nan=False).encode("utf-8")
+
+
+def signer_sign(signer: RequestSigner, body: dict) -> tuple[dict, bytes]:
+    payload = signer.serialize(body)
+    return signer.sign(payload, URI), payload
+
+
+def main(number: int = 100000):
+    signer = RequestSigner(KEY_ID, KEY_SECRET)
+    current = min(timeit.repeat(lambda: signer_sign(signer, BODY), number=number, repeat=5))
+    print(f"RequestSigner:   {current / number * 1e6:8.2f} us/request")
+    if pytz is None:
+        print("legacy signing:  skipped (pytz is not installed)")
+        return
+    legacy_signer = LegacySigner(KEY_ID, KEY_SECRET)
+    legacy = min(timeit.repeat(lambda: legacy_sign(legacy_signer, BODY), number=number, repeat=5))
+    print(f"legacy signing:  {legacy / number * 1e6:8.2f} us/request")
+    print(f"speed-up:        {legacy / current:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
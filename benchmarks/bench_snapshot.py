@@ -0,0 +1,40 @@
+"""Compare snapshot frames with the JSON of ``SolisInverter._to_json()``.
+
+Run from the repository root with ``python -m benchmarks.bench_snapshot``.
+"""
+import json
+import random
+import timeit
+
+from soliscloud.models import SolisInverter
+from soliscloud.snapshot import SnapshotCodec
+
+
+def make_inverter(seed: int) -> dict:
+    rng = random.Random(seed)
+    data = SolisInverter()._to_json()
+    data.pop("charge_discharge_schedule")
+    data.update({
+        "id": "1308675217944611083", "sn": "120B40198150131", "stationId": "1298491919448631809",
+        "pac": round(rng.uniform(0, 5), 3), "pacStr": "kW", "eToday": round(rng.uniform(0, 30), 1), "eTodayStr": "kWh",
+        "uPv1": round(rng.uniform(200, 400), 1), "iPv1": round(rng.uniform(0, 10), 2), "uPv2": round(rng.uniform(200, 400), 1),
+        "iPv2": round(rng.uniform(0, 10), 2), "state": 1, "dataTimestamp": str(1700000000000 + seed * 300000),
+        "batteryCapacitySoc": rng.randint(10, 100), "model": "3105", "version": "3D0037",
+    })
+    return data
+
+
+def main(number: int = 2000):
+    codec = SnapshotCodec(SolisInverter)
+    first, second = make_inverter(1), make_inverter(2)
+    as_json = json.dumps(second, separators=(',',':')).encode()
+    full = codec.encode(second)
+    delta = codec.encode(second, first)
+    print(f"json:          {len(as_json):6d} bytes  encode {min(timeit.repeat(lambda: json.dumps(second, separators=(',',':')).encode(), number=number, repeat=3)) / number * 1e6:8.1f} us")
+    print(f"full frame:    {len(full):6d} bytes  encode {min(timeit.repeat(lambda: codec.encode(second), number=number, repeat=3)) / number * 1e6:8.1f} us  decode {min(timeit.repeat(lambda: codec.decode(full), number=number, repeat=3)) / number * 1e6:8.1f} us")
+    print(f"delta frame:   {len(delta):6d} bytes  encode {min(timeit.repeat(lambda: codec.encode(second, first), number=number, repeat=3)) / number * 1e6:8.1f} us  decode {min(timeit.repeat(lambda: codec.decode(delta, first), number=number, repeat=3)) / number * 1e6:8.1f} us")
+    print(f"zlib full:     {len(codec.encode(second, compress=True)):6d} bytes")
+
+
+if __name__ == "__main__":
+    main()
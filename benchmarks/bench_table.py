@@ -0,0 +1,46 @@
+"""Compare fleet analytics on ``InverterTable`` columns with loops over ``SolisInverter`` objects.
+
+Run from the repository root with ``python -m benchmarks.bench_table``.
+"""
+import random
+import timeit
+
+from soliscloud.models import SolisInverter
+from soliscloud.table import InverterTable
+
+
+def make_records(count: int) -> list[dict]:
+    rng = random.Random(1)
+    return [
+        {
+            "id": str(x), "sn": f"SN{x:08d}", "stationId": f"st{x % 500}", "pac": round(rng.uniform(0, 5), 3),
+            "eToday": round(rng.uniform(0, 30), 1), "batteryCapacitySoc": rng.randint(0, 100), "state": 1,
+        }
+        for x in range(count)
+    ]
+
+
+def objects_pac_by_station(inverters: list) -> dict:
+    totals = {}
+    for inverter in inverters:
+        totals[inverter.stationId] = totals.get(inverter.stationId, 0.0) + inverter.pac
+    return totals
+
+
+def main(count: int = 20000, number: int = 20):
+    records = make_records(count)
+    inverters = [SolisInverter()._from_json(x) for x in records]
+    table = InverterTable.from_records(records)
+    tests = [
+        ("pac per station", lambda: objects_pac_by_station(inverters), lambda: table.group_by("stationId", "pac")),
+        ("soc < 20", lambda: [x.sn for x in inverters if x.batteryCapacitySoc < 20], lambda: table.where(("batteryCapacitySoc", "<", 20))),
+        ("top 10 eToday", lambda: sorted(inverters, key=lambda x: x.eToday, reverse=True)[:10], lambda: table.top("eToday", 10)),
+    ]
+    for name, objects, columns in tests:
+        a = min(timeit.repeat(objects, number=number, repeat=3)) / number * 1e3
+        b = min(timeit.repeat(columns, number=number, repeat=3)) / number * 1e3
+        print(f"{name:16s} objects {a:7.2f} ms  table {b:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
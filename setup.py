@@ -19,7 +19,6 @@ setup(
         "Operating System :: OS Independent",
     ],
     install_requires=[
-        "requests",
-        "tenacity"
+        "requests"
     ]
 )
\ No newline at end of file
@@ -1 +1,72 @@
-from soliscloud.soliscloud import *
\ No newline at end of file
+"""Work with the SolisCloud API.
+
+Public names are resolved on first access so that ``import soliscloud`` does
+not pull in ``requests`` or the model definitions until they are used.
+"""
+from importlib import import_module
+
+_LAZY_NAMES = {
+    "SolisCloud": "soliscloud.soliscloud",
+    "Endpoint": "soliscloud.endpoints",
+    "ResponseCache": "soliscloud.middleware",
+    "RequestMetrics": "soliscloud.middleware",
+    "HedgedRequests": "soliscloud.middleware",
+    "SingleFlight": "soliscloud.soliscloud",
+    "SolisConnectException": "soliscloud.exceptions",
+    "SolisTimeoutException": "soliscloud.exceptions",
+    "Deadline": "soliscloud.deadline",
+    "RequestSigner": "soliscloud.signing",
+    "RateLimiter": "soliscloud.ratelimit",
+    "SolisCloudPool": "soliscloud.pool",
+    "PriorityDispatcher": "soliscloud.dispatcher",
+    "PoolResult": "soliscloud.pool",
+    "SharedRateLimiter": "soliscloud.ratelimit",
+    "ShardedPoller": "soliscloud.sharding",
+    "SnapshotCodec": "soliscloud.snapshot",
+    "SnapshotEncoder": "soliscloud.snapshot",
+    "SnapshotDecoder": "soliscloud.snapshot",
+    "TelemetryStore": "soliscloud.store",
+    "FleetIndex": "soliscloud.fleet",
+    "EventStream": "soliscloud.events",
+    "ScheduleCache": "soliscloud.schedules",
+    "InverterTable": "soliscloud.table",
+    "StringMatrix": "soliscloud.pvstrings",
+    "StringAnomaly": "soliscloud.pvstrings",
+    "ChangeEvent": "soliscloud.events",
+    "RequestsSession": "soliscloud.session",
+    "EPMFields": "soliscloud.models",
+    "StatusVo": "soliscloud.models",
+    "SolisStation": "soliscloud.models",
+    "EPMDataDayItem": "soliscloud.models",
+    "EPMDataMonthYearItem": "soliscloud.models",
+    "EPMDayData": "soliscloud.models",
+    "EPMMonthYearData": "soliscloud.models",
+    "SolisEPM": "soliscloud.models",
+    "SolisStations": "soliscloud.models",
+    "SolisInverter": "soliscloud.models",
+    "SolisCollector": "soliscloud.models",
+    "HistoryData": "soliscloud.models",
+    "SolisAlarm": "soliscloud.models",
+    "AlarmCursor": "soliscloud.alarms",
+    "ScheduleDateTime": "soliscloud.models",
+    "ScheduleDate": "soliscloud.models",
+    "ChargeData": "soliscloud.models",
+    "Schedule": "soliscloud.models",
+    "ChargeDischargeSchedule": "soliscloud.models",
+    "SolisSetResult": "soliscloud.models",
+}
+
+__all__ = list(_LAZY_NAMES)
+
+
+def __getattr__(name):
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,232 @@
+from __future__ import annotations
+from array import array
+from bisect import bisect_left
+from datetime import date, datetime, timedelta, timezone
+from math import isnan, nan
+from typing import Iterable, Optional
+from soliscloud.models import EPMDayData
+
+PHASE_POWER_FIELDS = ("p_ac1", "p_ac2", "p_ac3")
+COUNTER_FIELDS = ("e_total_inverter", "e_total_load", "e_total_buy", "e_total_sell")
+DAY_MS = 86400000
+
+
+class FieldStats():
+    def __init__(self):
+        self.count: int = 0
+        self.min: float = nan
+        self.max: float = nan
+        self.mean: float = nan
+        self.sum: float = 0.0
+
+    def _to_json(self) -> dict:
+        return {key: value for key, value in self.__dict__.items() if not key.startswith("_")}
+
+
+class Rollup():
+    """Fixed-interval rollup of one or more EPM series.
+
+    ``timestamps`` holds the bucket start times as epoch milliseconds,
+    ``columns`` the aggregated value per field and bucket, and ``counts`` the
+    number of samples that fell in each bucket.
+    """
+    def __init__(self, interval: int, tzinfo: timezone = timezone.utc):
+        self.interval: int = interval
+        self.tzinfo: timezone = tzinfo
+        self.timestamps: array = array('q')
+        self.counts: array = array('q')
+        self.columns: dict[str, array] = {}
+
+    def datetimes(self) -> list[datetime]:
+        return [datetime.fromtimestamp(x / 1000, self.tzinfo) for x in self.timestamps]
+
+    def _to_json(self) -> dict:
+        json_obj = {}
+        for x, dt in enumerate(self.datetimes()):
+            json_obj[dt.isoformat()] = {key: values[x] for key, values in self.columns.items()}
+        return json_obj
+
+
+def numeric_column(values: Iterable) -> array:
+    """Convert a raw column to ``array('d')``, mapping unreadable values to NaN."""
+    try:
+        return array('d', map(float, values))
+    except (TypeError, ValueError):
+        pass
+    column = array('d')
+    for value in values:
+        try:
+            column.append(float(value))
+        except (TypeError, ValueError):
+            column.append(nan)
+    return column
+
+
+def _finite(column: array) -> array:
+    total = sum(column)
+    if total == total:
+        return column
+    return array('d', [x for x in column if not isnan(x)])
+
+
+def _offset_ms(tzinfo: timezone) -> int:
+    return int(tzinfo.utcoffset(None).total_seconds() * 1000)
+
+
+def _sorted_series(day: EPMDayData, fields: Iterable[str]) -> tuple[array, dict[str, array]]:
+    timestamps = day.timestamps
+    columns = {key: numeric_column(day.columns.get(key, [])) for key in fields if key in day.columns}
+    if all(timestamps[x] <= timestamps[x + 1] for x in range(0, len(timestamps) - 1)):
+        return timestamps, columns
+    order = sorted(range(0, len(timestamps)), key=timestamps.__getitem__)
+    return (
+        array('q', [timestamps[x] for x in order]),
+        {key: array('d', [values[x] for x in order]) for key, values in columns.items()}
+    )
+
+
+def _bucket_bounds(timestamps: array, interval_ms: int, offset_ms: int) -> list[tuple[int, int, int]]:
+    bounds = []
+    start = 0
+    total = len(timestamps)
+    while start < total:
+        bucket = (timestamps[start] + offset_ms) // interval_ms * interval_ms - offset_ms
+        end = bisect_left(timestamps, bucket + interval_ms, start)
+        bounds.append((bucket, start, end))
+        start = end
+    return bounds
+
+
+def field_stats(column: Iterable) -> FieldStats:
+    stats = FieldStats()
+    values = _finite(column if isinstance(column, array) else numeric_column(column))
+    if values:
+        stats.count = len(values)
+        stats.min = min(values)
+        stats.max = max(values)
+        stats.sum = sum(values)
+        stats.mean = stats.sum / stats.count
+    return stats
+
+
+def phase_stats(day: EPMDayData, fields: Iterable[str] = PHASE_POWER_FIELDS) -> dict[str, FieldStats]:
+    """Min / max / mean per field (by default the three phase powers) for one day of EPM data."""
+    return {key: field_stats(day.columns[key]) for key in fields if key in day.columns}
+
+
+def resample(day: EPMDayData, interval: int = 900, fields: Iterable[str] = PHASE_POWER_FIELDS + ("p_load",), how: str = "mean") -> Rollup:
+    """Resample EPM day data into fixed intervals aligned to the meter's local time.
+
+    Args:
+        day (EPMDayData): The day data to resample
+        interval (int): Bucket width in seconds (default 15 minutes)
+        fields (Iterable[str]): Columns to aggregate
+        how (str): One of ``mean``, ``sum``, ``min``, ``max``, ``first`` or ``last``
+    """
+    reducers = {
+        "mean": lambda x: sum(x) / len(x) if x else nan,
+        "sum": sum,
+        "min": lambda x: min(x) if x else nan,
+        "max": lambda x: max(x) if x else nan,
+        "first": lambda x: x[0] if x else nan,
+        "last": lambda x: x[-1] if x else nan,
+    }
+    if how not in reducers:
+        raise ValueError(f"Unknown aggregation {how!r}")
+    reduce = reducers[how]
+    timestamps, columns = _sorted_series(day, fields)
+    rollup = Rollup(interval, day.tzinfo)
+    rollup.columns = {key: array('d') for key in columns}
+    for bucket, start, end in _bucket_bounds(timestamps, interval * 1000, _offset_ms(day.tzinfo)):
+        rollup.timestamps.append(bucket)
+        rollup.counts.append(end - start)
+        for key, values in columns.items():
+            rollup.columns[key].append(reduce(_finite(values[start:end])))
+    return rollup
+
+
+def peak_demand(day: EPMDayData, field: str = "p_load", interval: Optional[int] = None) -> tuple[Optional[datetime], float]:
+    """Highest value of ``field`` for the day.
+
+    With ``interval`` (seconds) the peak is taken over interval means, which
+    is how demand charges are usually measured, rather than single samples.
+    """
+    if interval:
+        rollup = resample(day, interval, (field,))
+        timestamps, values = rollup.timestamps, rollup.columns.get(field, array('d'))
+    else:
+        timestamps, columns = _sorted_series(day, (field,))
+        values = columns.get(field, array('d'))
+    best = -1
+    for x, value in enumerate(values):
+        if not isnan(value) and (best < 0 or value > values[best]):
+            best = x
+    if best < 0:
+        return None, nan
+    return datetime.fromtimestamp(timestamps[best] / 1000, day.tzinfo), values[best]
+
+
+def counter_delta(column: array) -> float:
+    """Energy added over a cumulative counter column; after a counter reset the new reading counts from zero."""
+    values = _finite(column)
+    if len(values) < 2:
+        return 0.0
+    return sum(b - a if b >= a else b for a, b in zip(values, values[1:]))
+
+
+def daily_totals(day: EPMDayData, counters: Iterable[str] = COUNTER_FIELDS) -> dict[date, dict[str, float]]:
+    """Energy per local calendar day, from the deltas of the ``e_total_*`` counters.
+
+    The increase between the last sample of one day and the first sample of
+    the next is counted on the later day.
+    """
+    timestamps, columns = _sorted_series(day, counters)
+    offset = _offset_ms(day.tzinfo)
+    totals = {}
+    for bucket, start, end in _bucket_bounds(timestamps, DAY_MS, offset):
+        local_day = (datetime(1970, 1, 1) + timedelta(milliseconds=bucket + offset)).date()
+        # start from the previous day's last sample
+        first = max(start - 1, 0)
+        totals[local_day] = {key: counter_delta(values[first:end]) for key, values in columns.items()}
+    return totals
+
+
+def aggregate_meters(days: dict[str, EPMDayData], interval: int = 900, fields: Iterable[str] = PHASE_POWER_FIELDS + ("p_load",)) -> tuple[dict[str, Rollup], Rollup]:
+    """Resample many meters and sum them into a fleet-wide rollup in one pass.
+
+    Args:
+        days (dict[str, EPMDayData]): Day data keyed by meter serial number
+        interval (int): Bucket width in seconds
+        fields (Iterable[str]): Columns to aggregate
+
+    Returns:
+        tuple[dict[str, Rollup], Rollup]: The per-meter mean rollups and the
+        fleet rollup, whose columns hold the sum of the meter means per bucket.
+
+    Raises:
+        ValueError: The meters are in different time zones, so their buckets do not line up
+    """
+    offsets = {_offset_ms(day.tzinfo) for day in days.values()}
+    if len(offsets) > 1:
+        raise ValueError("All meters must share one time zone offset to be aggregated")
+    fields = tuple(fields)
+    per_meter = {}
+    sums: dict[int, dict[str, float]] = {}
+    counts: dict[int, int] = {}
+    for sn, day in days.items():
+        rollup = resample(day, interval, fields)
+        per_meter[sn] = rollup
+        for x, bucket in enumerate(rollup.timestamps):
+            bucket_sums = sums.setdefault(bucket, dict.fromkeys(fields, 0.0))
+            counts[bucket] = counts.get(bucket, 0) + rollup.counts[x]
+            for key, values in rollup.columns.items():
+                if not isnan(values[x]):
+                    bucket_sums[key] += values[x]
+    fleet = Rollup(interval, next(iter(days.values())).tzinfo if days else timezone.utc)
+    fleet.columns = {key: array('d') for key in fields}
+    for bucket in sorted(sums):
+        fleet.timestamps.append(bucket)
+        fleet.counts.append(counts[bucket])
+        for key in fields:
+            fleet.columns[key].append(sums[bucket][key])
+    return per_meter, fleet
@@ -0,0 +1,122 @@
+from __future__ import annotations
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Optional
+import json
+import os
+import threading
+import time
+from soliscloud.models import SolisAlarm
+
+if TYPE_CHECKING:
+    from soliscloud.soliscloud import SolisCloud
+
+DAY_MS = 86400000
+
+
+def _millis(value) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+class AlarmCursor():
+    def __init__(self, path: Optional[str] = None, lookback: float = 1.0, overlap: float = 3600.0, max_active_age: float = 30.0):
+        """Since-last-seen cursor over the alarm list.
+
+        ``poll`` only asks SolisCloud for alarms raised since the newest alarm
+        already seen (less ``overlap`` seconds, as the API filters by day), or
+        since the oldest alarm still active so it can notice that alarm clear.
+        The cursor remembers which alarms it has reported and returns just the
+        new and the cleared ones. With ``path`` the cursor is saved as JSON
+        after every poll and reloaded on start.
+
+        Args:
+            path (str): File to persist the cursor in
+            lookback (float): Days to look back on the first poll
+            overlap (float): Seconds re-read before the newest seen alarm
+            max_active_age (float): Days after which an alarm that never cleared stops widening the window
+        """
+        self.path: Optional[str] = path
+        self.lookback: float = lookback
+        self.overlap: float = overlap
+        self.max_active_age: float = max_active_age
+        self.last_seen: int = 0
+        self.known: dict[str, list] = {}
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            self.load()
+
+    def window_start(self, now: Optional[int] = None) -> int:
+        """Epoch milliseconds from which the next poll reads alarms."""
+        now = int(time.time() * 1000) if now is None else now
+        if not self.last_seen:
+            return now - int(self.lookback * DAY_MS)
+        start = self.last_seen - int(self.overlap * 1000)
+        oldest_allowed = now - int(self.max_active_age * DAY_MS)
+        for begin, cleared in self.known.values():
+            if not cleared and oldest_allowed <= begin < start:
+                start = begin
+        return start
+
+    def poll(self, cloud: SolisCloud, now: Optional[int] = None, **kwargs) -> tuple[list[SolisAlarm], list[SolisAlarm]]:
+        """Read the alarms since the cursor and advance it.
+
+        An alarm seen for the first time is new; an alarm that has cleared
+        since it was last seen (or was first seen already cleared) is cleared,
+        so a short-lived alarm shows up in both lists.
+
+        Args:
+            cloud (SolisCloud): Client to read alarms with
+            kwargs: Passed to ``SolisCloud.iter_alarms`` (e.g. ``stationId``)
+
+        Returns:
+            tuple[list, list]: new alarms and cleared alarms
+        """
+        now = int(time.time() * 1000) if now is None else now
+        with self._lock:
+            start = self.window_start(now)
+            begin_day = datetime.fromtimestamp(start / 1000, timezone.utc).date() - timedelta(days=1)
+            end_day = datetime.fromtimestamp(now / 1000, timezone.utc).date() + timedelta(days=1)
+            new, cleared = [], []
+            for alarm in cloud.iter_alarms(alarmBeginTime=begin_day, alarmEndTime=end_day, **kwargs):
+                key = alarm.key
+                begin = _millis(alarm.alarmBeginTime)
+                previous = self.known.get(key)
+                if previous is None and begin < start:
+                    # the API filters by whole days; older alarms were handled by earlier polls
+                    continue
+                if previous is None:
+                    new.append(alarm)
+                if alarm.cleared and (previous is None or not previous[1]):
+                    cleared.append(alarm)
+                self.known[key] = [begin, alarm.cleared]
+                self.last_seen = max(self.last_seen, begin)
+            self._prune(now)
+            if self.path:
+                self.save()
+        return new, cleared
+
+    def _prune(self, now: int):
+        # forget alarms the next window no longer covers
+        start = self.window_start(now)
+        self.known = {key: value for key, value in self.known.items() if value[0] >= start or (not value[1] and value[0] >= now - int(self.max_active_age * DAY_MS))}
+
+    def active(self) -> list[str]:
+        return [key for key, (_, cleared) in self.known.items() if not cleared]
+
+    def _to_json(self) -> dict:
+        return {"last_seen": self.last_seen, "known": self.known}
+
+    def save(self):
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as handle:
+            json.dump(self._to_json(), handle, separators=(',',':'))
+        os.replace(tmp, self.path)
+
+    def load(self) -> AlarmCursor:
+        with open(self.path) as handle:
+            data = json.load(handle)
+        self.last_seen = int(data.get("last_seen", 0) or 0)
+        self.known = {key: list(value) for key, value in (data.get("known", {}) or {}).items()}
+        return self
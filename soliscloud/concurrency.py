@@ -0,0 +1,80 @@
+from __future__ import annotations
+from typing import Optional
+import threading
+
+
+class AdaptiveConcurrency():
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 32, target_latency: float = 2.0, backoff: float = 0.5):
+        """AIMD concurrency limit.
+
+        Every successful request within ``target_latency`` adds ``1 / limit``
+        (so about one extra slot per round of requests); a rate-limited (429)
+        or slow request multiplies the limit by ``backoff``. At most one
+        decrease is applied per round so a burst of 429s from the same round
+        only halves the limit once.
+
+        Args:
+            initial (int): Starting concurrency
+            minimum (int): Lowest concurrency
+            maximum (int): Highest concurrency
+            target_latency (float): Latency in seconds above which a request counts as congestion
+            backoff (float): Factor applied to the limit on congestion
+        """
+        self.minimum: int = max(1, minimum)
+        self.maximum: int = max(self.minimum, maximum)
+        self.limit: float = float(min(max(initial, self.minimum), self.maximum))
+        self.target_latency: float = target_latency
+        self.backoff: float = backoff
+        self._lock = threading.Lock()
+        self._completed: int = 0
+        self._decreased_at: int = -self.maximum
+
+    @property
+    def current(self) -> int:
+        return int(self.limit)
+
+    def on_success(self, latency: float):
+        if latency > self.target_latency:
+            self.on_congestion()
+            return
+        with self._lock:
+            self._completed += 1
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+    def on_congestion(self):
+        with self._lock:
+            self._completed += 1
+            if self._completed - self._decreased_at < self.limit:
+                return
+            self._decreased_at = self._completed
+            self.limit = max(self.minimum, self.limit * self.backoff)
+
+    def on_error(self):
+        with self._lock:
+            self._completed += 1
+
+
+class RateLimitCounter():
+    _local = threading.local()
+
+    def __init__(self):
+        """Counts the 429 responses seen by the requests a thread makes while the counter is entered."""
+        self.count: int = 0
+        self._lock = threading.Lock()
+        self._previous: list = []
+
+    @classmethod
+    def current(cls) -> Optional[RateLimitCounter]:
+        return getattr(cls._local, "counter", None)
+
+    def add(self):
+        with self._lock:
+            self.count += 1
+
+    def __enter__(self) -> RateLimitCounter:
+        self._previous.append(self.current())
+        self._local.counter = self
+        return self
+
+    def __exit__(self, *args):
+        self._local.counter = self._previous.pop()
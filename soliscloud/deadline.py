@@ -0,0 +1,105 @@
+from __future__ import annotations
+from time import monotonic
+from typing import Callable, Optional
+import threading
+from soliscloud.exceptions import SolisTimeoutException
+
+_local = threading.local()
+
+
+def _stack() -> list:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def current_deadline() -> Optional[Deadline]:
+    """The deadline entered last on this thread, if any."""
+    stack = getattr(_local, "stack", None)
+    return stack[-1] if stack else None
+
+
+def propagate(fn: Callable) -> Callable:
+    """Wrap ``fn`` so that it runs under the current thread's deadline, e.g. in a worker thread."""
+    deadline = current_deadline()
+    if deadline is None:
+        return fn
+
+    def run(*args, **kwargs):
+        with deadline:
+            return fn(*args, **kwargs)
+    return run
+
+
+class Deadline():
+    def __init__(self, timeout: Optional[float] = None, clock: Callable[[], float] = monotonic):
+        """Time limit and cancellation token for a group of SolisCloud calls.
+
+        While entered with ``with``, the deadline bounds every request the
+        thread sends, including retries, backoff waits, further pages and the
+        worker threads SolisCloud starts for the call. ``cancel`` may be
+        called from any thread. Either way the call fails at its next
+        request or wait with ``SolisTimeoutException``. A deadline entered
+        inside another one never outlives it.
+
+        Args:
+            timeout (float): Seconds from now (default: no limit, cancellation only)
+            clock (Callable): Monotonic clock, replaceable in tests
+        """
+        self._clock = clock
+        self.expires: Optional[float] = None if timeout is None else clock() + timeout
+        self._cancelled: threading.Event = threading.Event()
+        self._parent: Optional[Deadline] = None
+
+    def __enter__(self) -> Deadline:
+        stack = _stack()
+        if stack and self._parent is None and stack[-1] is not self:
+            self._parent = stack[-1]
+        stack.append(self)
+        return self
+
+    def __exit__(self, *args):
+        _stack().pop()
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left, or None when there is no time limit."""
+        remaining = None if self.expires is None else max(0.0, self.expires - self._clock())
+        if self._parent is not None:
+            parent = self._parent.remaining()
+            if parent is not None and (remaining is None or parent < remaining):
+                remaining = parent
+        return remaining
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set() or (self._parent is not None and self._parent.cancelled)
+
+    @property
+    def expired(self) -> bool:
+        return self.cancelled or self.remaining() == 0.0
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def check(self):
+        """Raise ``SolisTimeoutException`` when the deadline has passed or was cancelled."""
+        if self.cancelled:
+            raise SolisTimeoutException("There was an error - the call was cancelled")
+        if self.remaining() == 0.0:
+            raise SolisTimeoutException("There was an error - the call ran past its deadline")
+
+    def sleep(self, seconds: float):
+        """Wait ``seconds``, failing at once if that would run past the deadline, or when cancelled."""
+        remaining = self.remaining()
+        if remaining is not None and seconds > remaining:
+            raise SolisTimeoutException(f"There was an error - waiting {seconds:g}s would run past the deadline")
+        self._cancelled.wait(seconds)
+        self.check()
+
+    def wait(self, event: threading.Event, interval: float = 0.05):
+        """Wait for ``event`` until the deadline; cancellation is noticed within ``interval`` seconds."""
+        while not event.is_set():
+            self.check()
+            remaining = self.remaining()
+            event.wait(interval if remaining is None else min(interval, remaining))
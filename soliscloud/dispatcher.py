@@ -0,0 +1,168 @@
+from __future__ import annotations
+from collections import OrderedDict, deque
+from typing import Callable, Optional
+import threading
+from soliscloud.deadline import current_deadline
+from soliscloud.endpoints import ENDPOINTS
+from soliscloud.exceptions import SolisTimeoutException
+
+# Priority classes, most urgent first
+PRIORITIES = ("control", "detail", "bulk")
+DEFAULT_LIMITS = {"control": 4, "detail": 8, "bulk": 4}
+
+
+def classify(url: str) -> str:
+    """Priority class of the endpoint ``url`` points at (``detail`` for unknown URIs)."""
+    path = url.split("://", 1)[-1]
+    slash = path.find("/")
+    endpoint = ENDPOINTS.get(path[slash:] if slash >= 0 else "")
+    return endpoint.priority if endpoint is not None else "detail"
+
+
+def _account(headers: Optional[dict]) -> str:
+    # the key id is the part of "API <key id>:<signature>" before the colon
+    authorization = (headers or {}).get("Authorization", "")
+    return authorization[4:].rpartition(":")[0]
+
+
+class _Ticket():
+    __slots__ = ("granted",)
+
+    def __init__(self):
+        self.granted: bool = False
+
+
+class PriorityDispatcher():
+    # SolisCloud hands its rate limiter to post() instead of taking the token itself
+    takes_rate_limiter: bool = True
+
+    def __init__(self, client=None, limits: Optional[dict[str, int]] = None, max_in_flight: int = 8, classify: Callable[[str], str] = classify):
+        """Orders the requests of one or more accounts in front of a shared session.
+
+        Every request belongs to a priority class (``control`` > ``detail`` >
+        ``bulk``, taken from its endpoint) and each class has its own
+        concurrency limit. ``detail`` and ``bulk`` requests also share
+        ``max_in_flight`` slots; a freed slot goes to the most urgent class
+        waiting, and within a class the accounts take turns, so one account's
+        sweep cannot hold back another's. ``control`` requests only wait for
+        their own class limit and so go out ahead of any queued reads.
+
+        Use it as the ``client`` of ``SolisCloud`` instances; retries and
+        backoff waits happen outside it and hold no slot. The client's rate
+        limit token is taken here, once a request has its slot, so queued
+        reads cannot hold a write back: ``control`` requests reserve their
+        token without waiting and the reads after them repay it.
+
+        Args:
+            client (RequestsSession): Session that sends the requests (default: a new one)
+            limits (dict[str, int]): Requests in flight per class, merged with ``DEFAULT_LIMITS``
+            max_in_flight (int): Requests in flight across the ``detail`` and ``bulk`` classes
+            classify (Callable): Maps a URL to its priority class
+        """
+        self._client = client
+        self.limits: dict[str, int] = dict(DEFAULT_LIMITS, **(limits or {}))
+        self.max_in_flight: int = max_in_flight
+        self.classify = classify
+        self._lock = threading.Condition()
+        self._active: dict[str, int] = {x: 0 for x in self.limits}
+        self._shared: int = 0
+        # per class, the queued tickets of each account in turn order
+        self._queues: dict[str, OrderedDict[str, deque]] = {x: OrderedDict() for x in self.limits}
+        self._order: list[str] = sorted(self.limits, key=lambda x: PRIORITIES.index(x) if x in PRIORITIES else len(PRIORITIES))
+
+    @property
+    def client(self):
+        if self._client is None:
+            from soliscloud.session import RequestsSession
+            self._client = RequestsSession()
+        return self._client
+
+    @property
+    def rate_limited(self) -> int:
+        return getattr(self.client, "rate_limited", 0)
+
+    def _can_start(self, priority: str) -> bool:
+        if self._active[priority] >= self.limits[priority]:
+            return False
+        return priority == "control" or self._shared < self.max_in_flight
+
+    def _grant(self):
+        granted = False
+        for priority in self._order:
+            queue = self._queues[priority]
+            while queue and self._can_start(priority):
+                account, tickets = queue.popitem(last=False)
+                tickets.popleft().granted = True
+                if tickets:
+                    # back of the line for this account's next request
+                    queue[account] = tickets
+                self._active[priority] += 1
+                self._shared += priority != "control"
+                granted = True
+        if granted:
+            self._lock.notify_all()
+
+    def _acquire(self, priority: str, account: str):
+        deadline = current_deadline()
+        ticket = _Ticket()
+        with self._lock:
+            self._queues[priority].setdefault(account, deque()).append(ticket)
+            self._grant()
+            try:
+                while not ticket.granted:
+                    if deadline is None:
+                        self._lock.wait()
+                    else:
+                        deadline.check()
+                        remaining = deadline.remaining()
+                        self._lock.wait(0.05 if remaining is None else min(0.05, remaining))
+            except BaseException:
+                if not ticket.granted:
+                    tickets = self._queues[priority].get(account)
+                    tickets.remove(ticket)
+                    if not tickets:
+                        del self._queues[priority][account]
+                    raise
+                self._release(priority)
+                raise
+
+    def _release(self, priority: str):
+        self._active[priority] -= 1
+        self._shared -= priority != "control"
+        self._grant()
+
+    def _take_token(self, priority: str, rate_limiter):
+        if rate_limiter is None:
+            return
+        reserve = getattr(rate_limiter, "reserve", None)
+        if priority == "control" and reserve is not None:
+            reserve()
+            return
+        deadline = current_deadline()
+        if not rate_limiter.acquire(timeout=None if deadline is None else deadline.remaining()):
+            raise SolisTimeoutException("There was an error - the rate limit leaves no time before the deadline")
+
+    def post(self, url: str, rate_limiter=None, **kwargs):
+        priority = self.classify(url)
+        if priority not in self.limits:
+            priority = "detail"
+        self._acquire(priority, _account(kwargs.get("headers")))
+        try:
+            # the slot is held while waiting for the token, so tokens go out in priority order too
+            self._take_token(priority, rate_limiter)
+            return self.client.post(url, **kwargs)
+        finally:
+            with self._lock:
+                self._release(priority)
+
+    def in_flight(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._active)
+
+    def waiting(self) -> dict[str, int]:
+        with self._lock:
+            return {priority: sum(len(x) for x in queue.values()) for priority, queue in self._queues.items()}
+
+    def close(self):
+        if self._client is not None:
+            self._client.close()
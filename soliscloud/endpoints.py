@@ -0,0 +1,135 @@
+from __future__ import annotations
+from importlib import import_module
+from typing import Callable, Iterable, Optional, Union
+from soliscloud.exceptions import SolisConnectException
+
+# A middleware is called with the request and the next handler in the chain
+# and returns the HTTP response, e.g. ``lambda request, call_next: call_next(request)``
+Middleware = Callable[["EndpointRequest", Callable], object]
+
+
+class Endpoint():
+    def __init__(self, uri: str, required: Iterable[str] = (), optional: Iterable[str] = (), formats: Optional[dict[str, str]] = None, defaults: Optional[dict] = None, model: Optional[Union[type, str]] = None, paginated: bool = False, status_key: Optional[str] = None, write: bool = False, check_success: bool = True, key: Optional[str] = None, priority: Optional[str] = None):
+        """Declarative description of one SolisCloud API endpoint.
+
+        Args:
+            uri (str): Path of the endpoint, e.g. ``/v1/api/inverterDetail``
+            required (Iterable[str]): Body fields that must be given
+            optional (Iterable[str]): Body fields sent only when they have a value
+            formats (dict[str, str]): ``strftime`` patterns for date fields
+            defaults (dict): Body fields sent unless overridden
+            model (type): Model class built from a detail response or from each listed record, or
+                its name in ``soliscloud.models`` so that the models load on first use
+            paginated (bool): The endpoint returns ``pageNo`` / ``pageSize`` pages of records
+            status_key (str): Key of the ``StatusVo`` summary in a listing response
+            write (bool): The call changes state, so it is never coalesced, cached or repeated
+            check_success (bool): Raise when the response's ``success`` flag is false
+            key (str): Record field identifying a listed item, used to drop duplicates when records shift between pages
+            priority (str): ``control``, ``detail`` or ``bulk`` (default: from ``write`` and ``paginated``)
+        """
+        self.uri: str = uri
+        self.required: tuple[str, ...] = tuple(required)
+        self.optional: tuple[str, ...] = tuple(optional) + (("pageNo", "pageSize") if paginated else ())
+        self.formats: dict[str, str] = formats or {}
+        self.defaults: dict = dict({"pageNo": 1, "pageSize": 100} if paginated else {}, **(defaults or {}))
+        self._model: Optional[Union[type, str]] = model
+        self.paginated: bool = paginated
+        self.status_key: Optional[str] = status_key
+        self.write: bool = write
+        self.check_success: bool = check_success
+        self.key: Optional[str] = key
+        self.priority: str = priority or ("control" if write else "bulk" if paginated else "detail")
+
+    def __repr__(self) -> str:
+        return f"Endpoint({self.uri!r})"
+
+    @property
+    def model(self) -> Optional[type]:
+        if isinstance(self._model, str):
+            self._model = getattr(import_module("soliscloud.models"), self._model)
+        return self._model
+
+    def build_body(self, params: dict, extra: Optional[dict] = None) -> dict:
+        """Build the request body from named parameters plus any extra fields passed through unchanged."""
+        body = dict(self.defaults)
+        for name in self.required:
+            value = params.get(name)
+            if value is None:
+                raise ValueError(f"{self.uri} needs {name}")
+            body[name] = self._format(name, value)
+        for name in self.optional:
+            value = params.get(name)
+            if value is not None and value != "":
+                body[name] = self._format(name, value)
+        if extra:
+            body.update(extra)
+        return body
+
+    def _format(self, name: str, value):
+        pattern = self.formats.get(name)
+        if pattern and hasattr(value, "strftime"):
+            return value.strftime(pattern)
+        return value
+
+    def unwrap(self, res, default=None):
+        """Check the HTTP status and ``success`` flag of a response and return its ``data``."""
+        if res.status_code != 200:
+            raise SolisConnectException(f"There was an error - {res.status_code} - {res.reason}")
+        res_json = res.json()
+        if self.check_success and not res_json.get('success', False):
+            raise SolisConnectException(f"There was an error - {res_json.get('msg', '')} - {res.status_code} - {res.reason}")
+        data = res_json.get('data')
+        return default if data is None else data
+
+
+class EndpointRequest():
+    def __init__(self, endpoint: Endpoint, body: dict):
+        self.endpoint: Endpoint = endpoint
+        self.body: dict = body
+        # free-form values middleware can use to pass data down the chain
+        self.attrs: dict = {}
+
+    @property
+    def uri(self) -> str:
+        return self.endpoint.uri
+
+    def __repr__(self) -> str:
+        return f"EndpointRequest({self.endpoint.uri!r}, {self.body!r})"
+
+
+def build_pipeline(middleware: Iterable[Middleware], handler: Callable[[EndpointRequest], object]) -> Callable[[EndpointRequest], object]:
+    """Compose ``middleware`` (outermost first) around ``handler`` into a single callable."""
+    for layer in reversed(list(middleware)):
+        handler = (lambda layer, call_next: lambda request: layer(request, call_next))(layer, handler)
+    return handler
+
+
+STATION_LIST = Endpoint("/v1/api/userStationList", optional=("nmiCode",), model="SolisStation", paginated=True, status_key="stationStatusVo", key="id")
+STATION_DETAIL = Endpoint("/v1/api/stationDetail", required=("id",), optional=("nmiCode",), model="SolisStation")
+STATION_DAY = Endpoint("/v1/api/stationDay", required=("id", "time", "timeZone"), optional=("money",), formats={"time": "%Y-%m-%d"}, priority="bulk")
+STATION_MONTH = Endpoint("/v1/api/stationMonth", required=("id", "month", "timeZone"), optional=("money",), formats={"month": "%Y-%m"}, priority="bulk")
+STATION_YEAR = Endpoint("/v1/api/stationYear", required=("id", "year", "timeZone"), optional=("money",), formats={"year": "%Y"}, priority="bulk")
+
+EPM_LIST = Endpoint("/v1/api/epmList", optional=("stationId", "nmiCode"), model="SolisEPM", paginated=True, status_key="epmStatusVo", key="sn")
+EPM_DETAIL = Endpoint("/v1/api/epmDetail", required=("sn",), model="SolisEPM")
+EPM_DAY = Endpoint("/v1/api/epm/day", required=("sn", "time", "timeZone", "searchinfo"), formats={"time": "%Y-%m-%d"}, priority="bulk")
+EPM_MONTH = Endpoint("/v1/api/epm/month", required=("sn", "month"), formats={"month": "%Y-%m"}, priority="bulk")
+EPM_YEAR = Endpoint("/v1/api/epm/year", required=("sn", "year"), formats={"year": "%Y"}, priority="bulk")
+
+COLLECTOR_LIST = Endpoint("/v1/api/collectorList", optional=("stationId", "nmiCode"), model="SolisCollector", paginated=True, status_key="collectorStatusVo", key="sn")
+ALARM_LIST = Endpoint(
+    "/v1/api/alarmList", optional=("stationId", "alarmDeviceSn", "alarmBeginTime", "alarmEndTime", "nmiCode"),
+    formats={"alarmBeginTime": "%Y-%m-%d", "alarmEndTime": "%Y-%m-%d"}, model="SolisAlarm", paginated=True, key="id"
+)
+
+INVERTER_LIST = Endpoint("/v1/api/inverterList", optional=("stationId", "nmiCode"), model="SolisInverter", paginated=True, status_key="inverterStatusVo", key="sn")
+INVERTER_DETAIL = Endpoint("/v1/api/inverterDetail", required=("id", "sn"), model="SolisInverter")
+INVERTER_DAY = Endpoint("/v1/api/inverterDay", required=("id", "sn", "time", "timeZone"), optional=("money",), formats={"time": "%Y-%m-%d"}, priority="bulk")
+INVERTER_MONTH = Endpoint("/v1/api/inverterMonth", required=("id", "sn", "month", "timeZone"), optional=("money",), formats={"month": "%Y-%m"}, priority="bulk")
+INVERTER_YEAR = Endpoint("/v1/api/inverterYear", required=("id", "sn", "year", "timeZone"), optional=("money",), formats={"year": "%Y"}, priority="bulk")
+
+CONTROL = Endpoint("/v2/api/control", required=("inverterSn", "inverterId", "cid", "value"), write=True, check_success=False)
+AT_READ = Endpoint("/v2/api/atRead", required=("inverterSn", "cid"), check_success=False)
+
+# every endpoint above by URI
+ENDPOINTS: dict[str, Endpoint] = {x.uri: x for x in list(globals().values()) if isinstance(x, Endpoint)}
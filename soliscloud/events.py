@@ -0,0 +1,176 @@
+from __future__ import annotations
+from typing import Callable, Iterable, Optional
+import threading
+import time
+from soliscloud.fleet import STATE_ALARM, STATE_OFFLINE, STATE_ONLINE
+from soliscloud.models import StatusVo
+
+WENT_OFFLINE = "went_offline"
+CAME_ONLINE = "came_online"
+FAULT_RAISED = "fault_raised"
+FAULT_CLEARED = "fault_cleared"
+ALARM_COUNT_CHANGED = "alarm_count_changed"
+POWER_BELOW_THRESHOLD = "power_below_threshold"
+POWER_RECOVERED = "power_recovered"
+STATUS_CHANGED = "status_changed"
+
+
+def _get(item, key: str):
+    return item.get(key) if isinstance(item, dict) else getattr(item, key, None)
+
+
+def _flag(value) -> bool:
+    try:
+        return bool(int(value))
+    except (TypeError, ValueError):
+        return bool(value)
+
+
+def _number(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class ChangeEvent():
+    def __init__(self, kind: str, source: str, key: str, previous=None, current=None, record=None):
+        self.kind: str = kind
+        self.source: str = source
+        self.key: str = key
+        self.previous = previous
+        self.current = current
+        self.record = record
+        self.timestamp: float = time.time()
+
+    def __repr__(self) -> str:
+        return f"ChangeEvent({self.kind!r}, {self.source!r}, {self.key!r}, {self.previous!r} -> {self.current!r})"
+
+    def _to_json(self) -> dict:
+        return {key: value for key, value in self.__dict__.items() if not key.startswith("_") and key != "record"}
+
+
+class EventStream():
+    def __init__(self, power_threshold: Optional[float] = None, power_field: str = "pac"):
+        """Turns successive inverter, station and status polls into typed events.
+
+        Each record is reduced to a small fingerprint of the watched fields
+        (state, fault flags, alarm count, whether power is below the
+        threshold); records whose fingerprint did not change since the last
+        poll are skipped without further work. The first poll of a record
+        only sets its baseline.
+
+        Args:
+            power_threshold (float): Emit power events when an online inverter's power crosses this value
+            power_field (str): Inverter attribute holding its power
+        """
+        self.power_threshold: Optional[float] = power_threshold
+        self.power_field: str = power_field
+        self._callbacks: list[Callable[[ChangeEvent], None]] = []
+        self._lock = threading.Lock()
+        self._inverters: dict[str, tuple] = {}
+        self._stations: dict[str, tuple] = {}
+        self._status: dict[str, dict] = {}
+
+    def subscribe(self, callback: Callable[[ChangeEvent], None]) -> Callable[[ChangeEvent], None]:
+        with self._lock:
+            self._callbacks.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: Callable[[ChangeEvent], None]):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def asyncio_queue(self, loop=None, maxsize: int = 0):
+        """Return an ``asyncio.Queue`` that receives every event.
+
+        Polls may run in any thread; events are handed to the queue on
+        ``loop`` (default: the running loop) with ``call_soon_threadsafe``.
+        """
+        import asyncio
+        loop = loop or asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize)
+        self.subscribe(lambda event: loop.call_soon_threadsafe(queue.put_nowait, event))
+        return queue
+
+    def _emit(self, events: list[ChangeEvent]) -> list[ChangeEvent]:
+        if events:
+            with self._lock:
+                callbacks = list(self._callbacks)
+            for event in events:
+                for callback in callbacks:
+                    callback(event)
+        return events
+
+    def _inverter_fingerprint(self, inverter) -> tuple:
+        state = _get(inverter, "state")
+        fault = state == STATE_ALARM or _flag(_get(inverter, "stateExceptionFlag")) or _flag(_get(inverter, "alarmState"))
+        below = False
+        if self.power_threshold is not None and state == STATE_ONLINE:
+            power = _number(_get(inverter, self.power_field))
+            below = power is not None and power < self.power_threshold
+        return state, fault, below
+
+    def _transitions(self, source: str, key: str, previous: tuple, current: tuple, record) -> list[ChangeEvent]:
+        events = []
+        if previous[0] != current[0]:
+            if current[0] == STATE_OFFLINE:
+                events.append(ChangeEvent(WENT_OFFLINE, source, key, previous[0], current[0], record))
+            elif previous[0] == STATE_OFFLINE:
+                events.append(ChangeEvent(CAME_ONLINE, source, key, previous[0], current[0], record))
+        if previous[1] != current[1]:
+            events.append(ChangeEvent(FAULT_RAISED if current[1] else FAULT_CLEARED, source, key, previous[1], current[1], record))
+        return events
+
+    def process_inverters(self, inverters: Iterable) -> list[ChangeEvent]:
+        """Compare an inverter poll (``SolisInverter`` objects or records) with the previous one."""
+        events = []
+        for inverter in inverters:
+            sn = _get(inverter, "sn")
+            current = self._inverter_fingerprint(inverter)
+            previous = self._inverters.get(sn)
+            self._inverters[sn] = current
+            if previous is None or previous == current:
+                continue
+            events.extend(self._transitions("inverter", sn, previous, current, inverter))
+            if previous[2] != current[2]:
+                kind = POWER_BELOW_THRESHOLD if current[2] else POWER_RECOVERED
+                events.append(ChangeEvent(kind, "inverter", sn, previous[2], _get(inverter, self.power_field), inverter))
+        return self._emit(events)
+
+    def process_stations(self, stations: Iterable) -> list[ChangeEvent]:
+        """Compare a station poll (``SolisStation`` objects or records) with the previous one."""
+        events = []
+        for station in stations:
+            id = _get(station, "id")
+            state = _get(station, "state")
+            alarm_count = _get(station, "alarmCount") or 0
+            current = (state, state == STATE_ALARM, alarm_count)
+            previous = self._stations.get(id)
+            self._stations[id] = current
+            if previous is None or previous == current:
+                continue
+            events.extend(self._transitions("station", id, previous, current, station))
+            if previous[2] != current[2]:
+                events.append(ChangeEvent(ALARM_COUNT_CHANGED, "station", id, previous[2], current[2], station))
+        return self._emit(events)
+
+    def process_status(self, name: str, status: StatusVo) -> list[ChangeEvent]:
+        """Compare a ``StatusVo`` summary (e.g. ``inverters``, ``stations``) with the previous one."""
+        current = status._to_json()
+        previous = self._status.get(name)
+        self._status[name] = current
+        if previous is None or previous == current:
+            return []
+        changed = {key for key in current if previous.get(key) != current[key]}
+        event = ChangeEvent(
+            STATUS_CHANGED, "status", name,
+            {key: previous.get(key) for key in changed}, {key: current[key] for key in changed}, status
+        )
+        return self._emit([event])
+
+    def forget(self, key: str):
+        self._inverters.pop(key, None)
+        self._stations.pop(key, None)
+        self._status.pop(key, None)
@@ -0,0 +1,9 @@
+class SolisConnectException(Exception):
+    def __init__(self, *args, partial=None):
+        super().__init__(*args)
+        # what a listing fetched before it failed, when it can be kept
+        self.partial = partial
+
+
+class SolisTimeoutException(SolisConnectException):
+    """Raised when a call runs past its deadline or is cancelled."""
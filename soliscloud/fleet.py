@@ -0,0 +1,160 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+from soliscloud.models import SolisInverter
+
+if TYPE_CHECKING:
+    from soliscloud.soliscloud import SolisCloud
+
+INDEXED_FIELDS = ("stationId", "collectorsn", "state", "model")
+
+STATE_ONLINE = 1
+STATE_OFFLINE = 2
+STATE_ALARM = 3
+
+
+def _get(item, key: str):
+    return item.get(key) if isinstance(item, dict) else getattr(item, key, None)
+
+
+class FleetIndex():
+    def __init__(self, indexed_fields: Iterable[str] = INDEXED_FIELDS):
+        """In-memory index of a fleet of inverters.
+
+        Inverters are held by ``sn`` and ``id`` with secondary indexes (value ->
+        set of serial numbers) on ``indexed_fields``. ``update`` only touches
+        the index entries of inverters whose indexed values changed.
+
+        Args:
+            indexed_fields (Iterable[str]): Inverter attributes to build secondary indexes for
+        """
+        self.indexed_fields: tuple[str, ...] = tuple(indexed_fields)
+        self.by_sn: dict[str, SolisInverter] = {}
+        self.by_id: dict[str, SolisInverter] = {}
+        self._indexes: dict[str, dict[object, set[str]]] = {x: {} for x in self.indexed_fields}
+        self._keys: dict[str, tuple] = {}
+
+    @classmethod
+    def from_cloud(cls, cloud: SolisCloud, indexed_fields: Iterable[str] = INDEXED_FIELDS, **kwargs) -> FleetIndex:
+        index = cls(indexed_fields)
+        index.refresh(cloud, **kwargs)
+        return index
+
+    def refresh(self, cloud: SolisCloud, **kwargs) -> tuple[set[str], set[str], set[str]]:
+        """Re-list all inverters and apply the listing as a complete snapshot."""
+        _, inverters = cloud.list_inverters(**kwargs)
+        return self.update(inverters, complete=True)
+
+    def _unindex(self, sn: str, keys: tuple):
+        for field, value in zip(self.indexed_fields, keys):
+            members = self._indexes[field].get(value)
+            if members is not None:
+                members.discard(sn)
+                if not members:
+                    del self._indexes[field][value]
+
+    def _index(self, sn: str, keys: tuple):
+        for field, value in zip(self.indexed_fields, keys):
+            self._indexes[field].setdefault(value, set()).add(sn)
+
+    def add(self, inverter) -> bool:
+        """Add or replace one inverter; returns True if any indexed value changed."""
+        sn = _get(inverter, "sn")
+        keys = tuple(_get(inverter, x) for x in self.indexed_fields)
+        previous = self.by_sn.get(sn)
+        if previous is not None:
+            previous_id = _get(previous, "id")
+            if previous_id != _get(inverter, "id"):
+                self.by_id.pop(previous_id, None)
+        self.by_sn[sn] = inverter
+        self.by_id[_get(inverter, "id")] = inverter
+        old_keys = self._keys.get(sn)
+        if old_keys == keys:
+            return False
+        if old_keys is not None:
+            self._unindex(sn, old_keys)
+        self._index(sn, keys)
+        self._keys[sn] = keys
+        return True
+
+    def remove(self, sn: str) -> Optional[SolisInverter]:
+        inverter = self.by_sn.pop(sn, None)
+        if inverter is not None:
+            self.by_id.pop(_get(inverter, "id"), None)
+            self._unindex(sn, self._keys.pop(sn))
+        return inverter
+
+    def update(self, inverters: Iterable, complete: bool = False) -> tuple[set[str], set[str], set[str]]:
+        """Apply a poll result to the index.
+
+        Args:
+            inverters (Iterable): ``SolisInverter`` objects or inverter records
+            complete (bool): The poll lists the whole fleet, so inverters missing from it are removed
+
+        Returns:
+            tuple[set, set, set]: serial numbers added, re-indexed and removed
+        """
+        added, changed, seen = set(), set(), set()
+        for inverter in inverters:
+            sn = _get(inverter, "sn")
+            seen.add(sn)
+            is_new = sn not in self.by_sn
+            if self.add(inverter):
+                (added if is_new else changed).add(sn)
+        removed = set()
+        if complete:
+            removed = set(self.by_sn) - seen
+            for sn in removed:
+                self.remove(sn)
+        return added, changed, removed
+
+    def get(self, sn: str) -> Optional[SolisInverter]:
+        return self.by_sn.get(sn)
+
+    def get_by_id(self, id: str) -> Optional[SolisInverter]:
+        return self.by_id.get(id)
+
+    def serials(self, **filters) -> set[str]:
+        """Serial numbers matching every ``field=value`` filter (indexed fields only); a list value matches any of its items."""
+        result = None
+        candidates = []
+        for field, value in filters.items():
+            if field not in self._indexes:
+                raise KeyError(f"{field} is not an indexed field")
+            index = self._indexes[field]
+            if isinstance(value, (list, tuple, set, frozenset)):
+                members = set().union(*[index.get(x, set()) for x in value])
+            else:
+                members = index.get(value, set())
+            candidates.append(members)
+        for members in sorted(candidates, key=len):
+            result = set(members) if result is None else result & members
+            if not result:
+                break
+        return set(self.by_sn) if result is None else result
+
+    def query(self, **filters) -> list[SolisInverter]:
+        return [self.by_sn[x] for x in self.serials(**filters)]
+
+    def station(self, stationId: str) -> list[SolisInverter]:
+        return self.query(stationId=stationId)
+
+    def collector(self, collectorsn: str) -> list[SolisInverter]:
+        return self.query(collectorsn=collectorsn)
+
+    def offline(self) -> list[SolisInverter]:
+        return self.query(state=STATE_OFFLINE)
+
+    def faulted(self) -> list[SolisInverter]:
+        return self.query(state=STATE_ALARM)
+
+    def counts(self, field: str) -> dict[object, int]:
+        return {value: len(members) for value, members in self._indexes[field].items()}
+
+    def __len__(self) -> int:
+        return len(self.by_sn)
+
+    def __contains__(self, sn: str) -> bool:
+        return sn in self.by_sn
+
+    def __iter__(self) -> Iterator[SolisInverter]:
+        return iter(self.by_sn.values())
@@ -0,0 +1,262 @@
+from __future__ import annotations
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from time import monotonic
+from typing import Callable, Iterable, Optional
+import json
+import threading
+from soliscloud.endpoints import EndpointRequest
+from soliscloud.ratelimit import RateLimiter
+
+
+class ResponseCache():
+    def __init__(self, ttl: float = 60.0, uris: Optional[Iterable[str]] = None, clock: Callable[[], float] = monotonic, max_entries: int = 1024):
+        """Middleware that reuses successful read responses for ``ttl`` seconds.
+
+        Only responses the endpoint would accept (HTTP 200 and, where the
+        endpoint checks it, a true ``success`` flag) are kept. Expired entries
+        are pruned as new ones are written, and past ``max_entries`` the least
+        recently used entry is evicted.
+
+        Args:
+            ttl (float): Seconds a response stays valid
+            uris (Iterable[str]): Only cache these endpoints (default: every read endpoint)
+            clock (Callable): Monotonic clock, replaceable in tests
+            max_entries (int): Most responses kept at once
+        """
+        self.ttl: float = ttl
+        self.uris: Optional[frozenset[str]] = frozenset(uris) if uris is not None else None
+        self.max_entries: int = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        # least recently used first
+        self._entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self.hits: int = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @staticmethod
+    def _cacheable(request: EndpointRequest, res) -> bool:
+        if res.status_code != 200:
+            return False
+        if not request.endpoint.check_success:
+            return True
+        try:
+            return bool(res.json().get("success", False))
+        except (AttributeError, ValueError):
+            return False
+
+    def __call__(self, request: EndpointRequest, call_next):
+        if request.endpoint.write or (self.uris is not None and request.uri not in self.uris):
+            return call_next(request)
+        key = f"{request.uri}\n{json.dumps(request.body, sort_keys=True, separators=(',',':'))}"
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+        res = call_next(request)
+        if self._cacheable(request, res):
+            with self._lock:
+                self._entries[key] = (now + self.ttl, res)
+                self._entries.move_to_end(key)
+                self._prune(now)
+        return res
+
+    def _prune(self, now: float):
+        entries = self._entries
+        while entries:
+            key, (expires, _) = next(iter(entries.items()))
+            if expires > now and len(entries) <= self.max_entries:
+                break
+            del entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class EndpointStats():
+    def __init__(self):
+        self.requests: int = 0
+        self.errors: int = 0
+        self.total_time: float = 0.0
+        self.max_time: float = 0.0
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.requests if self.requests else 0.0
+
+    def _to_json(self) -> dict:
+        return dict(self.__dict__, mean_time=self.mean_time)
+
+
+class RequestMetrics():
+    def __init__(self, clock: Callable[[], float] = monotonic):
+        """Middleware counting requests, errors (exceptions or non-200 responses) and latency per endpoint.
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.endpoints: dict[str, EndpointStats] = {}
+
+    def __call__(self, request: EndpointRequest, call_next):
+        started = self._clock()
+        failed = True
+        try:
+            res = call_next(request)
+            failed = res.status_code != 200
+            return res
+        finally:
+            elapsed = self._clock() - started
+            with self._lock:
+                stats = self.endpoints.get(request.uri)
+                if stats is None:
+                    stats = self.endpoints[request.uri] = EndpointStats()
+                stats.requests += 1
+                stats.errors += failed
+                stats.total_time += elapsed
+                stats.max_time = max(stats.max_time, elapsed)
+
+    def _to_json(self) -> dict:
+        with self._lock:
+            return {uri: stats._to_json() for uri, stats in self.endpoints.items()}
+
+
+class _Latencies():
+    def __init__(self, size: int):
+        self.samples: deque = deque(maxlen=size)
+        self.delay: Optional[float] = None
+        self.pending: int = 0
+
+
+class HedgedRequests():
+    def __init__(self, rate: float, budget: float = 0.05, percentile: float = 0.95, min_delay: float = 0.05, max_delay: float = 10.0, min_samples: int = 20, window: int = 200, uris: Optional[Iterable[str]] = None, max_workers: int = 16, clock: Callable[[], float] = monotonic):
+        """Middleware that hedges slow read requests.
+
+        When a read has not answered within the ``percentile`` latency of its
+        endpoint's last ``window`` calls, the same request is sent again and
+        whichever response arrives first is returned. Hedges are drawn from a
+        token bucket refilled at ``budget * rate`` per second, so they never
+        use more than that share of the account's rate limit. Writes are
+        never hedged, and endpoints with fewer than ``min_samples`` timed
+        calls are not hedged yet. The wait before hedging starts once the
+        first request is sent; only the hedges run on the ``max_workers``
+        threads, so they never cap how many reads are in flight.
+
+        Args:
+            rate (float): Requests per second allowed for the account
+            budget (float): Fraction of ``rate`` that hedges may use
+            percentile (float): Latency percentile after which a request is hedged
+            min_delay (float): Shortest wait before hedging, in seconds
+            max_delay (float): Longest wait before hedging, in seconds
+            min_samples (int): Timed calls an endpoint needs before it is hedged
+            window (int): Latest calls per endpoint the percentile is taken over
+            uris (Iterable[str]): Only hedge these endpoints (default: every read endpoint)
+            max_workers (int): Threads sending hedges
+            clock (Callable): Monotonic clock, replaceable in tests
+        """
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        self.percentile: float = percentile
+        self.min_delay: float = min_delay
+        self.max_delay: float = max_delay
+        self.min_samples: int = max(1, min_samples)
+        self.window: int = window
+        self.uris: Optional[frozenset[str]] = frozenset(uris) if uris is not None else None
+        self.max_workers: int = max_workers
+        self._budget: RateLimiter = RateLimiter(rate * budget)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._latencies: dict[str, _Latencies] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.hedges: int = 0
+        self.hedge_wins: int = 0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="soliscloud-hedge")
+            return self._executor
+
+    def delay(self, uri: str) -> Optional[float]:
+        """Seconds to wait before hedging a call to ``uri``, or None while there are too few samples."""
+        with self._lock:
+            latencies = self._latencies.get(uri)
+            return None if latencies is None else latencies.delay
+
+    def _record(self, uri: str, elapsed: float):
+        with self._lock:
+            latencies = self._latencies.get(uri)
+            if latencies is None:
+                latencies = self._latencies[uri] = _Latencies(self.window)
+            latencies.samples.append(elapsed)
+            latencies.pending += 1
+            size = len(latencies.samples)
+            # re-sort the window every few samples rather than on every call
+            if size >= self.min_samples and (latencies.delay is None or latencies.pending >= 8):
+                latencies.pending = 0
+                value = sorted(latencies.samples)[min(size - 1, int(self.percentile * size))]
+                latencies.delay = min(self.max_delay, max(self.min_delay, value))
+
+    def _timed(self, call_next, request: EndpointRequest, started: Optional[threading.Event] = None):
+        if started is not None:
+            started.set()
+        began = self._clock()
+        res = call_next(request)
+        self._record(request.uri, self._clock() - began)
+        return res
+
+    def _spawn(self, call_next, request: EndpointRequest) -> tuple[Future, threading.Event]:
+        # every primary gets its own thread, so reads are never queued behind
+        # each other; only the (budgeted) hedges share the executor
+        future, started = Future(), threading.Event()
+
+        def run():
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(self._timed(call_next, request, started))
+                except BaseException as err:
+                    future.set_exception(err)
+        threading.Thread(target=run, name="soliscloud-primary", daemon=True).start()
+        return future, started
+
+    def __call__(self, request: EndpointRequest, call_next):
+        if request.endpoint.write or (self.uris is not None and request.uri not in self.uris):
+            return call_next(request)
+        delay = self.delay(request.uri)
+        if delay is None:
+            return self._timed(call_next, request)
+        primary, started = self._spawn(call_next, request)
+        # the hedge delay counts from when the primary is actually sent
+        started.wait()
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._budget.try_acquire():
+            return primary.result()
+        hedged = EndpointRequest(request.endpoint, request.body)
+        # an identical request would otherwise join the one in flight
+        hedged.attrs = dict(request.attrs, hedge=True)
+        hedge = self.executor.submit(self._timed, call_next, hedged)
+        with self._lock:
+            self.hedges += 1
+        done, _ = wait([primary, hedge], return_when=FIRST_COMPLETED)
+        winner = primary if primary in done else hedge
+        if winner.exception() is not None:
+            # fall back to the other request; when both fail, raise the original's error
+            winner = hedge if winner is primary else primary
+            if winner.exception() is not None:
+                return primary.result()
+        if winner is hedge:
+            with self._lock:
+                self.hedge_wins += 1
+        return winner.result()
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=False)
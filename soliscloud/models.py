@@ -0,0 +1,1645 @@
+from __future__ import annotations
+from array import array
+from datetime import datetime, time, date, timedelta, timezone
+from typing import TYPE_CHECKING, Optional, Literal
+
+if TYPE_CHECKING:
+    from soliscloud.soliscloud import SolisCloud
+
+
+EPMFields = Literal["u_ac1","u_ac2","u_ac3","i_ac1","i_ac2","i_ac3","p_ac1","p_ac2","p_ac3","power_factor","fac_meter","p_load","e_total_inverter","e_total_load","e_total_buy","e_total_sell"]
+
+def _update_fields(obj, json_data: dict) -> set[str]:
+    changed = set()
+    if json_data:
+        for key, value in json_data.items():
+            if hasattr(obj, key) and not key.startswith("_"):
+                current = getattr(obj, key)
+                if current != value or type(current) is not type(value):
+                    setattr(obj, key, value)
+                    changed.add(key)
+    return changed
+
+
+class StatusVo():
+    def __init__(self):
+        self.all: int = 0
+        self.normal: int = 0
+        self.fault: int = 0
+        self.offline: int = 0
+        self.building: int = 0
+        self.mppt: int = 0
+    
+    def _from_json(self, json_data) -> StatusVo:
+        if json_data:
+            for key, value in json_data.items():
+                if hasattr(self, key):
+                    setattr(self, key, value)
+        return self
+    
+    def _to_json(self) -> dict:
+        return {key: value for key, value in self.__dict__.items() if not key.startswith("_")}
+
+
+class SolisStation():
+    def __init__(self, __parent__: SolisCloud = None):
+        self.__parent__: SolisCloud = __parent__
+        self.inverters: Optional[list[SolisInverter]] = None
+        self.accessTime: int = 0
+        self.accessTimeStr: str = ""
+        self.addrOrigin: str = ""
+        self.alarmCount: int = 0
+        self.alarmLongStr: str = ""
+        self.allEnergy: float = 0.0
+        self.allEnergy1: float = 0.0
+        self.allEnergyStr: str = ""
+        self.allIncome: float = 0.0
+        self.azimuth: float = 0.0
+        self.batteryTodayChargeEnergy: float = 0.0
+        self.batteryTodayDischargeEnergy: float = 0.0
+        self.batteryTotalChargeEnergy: float = 0.0
+        self.batteryTotalDischargeEnergy: float = 0.0
+        self.capacity: float = 0.0
+        self.capacity1: float = 0.0
+        self.capacityPercent: float = 0.0
+        self.capacityStr: str = ""
+        self.chargerCount: int = 0
+        self.city: str = ""
+        self.cityStr: str = ""
+        self.condCodeD: str = ""
+        self.condTxtD: str = ""
+        self.connectTime: int = 0
+        self.connectTimeStr: str = ""
+        self.country: str = ""
+        self.countryStr: str = ""
+        self.createDate: int = 0
+        self.createDateStr: str = ""
+        self.dataTimestamp: str = ""
+        self.dataTimestampStr: str = ""
+        self.dayEnergy: float = 0.0
+        self.dayEnergy1: float = 0.0
+        self.dayEnergyStr: str = ""
+        self.dayIncome: float = 0.0
+        self.dayPowerGeneration: float = 0.0
+        self.daylight: int = 0
+        self.dcInputType: int = 0
+        self.dip: float = 0.0
+        self.epmCount: int = 0
+        self.epmType: int = 0
+        self.fisGenerateTime: int = 0
+        self.fisGenerateTimeStr: str = ""
+        self.fisPowerTime: int = 0
+        self.fisPowerTimeStr: str = ""
+        self.fullHour: float = 0.0
+        self.gridPurchasedTodayEnergy: float = 0.0
+        self.gridPurchasedTotalEnergy: float = 0.0
+        self.gridSellTodayEnergy: float = 0.0
+        self.gridSellTotalEnergy: float = 0.0
+        self.gridSwitch: int = 0
+        self.gridSwitch1: int = 0
+        self.groupId: str = ""
+        self.homeLoadTodayEnergy: float = 0.0
+        self.homeLoadTotalEnergy: float = 0.0
+        self.id: str = ""
+        self.installer: str = ""
+        self.inverterCount: int = 0
+        self.inverterOnlineCount: int = 0
+        self.inverterStateOrder: int = 0
+        self.jxbType: int = 0
+        self.module: str = ""
+        self.money: str = ""
+        self.monthCarbonDioxide: float = 0.0
+        self.monthEnergy: float = 0.0
+        self.monthEnergy1: float = 0.0
+        self.monthEnergyStr: str = ""
+        self.oneSelf: float = 0.0
+        self.oneSelfTotal: float = 0.0
+        self.pic1Url: str = ""
+        self.picName: str = ""
+        self.power: float = 0.0
+        self.power1: float = 0.0
+        self.powerStr: str = ""
+        self.price: float = 0.0
+        self.region: str = ""
+        self.regionStr: str = ""
+        self.shareProcess: int = 0
+        self.simFlowState: int = 0
+        self.sno: str = ""
+        self.state: int = 0
+        self.stationName: str = ""
+        self.stationTypeNew: int = 0
+        self.synchronizationType: int = 0
+        self.timeZone: float = 0.0
+        self.timeZoneId: str = ""
+        self.timeZoneName: str = ""
+        self.timeZoneStr: str = ""
+        self.type: int = 0
+        self.updateDate: int = 0
+        self.userId: str = ""
+        self.yearEnergy: float = 0.0
+        self.yearEnergy1: float = 0.0
+        self.yearEnergyStr: str = ""
+
+    def _from_json(self, json_data) -> SolisStation:
+        for key, value in json_data.items():
+            if hasattr(self, key):
+                setattr(self, key, value)
+        return self
+    
+    def _to_json(self) -> dict:
+        return {key: value for key, value in self.__dict__.items() if not key.startswith("_")}
+    
+    def _update_from_json(self, json_data) -> set[str]:
+        return _update_fields(self, json_data)
+
+    def refresh(self) -> set[str]:
+        """Re-read the station detail and update this object in place; returns the changed fields."""
+        if self.__parent__:
+            return self._update_from_json(self.__parent__.get_station_detail_data(self.id))
+        return set()
+
+    def list_inverters(self) -> list[SolisInverter]:
+        if self.__parent__:
+            _, self.inverters = self.__parent__.list_inverters(stationId=self.id)
+            return self.inverters
+
+    def refresh_inverters(self) -> dict[str, set[str]]:
+        """Update this station's known inverters in place (listing them first if needed)."""
+        if self.__parent__:
+            if self.inverters is None:
+                self.list_inverters()
+                return {}
+            return self.__parent__.refresh_inverters(self.inverters)
+        return {}
+
+
+def epm_timezone(value) -> timezone:
+    """Return a fixed-offset timezone for a SolisCloud ``timeZone`` value (hours)."""
+    try:
+        hours = float(value)
+    except (TypeError, ValueError):
+        return timezone.utc
+    if not -24 < hours < 24:
+        return timezone.utc
+    return timezone(timedelta(hours=hours))
+
+
+def parse_epoch_millis(values: list) -> tuple[array, list[tuple[int, object, str]]]:
+    """Convert a list of epoch-millisecond timestamps in one pass.
+
+    Returns:
+        tuple[array, list]: the parsed timestamps (``array('q')``) for the
+        valid rows in order, and ``(index, value, reason)`` for each row that
+        could not be parsed.
+    """
+    try:
+        return array('q', map(int, values)), []
+    except (TypeError, ValueError, OverflowError):
+        pass
+    parsed = array('q')
+    dropped = []
+    for index, value in enumerate(values):
+        try:
+            parsed.append(int(value))
+        except (TypeError, ValueError, OverflowError) as err:
+            dropped.append((index, value, str(err)))
+    return parsed, dropped
+
+
+def epoch_millis_to_datetimes(values, tz: timezone = timezone.utc) -> list[datetime]:
+    fromtimestamp = datetime.fromtimestamp
+    return [fromtimestamp(x / 1000, tz) for x in values]
+
+
+class EPMDataDayItem():
+    def __init__(self):
+        self.alarm_count: int = 0
+        self.current_state: int = 0
+        self.datetime: datetime
+        self.e_total_buy: float = 0.0
+        self.e_total_inverter: float = 0.0
+        self.e_total_load: float = 0.0
+        self.e_total_sell: float = 0.0
+        self.fac_meter: float = 0.0
+        self.fault_bit: int = 0
+        self.i_ac1: float = 0.0
+        self.i_ac2: float = 0.0
+        self.i_ac3: float = 0.0
+        self.is_relatime: float = 0.0
+        self.p_ac1: float = 0.0
+        self.p_ac2: float = 0.0
+        self.p_ac3: float = 0.0
+        self.p_load: float = 0.0
+        self.power_factor: int = 0
+        self.u_ac1: float = 0.0
+        self.u_ac2: float = 0.0
+        self.u_ac3: float = 0.0
+        self.state: int = 0
+    
+    def _to_json_(self) -> dict:
+        json_obj = {}
+        for k, v in sorted(self.__dict__.items()):
+            if not k.startswith("_"):
+                json_obj[k] = v
+        return json_obj
+    
+    def _from_json_(self, json_obj: dict) -> EPMDataDayItem:
+        if isinstance(json_obj, dict):
+            for k, v in json_obj.items():
+                if hasattr(self, k):
+                    setattr(self, k, v)
+        return self
+
+
+class EPMDataMonthYearItem:
+    def __init__(self):
+        self.backUpEnergy: int = 0
+        self.consumeEnergy: int = 0
+        self.date: int = 0
+        self.datetime: datetime = None
+        self.dateStr: str = ""
+        self.directR: int = 0
+        self.directRKwh: int = 0
+        self.energy: float = 0.0
+        self.energyPec: str = ""
+        self.energyStr: str = ""
+        self.epmBuyEnergy: float = 0.0
+        self.epmLoadEnergy: float = 0.0
+        self.epmSellEnergy: float = 0.0
+        self.errorFlag: int = 0
+        self.generatorEnergy: float = 0.0
+        self.generatorPercent: float = 0.0
+        self.gridBatteryE: int = 0
+        self.gridPurchasedEnergy: int = 0
+        self.gridPurchasedIncome: float = 0.0
+        self.gridPurchasedPercent: float = 0.0
+        self.gridSellEnergy: int = 0
+        self.gridSellIncome: float = 0.0
+        self.homeGridEnergy: int = 0
+        self.id: str = ""
+        self.invAcE: int = 0
+        self.money: float = 0.0
+        self.oneSelfPercent: float = 0.0
+        self.produceEnergy: int = 0
+        self.systemEfficiency: int = 0
+        self.timeZone: int = 0
+        self.toConsumption: int = 0
+        self.toGrid: int = 0
+        self.totalR: int = 0
+        self.totalRKwh: int = 0
+
+    def _from_json_(self, json_obj: dict, dt: Optional[datetime] = None):
+        for key in json_obj:
+            if hasattr(self, key):
+                setattr(self, key, json_obj[key])
+        if dt is not None:
+            self.datetime = dt
+        elif "date" in json_obj:
+            self.datetime = datetime.fromtimestamp(int(json_obj["date"]) / 1000, epm_timezone(self.timeZone))
+        return self
+
+    def _to_json_(self) -> dict:
+        json_obj = {}
+        for k, v in self.__dict__.items():
+            if k == "datetime":
+                continue
+            if not k.startswith("_"):
+                json_obj[k] = v
+        return json_obj
+
+
+class EPMDayData():
+    """Columnar EPM day data.
+
+    ``timestamps`` holds the sample times as epoch milliseconds and
+    ``columns`` the matching values per field; rows whose timestamp or values
+    could not be read are listed in ``dropped`` as ``(index, timestamp,
+    reason)``. ``formatted_data`` builds one ``EPMDataDayItem`` per row on
+    first access.
+    """
+    def __init__(self, timeZone: float = 0):
+        self.tzinfo: timezone = epm_timezone(timeZone)
+        self.timestamps: array = array('q')
+        self.columns: dict[str, list] = {}
+        self.dropped: list[tuple[int, object, str]] = []
+        self._formatted_data: Optional[list[EPMDataDayItem]] = None
+
+    @property
+    def formatted_data(self) -> list[EPMDataDayItem]:
+        if self._formatted_data is None:
+            datetimes = self.datetimes()
+            items = []
+            for x in range(0, len(datetimes)):
+                epm = EPMDataDayItem()
+                epm.datetime = datetimes[x]
+                for key, values in self.columns.items():
+                    setattr(epm, key, values[x])
+                items.append(epm)
+            self._formatted_data = items
+        return self._formatted_data
+
+    @formatted_data.setter
+    def formatted_data(self, value: list[EPMDataDayItem]):
+        self._formatted_data = value
+
+    def epoch_seconds(self) -> list[float]:
+        return [x / 1000 for x in self.timestamps]
+
+    def datetimes(self) -> list[datetime]:
+        return epoch_millis_to_datetimes(self.timestamps, self.tzinfo)
+
+    def _from_json_(self, json_data: dict) -> EPMDayData:
+        if json_data and "data_timestamp" in json_data:
+            data_timestamp = json_data.get('data_timestamp', []) or []
+            template = EPMDataDayItem()
+            columns = {
+                key: value for key, value in json_data.items()
+                if key != "data_timestamp" and isinstance(value, list) and hasattr(template, key)
+            }
+            timestamps, dropped = parse_epoch_millis(data_timestamp)
+            rows = len(data_timestamp)
+            short = min([len(x) for x in columns.values()], default=rows)
+            if dropped or short < rows:
+                bad = {x[0] for x in dropped}
+                keep = []
+                kept_timestamps = array('q')
+                for index, timestamp in zip([x for x in range(0, rows) if x not in bad], timestamps):
+                    if index < short:
+                        keep.append(index)
+                        kept_timestamps.append(timestamp)
+                    else:
+                        dropped.append((index, data_timestamp[index], "missing values"))
+                self.timestamps = kept_timestamps
+                self.columns = {key: [values[x] for x in keep] for key, values in columns.items()}
+                self.dropped = sorted(dropped, key=lambda x: x[0])
+            else:
+                self.timestamps = timestamps
+                self.columns = {key: values[:rows] for key, values in columns.items()}
+            self._formatted_data = None
+        return self
+    
+    def convert_to_json(self) -> dict:
+        json_obj = {}
+        for item in self.formatted_data:
+            json_obj[item.datetime.isoformat()] = item._to_json_()
+        return dict(sorted(json_obj.items()))
+
+
+class EPMMonthYearData():
+    def __init__(self):
+        self.formatted_data: list[EPMDataMonthYearItem] = []
+        self.dropped: list[tuple[int, object, str]] = []
+
+    def _from_json_(self, json_data: dict) -> EPMMonthYearData:
+        if json_data:
+            timestamps, dropped = parse_epoch_millis([x.get("date") for x in json_data])
+            bad = {x[0] for x in dropped}
+            position = 0
+            for index, item in enumerate(json_data):
+                if index in bad:
+                    continue
+                tz = epm_timezone(item.get("timeZone", 0))
+                dt = datetime.fromtimestamp(timestamps[position] / 1000, tz)
+                position += 1
+                self.formatted_data.append(EPMDataMonthYearItem()._from_json_(item, dt))
+            self.dropped = dropped
+        return self
+    
+    def convert_to_json(self) -> dict:
+        json_obj = {}
+        for item in self.formatted_data:
+            json_obj[item.datetime.isoformat()] = item._to_json_()
+        return dict(sorted(json_obj.items()))
+
+
+class HistoryData():
+    """Columnar station or inverter history (one day, month or year, or a range of them).
+
+    ``timestamps`` holds the sample or period start times as epoch
+    milliseconds and ``columns`` the matching raw values per field (``None``
+    where a record lacked the field). Records without a readable time are
+    listed in ``dropped`` as ``(index, value, reason)``, ``index`` counting
+    the records of all extended periods in order.
+    """
+    TIME_KEYS = ("dataTimestamp", "time", "date")
+
+    def __init__(self, timeZone: float = 0, period: str = "day"):
+        self.period: str = period
+        self.tzinfo: timezone = epm_timezone(timeZone)
+        self.timestamps: array = array('q')
+        self.columns: dict[str, list] = {}
+        self.dropped: list[tuple[int, object, str]] = []
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def datetimes(self) -> list[datetime]:
+        return epoch_millis_to_datetimes(self.timestamps, self.tzinfo)
+
+    def column(self, field: str) -> list:
+        return self.columns.get(field, [None] * len(self.timestamps))
+
+    def numeric(self, field: str) -> array:
+        """A column as ``array('d')``, with NaN for missing or unreadable values."""
+        values = array('d')
+        for value in self.column(field):
+            try:
+                values.append(float(value))
+            except (TypeError, ValueError):
+                values.append(float("nan"))
+        return values
+
+    def extend(self, other: HistoryData) -> HistoryData:
+        """Append the rows of ``other`` (e.g. the next day of a range)."""
+        size, added = len(self.timestamps), len(other.timestamps)
+        for key in other.columns:
+            if key not in self.columns:
+                self.columns[key] = [None] * size
+        for key, values in self.columns.items():
+            values.extend(other.columns.get(key, [None] * added))
+        # the records read so far, kept and dropped, come before those of other
+        offset = size + len(self.dropped)
+        self.timestamps.extend(other.timestamps)
+        self.dropped.extend((index + offset, value, reason) for index, value, reason in other.dropped)
+        return self
+
+    def _from_json_(self, json_data: list, time_key: Optional[str] = None) -> HistoryData:
+        records = [x for x in (json_data or []) if isinstance(x, dict)]
+        if records:
+            if time_key is None:
+                time_key = next((x for x in self.TIME_KEYS if x in records[0]), self.TIME_KEYS[0])
+            timestamps, dropped = parse_epoch_millis([x.get(time_key) for x in records])
+            if dropped:
+                bad = {x[0] for x in dropped}
+                records = [x for index, x in enumerate(records) if index not in bad]
+            keys = dict.fromkeys(key for record in records for key in record if key != time_key)
+            self.timestamps = timestamps
+            self.columns = {key: [x.get(key) for x in records] for key in keys}
+            self.dropped = dropped
+        return self
+
+    def _to_json(self) -> dict:
+        json_obj = {}
+        for x, dt in enumerate(self.datetimes()):
+            json_obj[dt.isoformat()] = {key: values[x] for key, values in self.columns.items()}
+        return json_obj
+
+
+class SolisEPM():
+    collectorId: str
+    collectorSn: str
+    ctRatio: float
+    currentState: str
+    dataTimestamp: str
+    daylight: int
+    eToaalInverter: str
+    eToaalInverterOrigin: float
+    eToaalInverterStr: float
+    eTodayBuy: 0
+    eTodayBuyOrigin: 0
+    eTodayBuyStr: str
+    eTodaySell: str
+    eTodaySellOrigin: str
+    eTodaySellStr: str
+    eTotalBuy: str
+    eTotalBuyOrigin: str
+    eTotalBuyStr: str
+    eTotalLoad: str
+    eTotalLoadOrigin: str
+    eTotalLoadStr: str
+    eTotalSell: str
+    eTotalSellOrigin: str
+    eTotalSellStr: str
+    empSoftwareVersion: str
+    epmDataTime: str
+    epmModel: str
+    epmMonthLoadEnergy: str
+    epmMonthLoadEnergyOrigin: str
+    epmMonthLoadEnergyStr: str
+    epmTodayLoadEnergy: str
+    epmTodayLoadEnergyOrigin: str
+    epmTodayLoadEnergyStr: str
+    epmTotalLoadEnergy: str
+    epmTotalLoadEnergyOrigin: str
+    epmTotalLoadEnergyStr: str
+    epmType: str
+    facMeter: str
+    failSafe: str
+    g100v2State: str
+    gridSwitch1: str
+    iAc1: str
+    iAc1Str: str
+    iAc2: str
+    iAc2Str: str
+    iAc3: str
+    iAc3Str: str
+    id: str
+    inverterModel: str
+    inverterNum: str
+    isRealtime: str
+    monthBuy: str
+    monthBuyOrigin: str
+    monthBuyStr: str
+    monthSell: str
+    monthSellOrigin: str
+    monthSellStr: str
+    pAc1: str
+    pAc1Str: str
+    pAc2: str
+    pAc2Str: str
+    pAc3: str
+    pAc3Str: str
+    pEpmTotal: str
+    pEpmTotalOrigin: str
+    pEpmTotalPec: str
+    pEpmTotalStr: str
+    pInverterTotal: str
+    pInverterTotalOrigin: str
+    pInverterTotalStr: str
+    pLimit: str
+    pLoad: str
+    pLoadOrigin: str
+    pLoadStr: str
+    pSet: str
+    pSetOrigin: str
+    pSetStr: str
+    powerFactor: str
+    rs485ComAddr: str
+    sn: str
+    sno: str
+    state: str
+    stateExceptionFlag: str
+    stationId: str
+    stationName: str
+    stationType: str
+    stationTypeNew: str
+    synchronizationType: str
+    tag: str
+    timeZone: str
+    timeZoneStr: str
+    uAc1: str
+    uAc1Str: str
+    uAc2: str
+    uAc2Str: str
+    uAc3: str
+    uAc3Str: str
+    userId: str
+    def __init__(self, __parent__: SolisCloud):
+        self.__parent__: SolisCloud = __parent__
+        self.collectorId = ""
+        self.collectorSn = ""
+        self.ctRatio = 0.0
+        self.currentState = ""
+        self.dataTimestamp = ""
+        self.daylight = 0
+        self.eToaalInverter = 0.0
+        self.eToaalInverterOrigin = 0.0
+        self.eToaalInverterStr = ""
+        self.eTodayBuy = 0
+        self.eTodayBuyOrigin = 0
+        self.eTodayBuyStr = ""
+        self.eTodaySell = ""
+        self.eTodaySellOrigin = ""
+        self.eTodaySellStr = ""
+        self.eTotalBuy = ""
+        self.eTotalBuyOrigin = ""
+        self.eTotalBuyStr = ""
+        self.eTotalLoad = ""
+        self.eTotalLoadOrigin = ""
+        self.eTotalLoadStr = ""
+        self.eTotalSell = ""
+        self.eTotalSellOrigin = ""
+        self.eTotalSellStr = ""
+        self.empSoftwareVersion = ""
+        self.epmDataTime = ""
+        self.epmModel = ""
+        self.epmMonthLoadEnergy = ""
+        self.epmMonthLoadEnergyOrigin = ""
+        self.epmMonthLoadEnergyStr = ""
+        self.epmTodayLoadEnergy = ""
+        self.epmTodayLoadEnergyOrigin = ""
+        self.epmTodayLoadEnergyStr = ""
+        self.epmTotalLoadEnergy = ""
+        self.epmTotalLoadEnergyOrigin = ""
+        self.epmTotalLoadEnergyStr = ""
+        self.epmType = ""
+        self.facMeter = ""
+        self.failSafe = ""
+        self.g100v2State = ""
+        self.gridSwitch1 = ""
+        self.iAc1 = ""
+        self.iAc1Str = ""
+        self.iAc2 = ""
+        self.iAc2Str = ""
+        self.iAc3 = ""
+        self.iAc3Str = ""
+        self.id = ""
+        self.inverterModel = ""
+        self.inverterNum = ""
+        self.isRealtime = ""
+        self.monthBuy = ""
+        self.monthBuyOrigin = ""
+        self.monthBuyStr = ""
+        self.monthSell = ""
+        self.monthSellOrigin = ""
+        self.monthSellStr = ""
+        self.pAc1 = ""
+        self.pAc1Str = ""
+        self.pAc2 = ""
+        self.pAc2Str = ""
+        self.pAc3 = ""
+        self.pAc3Str = ""
+        self.pEpmTotal = ""
+        self.pEpmTotalOrigin = ""
+        self.pEpmTotalPec = ""
+        self.pEpmTotalStr = ""
+        self.pInverterTotal = ""
+        self.pInverterTotalOrigin = ""
+        self.pInverterTotalStr = ""
+        self.pLimit = ""
+        self.pLoad = ""
+        self.pLoadOrigin = ""
+        self.pLoadStr = ""
+        self.pSet = ""
+        self.pSetOrigin = ""
+        self.pSetStr = ""
+        self.powerFactor = ""
+        self.rs485ComAddr = ""
+        self.sn = ""
+        self.sno = ""
+        self.state = ""
+        self.stateExceptionFlag = ""
+        self.stationId = ""
+        self.stationName = ""
+        self.stationType = ""
+        self.stationTypeNew = ""
+        self.synchronizationType = ""
+        self.tag = ""
+        self.timeZone = ""
+        self.timeZoneStr = ""
+        self.uAc1 = ""
+        self.uAc1Str = ""
+        self.uAc2 = ""
+        self.uAc2Str = ""
+        self.uAc3 = ""
+        self.uAc3Str = ""
+        self.userId = ""
+    
+    def get_data_for_day(self, dt: date, timeZone: int, searchinfo: list[EPMFields] = [], **kwargs) -> EPMDayData:
+        data: EPMDayData = self.__parent__.get_epm_data_for_day(sn=self.sn, dt=dt, timeZone=timeZone, searchinfo=searchinfo, **kwargs)
+        return data
+    
+    def get_data_for_month(self, dt: date, **kwargs) -> EPMMonthYearData:
+        data: EPMMonthYearData = self.__parent__.get_epm_data_for_month(sn=self.sn, dt=dt, **kwargs)
+        return data
+    
+    def get_data_for_year(self, dt: date, **kwargs) -> EPMMonthYearData:
+        data: EPMMonthYearData = self.__parent__.get_epm_data_for_year(sn=self.sn, dt=dt, **kwargs)
+        return data
+
+    def _to_json(self):
+        return {key: value for key, value in self.__dict__.items() if not key.startswith("_")}
+        
+    def _from_json(self, json_data) -> SolisEPM:
+        if json_data:
+            for key, value in json_data.items():
+                if hasattr(self, key):
+                    setattr(self, key, value)
+        return self
+
+    def _update_from_json(self, json_data) -> set[str]:
+        return _update_fields(self, json_data)
+
+    def refresh(self) -> set[str]:
+        """Re-read the EPM detail and update this object in place; returns the changed fields."""
+        if self.__parent__:
+            return self._update_from_json(self.__parent__.get_epm_detail_data(self.sn))
+        return set()
+
+
+class SolisStations():
+    def __init__(self):
+        self.stationStatusVo: StatusVo = StatusVo()
+        self.stations: list[SolisStation] = []
+    
+    def _from_json(self, json_data) -> SolisStations:
+        for key, value in json_data.items():
+            if hasattr(self, key):
+                setattr(self, key, value)
+        return self
+    
+    def _to_json(self) -> dict:
+        json_obj = {}
+        json_obj['stationsStatusVo'] = self.stationStatusVo._to_json()
+        json_obj['stations'] = [x._to_json() for x in self.stations]
+        return json_obj
+
+
+class SolisCollector():
+    def __init__(self, __parent__: SolisCloud = None):
+        self.__parent__: SolisCloud = __parent__
+        self.id: str = ""
+        self.sn: str = ""
+        self.userId: str = ""
+        self.stationId: str = ""
+        self.stationName: str = ""
+        self.state: int = 0
+        self.model: str = ""
+        self.version: str = ""
+        self.rssi: int = 0
+        self.rssiLevel: int = 0
+        self.simFlowState: int = 0
+        self.dataTimestamp: str = ""
+        self.dataTimestampStr: str = ""
+        self.factoryTime: int = 0
+        self.updateDate: int = 0
+        self.timeZone: float = 0.0
+        self.timeZoneStr: str = ""
+        self.sno: str = ""
+
+    @property
+    def online(self) -> bool:
+        return self.state == 1
+
+    def _from_json(self, json_data) -> SolisCollector:
+        if json_data:
+            for key, value in json_data.items():
+                if hasattr(self, key):
+                    setattr(self, key, value)
+        return self
+
+    def _update_from_json(self, json_data) -> set[str]:
+        return _update_fields(self, json_data)
+
+    def _to_json(self) -> dict:
+        return {key: value for key, value in self.__dict__.items() if not key.startswith("_")}
+
+    def list_inverters(self) -> list[SolisInverter]:
+        if self.__parent__:
+            return [x for x in self.__parent__.iter_inverters(stationId=self.stationId) if x.collectorsn == self.sn]
+
+
+class SolisAlarm():
+    def __init__(self, __parent__: SolisCloud = None):
+        self.__parent__: SolisCloud = __parent__
+        self.id: str = ""
+        self.stationId: str = ""
+        self.stationName: str = ""
+        self.alarmDeviceSn: str = ""
+        self.alarmCode: str = ""
+        self.alarmMsg: str = ""
+        self.alarmLevel: str = ""
+        self.alarmBeginTime: int = 0
+        self.alarmEndTime: int = 0
+        self.state: str = ""
+        self.advice: str = ""
+        self.machine: str = ""
+        self.timeZone: float = 0.0
+
+    @property
+    def key(self) -> str:
+        """Stable identity of the alarm (its ``id``, or device, code and start time)."""
+        return str(self.id) if self.id else f"{self.alarmDeviceSn}:{self.alarmCode}:{self.alarmBeginTime}"
+
+    @property
+    def cleared(self) -> bool:
+        # state: 0 pending, 1 processed, 2 restored
+        return str(self.state) == "2"
+
+    def begin(self) -> Optional[datetime]:
+        try:
+            return datetime.fromtimestamp(int(self.alarmBeginTime) / 1000, epm_timezone(self.timeZone))
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+    def _from_json(self, json_data) -> SolisAlarm:
+        if json_data:
+            for key, value in json_data.items():
+                if hasattr(self, key):
+                    setattr(self, key, value)
+        return self
+
+    def _update_from_json(self, json_data) -> set[str]:
+        return _update_fields(self, json_data)
+
+    def _to_json(self) -> dict:
+        return {key: value for key, value in self.__dict__.items() if not key.startswith("_")}
+
+
+class SolisInverter():
+    def __init__(self, __parent__: SolisCloud = None):
+        self.__parent__: SolisCloud = __parent__
+        self.charge_discharge_schedule: ChargeDischargeSchedule = None
+        self.chartAllParams: str = ''
+        self.id: str = ''
+        self.userId: str = ''
+        self.sn: str = ''
+        self.inverterMeterModel: int = 0
+        self.collectorsn: str = ''
+        self.collectorId: str = ''
+        self.state: int = 0
+        self.stateExceptionFlag: int = 0
+        self.mpptSwitch: int = 0
+        self.collectorState: int = 0
+        self.collectorModel: str = ''
+        self.simFlowState: int = 0
+        self.ammeterId: str = ''
+        self.electricMeter: int = 0
+        self.fullHour: float = 0.0
+        self.fullHourStr: str = ''
+        self.currentState: str = ''
+        self.alarmState: int = 0
+        self.warningInfoData: int = 0
+        self.shelfBeginTime: int = 0
+        self.shelfEndTime: int = 0
+        self.updateShelfEndTime: int = 0
+        self.updateShelfEndTimeStr: str = ''
+        self.shelfState: str = ''
+        self.timeZone: float = 0.0
+        self.timeZoneStr: str = ''
+        self.daylight: int = 0
+        self.daylightSwitch: int = 0
+        self.model: str = ''
+        self.productModel: str = ''
+        self.isS5: int = 0
+        self.isSeparateLoad: int = 0
+        self.isShowPowerFactor: int = 0
+        self.isShowInternalBatteryI: int = 0
+        self.ctrlCommand: int = 0
+        self.inverterType: int = 0
+        self.nationalStandards: str = ''
+        self.nationalStandardstr: str = ''
+        self.inverterTemperature: float = 0.0
+        self.inverterTemperatureUnit: str = ''
+        self.inverterTemperature2: float = 0.0
+        self.inverterTemperatureUnit2: str = ''
+        self.temp: float = 0.0
+        self.tempName: str = ''
+        self.stationName: str = ''
+        self.stationType: int = 0
+        self.stationTypeNew: int = 0
+        self.epmType: int = 0
+        self.synchronizationType: int = 0
+        self.gridSwitch1: int = 0
+        self.sno: str = ''
+        self.money: str = ''
+        self.stationId: str = ''
+        self.version: str = ''
+        self.version2: str = ''
+        self.acOutputType: int = 0
+        self.dcInputtype: int = 0
+        self.rs485ComAddr: str = ''
+        self.dataTimestamp: str = ''
+        self.timeStr: str = ''
+        self.tag: str = ''
+        self.reactivePower: float = 0.0
+        self.apparentPower: float = 0.0
+        self.dcPac: float = 0.0
+        self.uInitGnd: int = 0
+        self.uInitGndStr: str = ''
+        self.dcBus: float = 0.0
+        self.dcBusStr: str = ''
+        self.dcBusHalf: float = 0.0
+        self.dcBusHalfStr: str = ''
+        self.power: float = 0.0
+        self.powerStr: str = ''
+        self.powerPec: str = ''
+        self.porwerPercent: float = 0.0
+        self.pac: float = 0.0
+        self.pacStr: str = ''
+        self.pacPec: str = ''
+        self.oneSelf: float = 0.0
+        self.eToday: float = 0.0
+        self.eTodayStr: str = ''
+        self.eMonth: float = 0.0
+        self.eMonthStr: str = ''
+        self.eYear: float = 0.0
+        self.eYearStr: str = ''
+        self.eTotal: float = 0.0
+        self.eTotalStr: str = ''
+        self.dayInCome: float = 0.0
+        self.monthInCome: float = 0.0
+        self.yearInCome: float = 0.0
+        self.allInCome: float = 0.0
+        self.uPv1: int = 0
+        self.uPv1Str: str = ''
+        self.iPv1: int = 0
+        self.iPv1Str: str = ''
+        self.uPv2: int = 0
+        self.uPv2Str: str = ''
+        self.iPv2: int = 0
+        self.iPv2Str: str = ''
+        self.uPv3: int = 0
+        self.uPv3Str: str = ''
+        self.iPv3: int = 0
+        self.iPv3Str: str = ''
+        self.uPv4: int = 0
+        self.uPv4Str: str = ''
+        self.iPv4: int = 0
+        self.iPv4Str: str = ''
+        self.uPv5: int = 0
+        self.uPv5Str: str = ''
+        self.iPv5: int = 0
+        self.iPv5Str: str = ''
+        self.uPv6: int = 0
+        self.uPv6Str: str = ''
+        self.iPv6: int = 0
+        self.iPv6Str: str = ''
+        self.uPv7: int = 0
+        self.uPv7Str: str = ''
+        self.iPv7: int = 0
+        self.iPv7Str: str = ''
+        self.uPv8: int = 0
+        self.uPv8Str: str = ''
+        self.iPv8: int = 0
+        self.iPv8Str: str = ''
+        self.uPv9: int = 0
+        self.uPv9Str: str = ''
+        self.iPv9: int = 0
+        self.iPv9Str: str = ''
+        self.uPv10: int = 0
+        self.uPv10Str: str = ''
+        self.iPv10: int = 0
+        self.iPv10Str: str = ''
+        self.uPv11: int = 0
+        self.uPv11Str: str = ''
+        self.iPv11: int = 0
+        self.iPv11Str: str = ''
+        self.uPv12: int = 0
+        self.uPv12Str: str = ''
+        self.iPv12: int = 0
+        self.iPv12Str: str = ''
+        self.uPv13: int = 0
+        self.uPv13Str: str = ''
+        self.iPv13: int = 0
+        self.iPv13Str: str = ''
+        self.uPv14: int = 0
+        self.uPv14Str: str = ''
+        self.iPv14: int = 0
+        self.iPv14Str: str = ''
+        self.uPv15: int = 0
+        self.uPv15Str: str = ''
+        self.iPv15: int = 0
+        self.iPv15Str: str = ''
+        self.uPv16: int = 0
+        self.uPv16Str: str = ''
+        self.iPv16: int = 0
+        self.iPv16Str: str = ''
+        self.uPv17: int = 0
+        self.uPv17Str: str = ''
+        self.iPv17: int = 0
+        self.iPv17Str: str = ''
+        self.uPv18: int = 0
+        self.uPv18Str: str = ''
+        self.iPv18: int = 0
+        self.iPv18Str: str = ''
+        self.uPv19: int = 0
+        self.uPv19Str: str = ''
+        self.iPv19: int = 0
+        self.iPv19Str: str = ''
+        self.uPv20: int = 0
+        self.uPv20Str: str = ''
+        self.iPv20: int = 0
+        self.iPv20Str: str = ''
+        self.uPv21: int = 0
+        self.uPv21Str: str = ''
+        self.iPv21: int = 0
+        self.iPv21Str: str = ''
+        self.uPv22: int = 0
+        self.uPv22Str: str = ''
+        self.iPv22: int = 0
+        self.iPv22Str: str = ''
+        self.uPv23: int = 0
+        self.uPv23Str: str = ''
+        self.iPv23: int = 0
+        self.iPv23Str: str = ''
+        self.uPv24: int = 0
+        self.uPv24Str: str = ''
+        self.iPv24: int = 0
+        self.iPv24Str: str = ''
+        self.uPv25: int = 0
+        self.uPv25Str: str = ''
+        self.iPv25: int = 0
+        self.iPv25Str: str = ''
+        self.uPv26: int = 0
+        self.uPv26Str: str = ''
+        self.iPv26: int = 0
+        self.iPv26Str: str = ''
+        self.uPv27: int = 0
+        self.uPv27Str: str = ''
+        self.iPv27: int = 0
+        self.iPv27Str: str = ''
+        self.uPv28: int = 0
+        self.uPv28Str: str = ''
+        self.iPv28: int = 0
+        self.iPv28Str: str = ''
+        self.uPv29: int = 0
+        self.uPv29Str: str = ''
+        self.iPv29: int = 0
+        self.iPv29Str: str = ''
+        self.uPv30: int = 0
+        self.uPv30Str: str = ''
+        self.iPv30: int = 0
+        self.iPv30Str: str = ''
+        self.uPv31: int = 0
+        self.uPv31Str: str = ''
+        self.iPv31: int = 0
+        self.iPv31Str: str = ''
+        self.uPv32: int = 0
+        self.uPv32Str: str = ''
+        self.iPv32: int = 0
+        self.iPv32Str: str = ''
+        self.pow1: int = 0
+        self.pow1Str: str = ''
+        self.pow2: int = 0
+        self.pow2Str: str = ''
+        self.pow3: int = 0
+        self.pow3Str: str = ''
+        self.pow4: int = 0
+        self.pow4Str: str = ''
+        self.pow5: int = 0
+        self.pow5Str: str = ''
+        self.pow6: int = 0
+        self.pow6Str: str = ''
+        self.pow7: int = 0
+        self.pow7Str: str = ''
+        self.pow8: int = 0
+        self.pow8Str: str = ''
+        self.pow9: int = 0
+        self.pow9Str: str = ''
+        self.pow10: int = 0
+        self.pow10Str: str = ''
+        self.pow11: int = 0
+        self.pow11Str: str = ''
+        self.pow12: int = 0
+        self.pow12Str: str = ''
+        self.pow13: int = 0
+        self.pow13Str: str = ''
+        self.pow14: int = 0
+        self.pow14Str: str = ''
+        self.pow15: int = 0
+        self.pow15Str: str = ''
+        self.pow16: int = 0
+        self.pow16Str: str = ''
+        self.pow17: int = 0
+        self.pow17Str: str = ''
+        self.pow18: int = 0
+        self.pow18Str: str = ''
+        self.pow19: int = 0
+        self.pow19Str: str = ''
+        self.pow20: int = 0
+        self.pow20Str: str = ''
+        self.pow21: int = 0
+        self.pow21Str: str = ''
+        self.pow22: int = 0
+        self.pow22Str: str = ''
+        self.pow23: int = 0
+        self.pow23Str: str = ''
+        self.pow24: int = 0
+        self.pow24Str: str = ''
+        self.pow25: int = 0
+        self.pow25Str: str = ''
+        self.pow26: int = 0
+        self.pow26Str: str = ''
+        self.pow27: int = 0
+        self.pow27Str: str = ''
+        self.pow28: int = 0
+        self.pow28Str: str = ''
+        self.pow29: int = 0
+        self.pow29Str: str = ''
+        self.pow30: int = 0
+        self.pow30Str: str = ''
+        self.pow31: int = 0
+        self.pow31Str: str = ''
+        self.pow32: int = 0
+        self.pow32Str: str = ''
+        self.uAc1: float = 0.0
+        self.uAc1Str: str = ''
+        self.iAc1: float = 0.0
+        self.iAc1Str: str = ''
+        self.uAc2: float = 0.0
+        self.uAc2Str: str = ''
+        self.iAc2: float = 0.0
+        self.iAc2Str: str = ''
+        self.uAc3: float = 0.0
+        self.uAc3Str: str = ''
+        self.iAc3: float = 0.0
+        self.iAc3Str: str = ''
+        self.powerFactor: float = 0.0
+        self.batteryDischargeEnergy: float = 0.0
+        self.batteryDischargeEnergyStr: str = ''
+        self.batteryChargeEnergy: float = 0.0
+        self.batteryChargeEnergyStr: str = ''
+        self.homeLoadEnergy: float = 0.0
+        self.homeLoadEnergyStr: str = ''
+        self.gridPurchasedEnergy: float = 0.0
+        self.gridPurchasedEnergyStr: str = ''
+        self.gridSellEnergy: float = 0.0
+        self.gridSellEnergyStr: str = ''
+        self.fac: float = 0.0
+        self.facStr: str = ''
+        self.batteryPower: float = 0.0
+        self.batteryPowerStr: str = ''
+        self.batteryPowerPec: str = ''
+        self.batteryPowerZheng: int = 0
+        self.batteryPowerFu: float = 0.0
+        self.storageBatteryVoltage: float = 0.0
+        self.storageBatteryVoltageStr: str = ''
+        self.storageBatteryCurrent: float = 0.0
+        self.storageBatteryCurrentStr: str = ''
+        self.batteryCapacitySoc: float = 0.0
+        self.batteryHealthSoh: float = 0.0
+        self.batteryVoltage: float = 0.0
+        self.batteryVoltageStr: str = ''
+        self.bstteryCurrent: float = 0.0
+        self.bstteryCurrentStr: str = ''
+        self.batteryPowerBms: float = 0.0
+        self.batteryPowerBmsStr: str = ''
+        self.internalBatteryI: float = 0.0
+        self.batteryChargingCurrent: float = 0.0
+        self.batteryChargingCurrentStr: str = ''
+        self.batteryDischargeLimiting: float = 0.0
+        self.batteryDischargeLimitingStr: str = ''
+        self.batteryFailureInformation01: str = ''
+        self.batteryFailureInformation02: str = ''
+        self.batteryTotalChargeEnergy: float = 0.0
+        self.batteryTotalChargeEnergyStr: str = ''
+        self.batteryTodayChargeEnergy: float = 0.0
+        self.batteryTodayChargeEnergyStr: str = ''
+        self.batteryMonthChargeEnergy: float = 0.0
+        self.batteryMonthChargeEnergyStr: str = ''
+        self.batteryYearChargeEnergy: float = 0.0
+        self.batteryYearChargeEnergyStr: str = ''
+        self.batteryYesterdayChargeEnergy: float = 0.0
+        self.batteryYesterdayChargeEnergyStr: str = ''
+        self.batteryTotalDischargeEnergy: float = 0.0
+        self.batteryTotalDischargeEnergyStr: str = ''
+        self.batteryTodayDischargeEnergy: float = 0.0
+        self.batteryTodayDischargeEnergyStr: str = ''
+        self.batteryMonthDischargeEnergy: float = 0.0
+        self.batteryMonthDischargeEnergyStr: str = ''
+        self.batteryYearDischargeEnergy: float = 0.0
+        self.batteryYearDischargeEnergyStr: str = ''
+        self.batteryYesterdayDischargeEnergy: float = 0.0
+        self.batteryYesterdayDischargeEnergyStr: str = ''
+        self.gridPurchasedTotalEnergy: float = 0.0
+        self.gridPurchasedTotalEnergyStr: str = ''
+        self.gridPurchasedYearEnergy: float = 0.0
+        self.gridPurchasedYearEnergyStr: str = ''
+        self.gridPurchasedMonthEnergy: float = 0.0
+        self.gridPurchasedMonthEnergyStr: str = ''
+        self.gridPurchasedTodayEnergy: float = 0.0
+        self.gridPurchasedTodayEnergyStr: str = ''
+        self.gridPurchasedYesterdayEnergy: float = 0.0
+        self.gridPurchasedYesterdayEnergyStr: str = ''
+        self.gridSellTotalEnergy: float = 0.0
+        self.gridSellTotalEnergyStr: str = ''
+        self.gridSellYearEnergy: float = 0.0
+        self.gridSellYearEnergyStr: str = ''
+        self.gridSellMonthEnergy: float = 0.0
+        self.gridSellMonthEnergyStr: str = ''
+        self.gridSellTodayEnergy: float = 0.0
+        self.gridSellTodayEnergyStr: str = ''
+        self.gridSellYesterdayEnergy: float = 0.0
+        self.gridSellYesterdayEnergyStr: str = ''
+        self.homeLoadTodayEnergy: float = 0.0
+        self.homeLoadTodayEnergyStr: str = ''
+        self.homeLoadMonthEnergy: float = 0.0
+        self.homeLoadMonthEnergyStr: str = ''
+        self.homeLoadYearEnergy: float = 0.0
+        self.homeLoadYearEnergyStr: str = ''
+        self.homeLoadTotalEnergy: float = 0.0
+        self.homeLoadTotalEnergyStr: str = ''
+        self.totalLoadPower: float = 0.0
+        self.totalLoadPowerStr: str = ''
+        self.homeLoadYesterdayEnergy: float = 0.0
+        self.homeLoadYesterdayEnergyStr: str = ''
+        self.familyLoadPower: float = 0.0
+        self.familyLoadPowerStr: str = ''
+        self.familyLoadPercent: float = 0.0
+        self.homeGridYesterdayEnergy: float = 0.0
+        self.homeGridYesterdayEnergyStr: str = ''
+        self.homeGridTodayEnergy: float = 0.0
+        self.homeGridTodayEnergyStr: str = ''
+        self.homeGridMonthEnergy: float = 0.0
+        self.homeGridMonthEnergyStr: str = ''
+        self.homeGridYearEnergy: float = 0.0
+        self.homeGridYearEnergyStr: str = ''
+        self.homeGridTotalEnergy: float = 0.0
+        self.homeGridTotalEnergyStr: str = ''
+        self.bypassLoadPower: float = 0.0
+        self.bypassLoadPowerStr: str = ''
+        self.backupYesterdayEnergy: float = 0.0
+        self.backupYesterdayEnergyStr: str = ''
+        self.backupTodayEnergy: float = 0.0
+        self.backupTodayEnergyStr: str = ''
+        self.backupMonthEnergy: float = 0.0
+        self.backupMonthEnergyStr: str = ''
+        self.backupYearEnergy: float = 0.0
+        self.backupYearEnergyStr: str = ''
+        self.backupTotalEnergy: float = 0.0
+        self.backupTotalEnergyStr: str = ''
+        self.bypassAcVoltage: float = 0.0
+        self.bypassAcVoltageB: float = 0.0
+        self.bypassAcVoltageC: float = 0.0
+        self.bypassAcCurrent: float = 0.0
+        self.bypassAcCurrentB: float = 0.0
+        self.bypassAcCurrentC: float = 0.0
+        self.pLimitSet: float = 0.0
+        self.pFactorLimitSet: float = 0.0
+        self.pReactiveLimitSet: float = 0.0
+        self.batteryType: str = ''
+        self.batteryTypeCode: str = ''
+        self.batteryModel: int = 0
+        self.socDischargeSet: float = 0.0
+        self.socChargingSet: float = 0.0
+        self.pEpmSet: float = 0.0
+        self.pEpmSetStr: str = ''
+        self.epmFailSafe: float = 0.0
+        self.epmSafe: int = 0
+        self.pEpm: float = 0.0
+        self.pEpmStr: str = ''
+        self.psumCalPec: str = ''
+        self.insulationResistance: float = 0.0
+        self.dispersionRate: float = 0.0
+        self.sirRealtime: int = 0
+        self.iLeakLimt: int = 0
+        self.upvTotal: int = 0
+        self.upvTotalStr: str = ''
+        self.ipvTotal: int = 0
+        self.ipvTotalStr: str = ''
+        self.powTotal: int = 0
+        self.powTotalStr: str = ''
+        self.parallelStatus: int = 0
+        self.parallelAddr: int = 0
+        self.parallelPhase: int = 0
+        self.parallelBattery: int = 0
+        self.batteryAlarm: str = ''
+        self.bypassAcOnoffSet: float = 0.0
+        self.bypassAcVoltageSet: float = 0.0
+        self.bypassAcCurrentSet: float = 0.0
+        self.batteryCDEnableSet: float = 0.0
+        self.batteryCDSet: float = 0.0
+        self.batteryCDISet: float = 0.0
+        self.batteryCMaxiSet: float = 0.0
+        self.batteryDMaxiSet: float = 0.0
+        self.batteryUvpSet: float = 0.0
+        self.batteryFcvSet: float = 0.0
+        self.batteryAcvSet: float = 0.0
+        self.batteryOvpSet: float = 0.0
+        self.batteryOlvEnableSet: float = 0.0
+        self.batteryLaTemp: float = 0.0
+        self.offGridDDepth: float = 0.0
+        self.epsDDepth: float = 0.0
+        self.epsSwitchTime: str = ''
+        self.groupId: str = ''
+        self.isGrouped: int = 0
+        self.bmsState: int = 0
+        self.isShow: bool = False
+        self.isShowBattery: int = 0
+        self.acInType: int = 0
+        self.energyStorageControl: str = ''
+        self.dsp14Ver: str = ''
+        self.meter1Type: int = 0
+        self.meter2Type: int = 0
+        self.meter1SiteHigh: int = 0
+        self.meter2SiteHigh: int = 0
+        self.meter1TypeLow: int = 0
+        self.meter2TypeLow: int = 0
+        self.generatorPower: float = 0.0
+        self.generatorPowerStr: str = ''
+        self.generatorPowerPec: str = ''
+        self.generatorTodayEnergy: float = 0.0
+        self.generatorTodayEnergyStr: str = ''
+        self.generatorTodayEnergyPec: str = ''
+        self.generatorMonthEnergy: float = 0.0
+        self.generatorMonthEnergyStr: str = ''
+        self.generatorMonthEnergyPec: str = ''
+        self.generatorYearEnergy: float = 0.0
+        self.generatorYearEnergyStr: str = ''
+        self.generatorYearEnergyPec: str = ''
+        self.generatorTotalEnergy: float = 0.0
+        self.generatorTotalEnergyStr: str = ''
+        self.generatorTotalEnergyPec: str = ''
+        self.generatorWarning: str = ''
+        self.generatorWarningMsg: str = ''
+        self.generatorSet: str = ''
+        self.generatorSet01: float = 0.0
+        self.parallelOnoff: str = ''
+        self.parallelOnoff01: float = 0.0
+        self.parallelOnoff02: float = 0.0
+        self.parallelNumber: float = 0.0
+        self.parallelOnline: float = 0.0
+        self.tempFlag: int = 0
+        self.iA: float = 0.0
+        self.uA: float = 0.0
+        self.pA: float = 0.0
+        self.iB: float = 0.0
+        self.uB: float = 0.0
+        self.pB: float = 0.0
+        self.iC: float = 0.0
+        self.uC: float = 0.0
+        self.pC: float = 0.0
+        self.aReactivePower: float = 0.0
+        self.aLookedPower: float = 0.0
+        self.aPhasePowerFactor: float = 0.0
+        self.bReactivePower: float = 0.0
+        self.bLookedPower: float = 0.0
+        self.bPhasePowerFactor: float = 0.0
+        self.cReactivePower: float = 0.0
+        self.cLookedPower: float = 0.0
+        self.cPhasePowerFactor: float = 0.0
+        self.averagePowerFactor: float = 0.0
+        self.pvShow: int = 0
+        self.mpptShow: int = 0
+        self.mpptIpv1: int = 0
+        self.mpptUpv1: int = 0
+        self.mpptPow1: int = 0
+        self.mpptIpv2: int = 0
+        self.mpptUpv2: int = 0
+        self.mpptPow2: int = 0
+        self.mpptIpv3: int = 0
+        self.mpptUpv3: int = 0
+        self.mpptPow3: int = 0
+        self.mpptIpv4: int = 0
+        self.mpptPow4: int = 0
+        self.mpptUpv4: int = 0
+        self.mpptIpv5: int = 0
+        self.mpptUpv5: int = 0
+        self.mpptPow5: int = 0
+        self.mpptIpv6: int = 0
+        self.mpptUpv6: int = 0
+        self.mpptPow6: int = 0
+        self.mpptIpv7: int = 0
+        self.mpptUpv7: int = 0
+        self.mpptPow7: int = 0
+        self.mpptIpv8: int = 0
+        self.mpptUpv8: int = 0
+        self.mpptPow8: int = 0
+        self.mpptIpv9: int = 0
+        self.mpptUpv9: int = 0
+        self.mpptPow9: int = 0
+        self.mpptIpv10: int = 0
+        self.mpptUpv10: int = 0
+        self.mpptPow10: int = 0
+        self.mpptIpv11: int = 0
+        self.mpptUpv11: int = 0
+        self.mpptPow11: int = 0
+        self.mpptIpv12: int = 0
+        self.mpptUpv12: int = 0
+        self.mpptPow12: int = 0
+        self.mpptIpv13: int = 0
+        self.mpptUpv13: int = 0
+        self.mpptPow13: int = 0
+        self.mpptIpv14: int = 0
+        self.mpptUpv14: int = 0
+        self.mpptPow14: int = 0
+        self.mpptIpv15: int = 0
+        self.mpptUpv15: int = 0
+        self.mpptPow15: int = 0
+        self.mpptIpv16: int = 0
+        self.mpptUpv16: int = 0
+        self.mpptPow16: int = 0
+        self.mpptIpv17: int = 0
+        self.mpptUpv17: int = 0
+        self.mpptPow17: int = 0
+        self.mpptIpv18: int = 0
+        self.mpptUpv18: int = 0
+        self.mpptPow18: int = 0
+        self.mpptIpv19: int = 0
+        self.mpptUpv19: int = 0
+        self.mpptPow19: int = 0
+        self.mpptIpv20: int = 0
+        self.mpptUpv20: int = 0
+        self.mpptPow20: int = 0
+        self.dcInputTypeMppt: int = 0
+        self.afciType: str = ''
+        self.afciTypeStr: str = ''
+        self.afciVer: str = ''
+        self.fisTimeStr: str = ''
+        self.fisGenerateTime: int = 0
+        self.fisGenerateTimeStr: str = ''
+        self.outDateStr: str = ''
+        self.g100v2State: int = 0
+        self.faultCodeDesc: str = ''
+        self.machine: str = ''
+        self.batteryState: int = 0
+        self.sphSet: int = 0
+        self.sphSn: str = ''
+        self.dcAcPower: float = 0.0
+        self.backupLookedPower: float = 0.0
+        self.backupLookedPowerStr: str = ''
+        self.backupLookedPowerOriginal: float = 0.0
+        self.backupLookedPowerA: float = 0.0
+        self.backupLookedPowerB: float = 0.0
+        self.backupLookedPowerC: float = 0.0
+        self.batteryNum: int = 0
+        self.batteryType2: int = 0
+        self.batteryList: list = []
+        self.hmilcdVer: str = ''
+        self.afciDataFlag: int = 0
+        self.backup2Power: float = 0.0
+        self.backup2PowerStr: str = ''
+        self.backup2PowerA: float = 0.0
+        self.backup2PowerB: float = 0.0
+        self.backup2PowerC: float = 0.0
+        self.backup2LookedPower: float = 0.0
+        self.backup2LookedPowerStr: str = ''
+        self.backup2LookedPowerOriginal: float = 0.0
+        self.backup2LookedPowerA: float = 0.0
+        self.backup2LookedPowerB: float = 0.0
+        self.backup2LookedPowerC: float = 0.0
+        self.backup2TodayEnergy: float = 0.0
+        self.backup2TodayEnergyStr: str = ''
+        self.backup2MonthEnergy: float = 0.0
+        self.backup2MonthEnergyStr: str = ''
+        self.backup2YearEnergy: float = 0.0
+        self.backup2YearEnergyStr: str = ''
+        self.backup2TotalEnergy: float = 0.0
+        self.backup2TotalEnergyStr: str = ''
+        self.acCoupledTodayEnergy: float = 0.0
+        self.acCoupledTodayEnergyStr: str = ''
+        self.acCoupledMonthEnergy: float = 0.0
+        self.acCoupledMonthEnergyStr: str = ''
+        self.acCoupledYearEnergy: float = 0.0
+        self.acCoupledYearEnergyStr: str = ''
+        self.acCoupledTotalEnergy: float = 0.0
+        self.acCoupledTotalEnergyStr: str = ''
+        self.energyControl: str = ''
+        self.energyControl00: int = 0
+        self.energyControl01: int = 0
+        self.pumpControl: str = ''
+        self.pumpControl00: int = 0
+        self.gridPortDeviceType: int = 0
+        self.cpldVer: str = ''
+        self.hmiVersionAll: str = ''
+        self.dspmVersionAll: str = ''
+        self.dspsVersionAll: str = ''
+        self.hmilcdVersionAll: str = ''
+        self.cpldVersionAll: str = ''
+        self.sphVersionAll: str = ''
+        self.afciVersionAll: str = ''
+        self.bat1BmsVer: str = ''
+        self.bat1DcdcVer: str = ''
+        self.bat2BmsVer: str = ''
+        self.bat2DcdcVer: str = ''
+        self.showChipEvent: bool = False
+        self.showDebugParam: bool = False
+        self.dataTimestampStr: str = ''
+        self.existEpm: bool = False
+        self.model3P3W: int = 0
+        self.isShowApparent: int = 0
+        self.familyLoadPowerPec: str = ''
+        self.psum: float = 0.0
+        self.psumCal: float = 0.0
+        self.bypassLoadPowerOriginal: float = 0.0
+        self.reactivePowerStr: str = ''
+        self.apparentPowerStr: str = ''
+        self.backup2PowerOriginal: float = 0.0
+        self.dcPacStr: str = ''
+        self.psumCalStr: str = ''
+        self.psumStr: str = ''
+
+    def _from_json(self, json_data) -> SolisInverter:
+        if json_data:
+            for key, value in json_data.items():
+                if hasattr(self, key):
+                    setattr(self, key, value)
+        return self
+
+    def _update_from_json(self, json_data) -> set[str]:
+        return _update_fields(self, json_data)
+
+    def refresh(self, with_schedule: bool = False) -> set[str]:
+        """Re-read the inverter detail and update this object in place; returns the changed fields."""
+        changed = set()
+        if self.__parent__:
+            changed = self._update_from_json(self.__parent__.get_inverter_detail_data(self.id, self.sn))
+            if with_schedule:
+                previous = self.charge_discharge_schedule
+                schedule = self.__parent__.get_charge_discharge_schedule(self.sn)
+                if (previous is None) != (schedule is None) or (previous is not None and previous.to_value() != schedule.to_value()):
+                    self.charge_discharge_schedule = schedule
+                    changed.add("charge_discharge_schedule")
+        return changed
+    
+    def get_charge_discharge_schedules(self) -> ChargeDischargeSchedule:
+        if self.__parent__:
+            self.charge_discharge_schedule = self.__parent__.get_charge_discharge_schedule(self.sn)
+            return self.charge_discharge_schedule
+    
+    def set_charge_discharge_schedules(self, charge_discharge_schedule: ChargeDischargeSchedule) -> SolisSetResult:
+        if self.__parent__:
+            return self.__parent__.set_inverter_charge_discharge_schedule(self.id, self.sn, charge_discharge_schedule)
+    
+    def _to_json(self) -> dict:
+        return {key: value for key, value in self.__dict__.items() if not key.startswith("_")}
+
+
+class ScheduleDateTime():
+    def __init__(self):
+        self.start: datetime
+        self.end: datetime
+
+
+class ScheduleDate():
+    def __init__(self):
+        self.start: date = date(1970, 1, 1)
+        self.end: date = date(1970, 1, 1)
+
+
+class _Freezable():
+    _frozen: bool = False
+
+    def __setattr__(self, key, value):
+        if self._frozen:
+            raise AttributeError(f"{self.__class__.__name__} is frozen, edit a copy() instead")
+        object.__setattr__(self, key, value)
+
+
+class ChargeData(_Freezable):
+    def __init__(self):
+        self.current: int = 0
+        self.start: time = time(0, 0, 0, 0)
+        self.end: time = time(0, 0, 0, 0)
+
+    def freeze(self):
+        object.__setattr__(self, "_frozen", True)
+
+
+class Schedule(_Freezable):
+    def __init__(self):
+        self.charge: ChargeData = ChargeData()
+        self.discharge: ChargeData = ChargeData()
+
+    def freeze(self):
+        self.charge.freeze()
+        self.discharge.freeze()
+        object.__setattr__(self, "_frozen", True)
+
+
+class ChargeDischargeSchedule(_Freezable):
+
+    def __init__(self):
+        self.one: Schedule = Schedule()
+        self.two: Schedule = Schedule()
+        self.three: Schedule = Schedule()
+    
+    def to_value(self) -> str:
+        if self._frozen:
+            return self._value
+        value = f"{self.one.charge.current},{self.one.discharge.current},{self.one.charge.start.strftime('%H:%M')},{self.one.charge.end.strftime('%H:%M')},{self.one.discharge.start.strftime('%H:%M')},{self.one.discharge.end.strftime('%H:%M')},{self.two.charge.current},{self.two.discharge.current},{self.two.charge.start.strftime('%H:%M')},{self.two.charge.end.strftime('%H:%M')},{self.two.discharge.start.strftime('%H:%M')},{self.two.discharge.end.strftime('%H:%M')},{self.three.charge.current},{self.three.discharge.current},{self.three.charge.start.strftime('%H:%M')},{self.three.charge.end.strftime('%H:%M')},{self.three.discharge.start.strftime('%H:%M')},{self.three.discharge.end.strftime('%H:%M')}"
+        return value
+
+    def freeze(self) -> ChargeDischargeSchedule:
+        """Make the schedule immutable (in place) and return it.
+
+        A frozen schedule caches its ``to_value()`` so hashing and comparing
+        it is a string operation; only frozen schedules are hashable. Use
+        ``copy()`` to get an editable schedule.
+        """
+        if not self._frozen:
+            value = self.to_value()
+            for slot in (self.one, self.two, self.three):
+                slot.freeze()
+            object.__setattr__(self, "_value", value)
+            object.__setattr__(self, "_frozen", True)
+        return self
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    def copy(self) -> ChargeDischargeSchedule:
+        s = ChargeDischargeSchedule()
+        for name in ("one", "two", "three"):
+            for part in ("charge", "discharge"):
+                source = getattr(getattr(self, name), part)
+                target = getattr(getattr(s, name), part)
+                target.current, target.start, target.end = source.current, source.start, source.end
+        return s
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ChargeDischargeSchedule):
+            return NotImplemented
+        return self is other or self.to_value() == other.to_value()
+
+    def __hash__(self) -> int:
+        # only frozen schedules are hashable: an editable one could change its
+        # value (and so its hash) while it is a dict key
+        if not self._frozen:
+            raise TypeError("unhashable ChargeDischargeSchedule: freeze() it first")
+        return hash(self.to_value())
+
+    def __repr__(self) -> str:
+        return f"ChargeDischargeSchedule({self.to_value()!r})"
+    
+    def _to_json(self) -> dict:
+        json_obj = {}
+
+
+class SolisSetResult():
+    def __init__(self):
+        self.success: bool = True
+        self.error: str = ""
+        self.message: str = ""
@@ -0,0 +1,144 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Optional
+import threading
+from soliscloud.deadline import propagate
+from soliscloud.models import StatusVo
+from soliscloud.ratelimit import RateLimiter
+from soliscloud.soliscloud import SolisCloud
+
+
+class PoolResult():
+    """Outcome of an operation run across every account of a ``SolisCloudPool``.
+
+    ``results`` and ``errors`` are keyed by the account's key id; an account
+    appears in exactly one of them.
+    """
+    def __init__(self):
+        self.results: dict[str, object] = {}
+        self.errors: dict[str, BaseException] = {}
+
+    @property
+    def success(self) -> bool:
+        return not self.errors
+
+    def records(self) -> list:
+        """Concatenate the record lists of ``(StatusVo, list)`` listing results."""
+        records = []
+        for value in self.results.values():
+            records.extend(value[1] if isinstance(value, tuple) else value)
+        return records
+
+    def status(self) -> StatusVo:
+        """Sum the ``StatusVo`` counters of listing results across accounts."""
+        total = StatusVo()
+        for value in self.results.values():
+            if isinstance(value, tuple) and isinstance(value[0], StatusVo):
+                for key, count in value[0]._to_json().items():
+                    setattr(total, key, getattr(total, key) + (count or 0))
+        return total
+
+
+class SolisCloudPool():
+    def __init__(self, base_url: str = "https://www.soliscloud.com:13333", rate: float = 2.0, burst: int = 2, max_workers: int = 16, priority_limits: Optional[dict[str, int]] = None):
+        """Manages many SolisCloud accounts (key id / secret pairs).
+
+        All accounts share one HTTP session (and its connection pool) and one
+        worker pool, while each key gets its own rate limiter so that a busy
+        account never consumes another account's quota.
+
+        Args:
+            base_url (str): Default base URL for accounts added to the pool
+            rate (float): Requests per second allowed per key
+            burst (int): Requests per key that may be sent back to back
+            max_workers (int): Size of the shared worker pool and connection pool
+            priority_limits (dict[str, int]): Send requests through a ``PriorityDispatcher`` with these
+                per-class limits, so control writes go out ahead of queued reads
+        """
+        self.base_url: str = base_url
+        self.rate: float = rate
+        self.burst: int = burst
+        self.max_workers: int = max_workers
+        self.priority_limits: Optional[dict[str, int]] = priority_limits
+        self.accounts: dict[str, SolisCloud] = {}
+        self._lock = threading.Lock()
+        self._client = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def client(self):
+        with self._lock:
+            if self._client is None:
+                from requests.adapters import HTTPAdapter
+                self._client = SolisCloud.RequestsSession()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_workers)
+                self._client.mount("https://", adapter)
+                self._client.mount("http://", adapter)
+                if self.priority_limits is not None:
+                    from soliscloud.dispatcher import PriorityDispatcher
+                    self._client = PriorityDispatcher(self._client, self.priority_limits, max_in_flight=self.max_workers)
+            return self._client
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="soliscloud-pool")
+            return self._executor
+
+    def add_account(self, key_id: str, key_secret: str, base_url: str = None, rate: float = None) -> SolisCloud:
+        account = SolisCloud(
+            key_id, key_secret, base_url or self.base_url,
+            client=self.client,
+            rate_limiter=RateLimiter(rate or self.rate, self.burst)
+        )
+        with self._lock:
+            self.accounts[key_id] = account
+        return account
+
+    def remove_account(self, key_id: str) -> Optional[SolisCloud]:
+        with self._lock:
+            return self.accounts.pop(key_id, None)
+
+    def map(self, fn: Callable[[SolisCloud], object], key_ids: list[str] = None) -> PoolResult:
+        """Run ``fn(account)`` for every account in parallel and collect the results.
+
+        A failing account is recorded in ``PoolResult.errors`` and does not
+        affect the others.
+        """
+        with self._lock:
+            accounts = {k: v for k, v in self.accounts.items() if key_ids is None or k in key_ids}
+        result = PoolResult()
+        fn = propagate(fn)
+        futures = {self.executor.submit(fn, account): key_id for key_id, account in accounts.items()}
+        for future in as_completed(futures):
+            key_id = futures[future]
+            try:
+                result.results[key_id] = future.result()
+            except Exception as err:
+                result.errors[key_id] = err
+        return result
+
+    def list_stations(self, **kwargs) -> PoolResult:
+        return self.map(lambda account: account.list_stations(**kwargs))
+
+    def list_inverters(self, **kwargs) -> PoolResult:
+        return self.map(lambda account: account.list_inverters(**kwargs))
+
+    def list_epms(self, **kwargs) -> PoolResult:
+        return self.map(lambda account: account.list_epms(**kwargs))
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+            client, self._client = self._client, None
+        if executor:
+            executor.shutdown(wait=True)
+        if client:
+            client.close()
+
+    def __enter__(self) -> SolisCloudPool:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
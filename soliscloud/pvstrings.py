@@ -0,0 +1,192 @@
+from __future__ import annotations
+from array import array
+from math import nan
+from typing import Iterable, Literal, Optional
+
+MAX_CHANNELS = 32
+
+# Factors to V, A and W for the units SolisCloud reports in the ``*Str`` fields
+UNIT_SCALE = {
+    "": 1.0, "V": 1.0, "mV": 0.001, "kV": 1000.0,
+    "A": 1.0, "mA": 0.001, "kA": 1000.0,
+    "W": 1.0, "kW": 1000.0, "MW": 1000000.0,
+}
+
+_VOLTAGE = [(f"uPv{x}", f"uPv{x}Str") for x in range(1, MAX_CHANNELS + 1)]
+_CURRENT = [(f"iPv{x}", f"iPv{x}Str") for x in range(1, MAX_CHANNELS + 1)]
+_POWER = [(f"pow{x}", f"pow{x}Str") for x in range(1, MAX_CHANNELS + 1)]
+
+Metric = Literal["current", "power"]
+
+
+def _scaled(data: dict, key: str, unit_key: str) -> float:
+    try:
+        value = float(data[key])
+    except (KeyError, TypeError, ValueError):
+        return nan
+    unit = data.get(unit_key)
+    return value * UNIT_SCALE.get(unit, 1.0) if unit else value
+
+
+def _channel_count(data: dict, channels: int) -> int:
+    # dcInputtype is the number of DC inputs minus one; without it, use the
+    # last channel that reports a voltage or current
+    try:
+        return min(int(data["dcInputtype"]) + 1, channels)
+    except (KeyError, TypeError, ValueError):
+        pass
+    count = 0
+    for x in range(0, channels):
+        if data.get(_VOLTAGE[x][0]) or data.get(_CURRENT[x][0]):
+            count = x + 1
+    return count
+
+
+def _median(values: list[float]) -> float:
+    values = sorted(values)
+    size = len(values)
+    if not size:
+        return nan
+    mid = size // 2
+    return values[mid] if size % 2 else (values[mid - 1] + values[mid]) / 2
+
+
+class StringMatrix():
+    def __init__(self, channels: int = MAX_CHANNELS):
+        """PV string (MPPT channel) readings for a fleet of inverters.
+
+        ``voltage``, ``current`` and ``power`` are flat row-major matrices
+        with one row of ``channels`` cells per inverter, normalised to V, A
+        and W when loaded. Cells beyond an inverter's ``counts`` entry (its
+        number of DC inputs) are NaN.
+
+        Args:
+            channels (int): Channels per row (inverters report up to 32)
+        """
+        self.channels: int = min(channels, MAX_CHANNELS)
+        self.sns: list[str] = []
+        self.station_ids: list[str] = []
+        self.counts: array = array('b')
+        self.voltage: array = array('d')
+        self.current: array = array('d')
+        self.power: array = array('d')
+
+    @classmethod
+    def from_inverters(cls, inverters: Iterable, channels: int = MAX_CHANNELS) -> StringMatrix:
+        matrix = cls(channels)
+        matrix.extend(inverters)
+        return matrix
+
+    def extend(self, inverters: Iterable):
+        """Add ``SolisInverter`` objects or inverter detail records (listing records carry no string data)."""
+        channels = self.channels
+        padding = [array('d', [nan]) * (channels - x) for x in range(0, channels + 1)]
+        for inverter in inverters:
+            data = inverter if isinstance(inverter, dict) else inverter.__dict__
+            count = _channel_count(data, channels)
+            self.sns.append(data.get("sn", ""))
+            self.station_ids.append(data.get("stationId", ""))
+            self.counts.append(count)
+            voltage = [_scaled(data, *_VOLTAGE[x]) for x in range(0, count)]
+            current = [_scaled(data, *_CURRENT[x]) for x in range(0, count)]
+            power = [_scaled(data, *_POWER[x]) for x in range(0, count)]
+            for x, value in enumerate(power):
+                # model defaults leave powN at 0 when the record had no power
+                if value != value or (value == 0 and voltage[x] * current[x]):
+                    power[x] = voltage[x] * current[x]
+            for column, values in ((self.voltage, voltage), (self.current, current), (self.power, power)):
+                column.extend(values)
+                column.extend(padding[count])
+
+    def __len__(self) -> int:
+        return len(self.sns)
+
+    def row(self, x: int, metric: str = "current") -> array:
+        """The active channels of inverter ``x`` for ``voltage``, ``current`` or ``power``."""
+        start = x * self.channels
+        return getattr(self, metric)[start:start + self.counts[x]]
+
+
+class StringAnomaly():
+    def __init__(self):
+        self.sn: str = ''
+        self.stationId: str = ''
+        self.channel: int = 0
+        self.value: float = nan
+        self.inverter_median: float = nan
+        self.station_median: float = nan
+        self.inverter_ratio: float = nan
+        self.station_ratio: float = nan
+
+    def __repr__(self) -> str:
+        return f"StringAnomaly({self.sn!r}, channel={self.channel}, value={self.value:g}, inverter_ratio={self.inverter_ratio:.2f}, station_ratio={self.station_ratio:.2f})"
+
+    def _to_json(self) -> dict:
+        return {key: value for key, value in self.__dict__.items() if not key.startswith("_")}
+
+
+def find_underperforming_strings(matrix: StringMatrix, metric: Metric = "current", threshold: float = 0.3, min_value: Optional[float] = None, min_station_peers: int = 3) -> list[StringAnomaly]:
+    """Flag strings producing well below their peers.
+
+    A string is compared with the median of the active strings on its
+    inverter and with the median of all strings at its station; it is
+    flagged when either ratio is below ``1 - threshold``. Peers whose median
+    is below ``min_value`` (night, heavy overcast) are not used, and the
+    station comparison needs at least ``min_station_peers`` strings.
+
+    Current is the default metric because strings of different lengths on
+    one MPPT tracker share current but not voltage or power.
+
+    Args:
+        matrix (StringMatrix): Readings from one poll
+        metric (str): ``current`` (A) or ``power`` (W)
+        threshold (float): Relative shortfall that flags a string
+        min_value (float): Smallest useful peer median (default 0.5 A or 50 W)
+        min_station_peers (int): Strings a station needs for the station comparison
+
+    Returns:
+        list[StringAnomaly]: One entry per flagged string
+    """
+    if metric not in ("current", "power"):
+        raise ValueError(f"Unknown metric {metric!r}")
+    if min_value is None:
+        min_value = 0.5 if metric == "current" else 50.0
+    values = getattr(matrix, metric)
+    channels = matrix.channels
+    limit = 1.0 - threshold
+    rows = []
+    station_values: dict[str, list[float]] = {}
+    for x, count in enumerate(matrix.counts):
+        start = x * channels
+        row = values[start:start + count].tolist()
+        finite = [v for v in row if v == v]
+        rows.append((row, _median(finite) if len(finite) > 1 else nan))
+        if finite:
+            station_values.setdefault(matrix.station_ids[x], []).extend(finite)
+    station_medians = {
+        key: _median(items) for key, items in station_values.items() if len(items) >= min_station_peers
+    }
+    anomalies = []
+    for x, (row, inverter_median) in enumerate(rows):
+        station_median = station_medians.get(matrix.station_ids[x], nan)
+        use_inverter = inverter_median >= min_value
+        use_station = station_median >= min_value
+        if not use_inverter and not use_station:
+            continue
+        for channel, value in enumerate(row):
+            if value != value:
+                continue
+            inverter_ratio = value / inverter_median if use_inverter else nan
+            station_ratio = value / station_median if use_station else nan
+            if inverter_ratio < limit or station_ratio < limit:
+                anomaly = StringAnomaly()
+                anomaly.sn = matrix.sns[x]
+                anomaly.stationId = matrix.station_ids[x]
+                anomaly.channel = channel + 1
+                anomaly.value = value
+                anomaly.inverter_median = inverter_median
+                anomaly.station_median = station_median
+                anomaly.inverter_ratio = inverter_ratio
+                anomaly.station_ratio = station_ratio
+                anomalies.append(anomaly)
+    return anomalies
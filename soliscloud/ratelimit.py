@@ -0,0 +1,89 @@
+from __future__ import annotations
+from typing import Optional
+import threading
+import time
+
+
+class RateLimiter():
+    """Thread-safe token bucket.
+
+    Args:
+        rate (float): Tokens added per second
+        burst (int): Bucket size, i.e. how many requests may go out back to back
+    """
+    def __init__(self, rate: float, burst: int = 1, clock=time.monotonic, sleep=time.sleep):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate: float = rate
+        self.burst: int = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens: float = float(self.burst)
+        self._updated: float = clock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        with self._lock:
+            self._refill(self._clock())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def reserve(self, tokens: float = 1):
+        """Take ``tokens`` straight away, running the bucket into debt if it is empty; later callers wait until it is repaid."""
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= tokens
+
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else self._clock() + timeout
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                wait = (tokens - self._tokens) / self.rate
+            if deadline is not None:
+                if now + wait > deadline:
+                    return False
+            self._sleep(wait)
+
+
+class SharedRateLimiter():
+    """Rate limiter shared by several processes.
+
+    Each request reserves the next free slot on a wall-clock schedule kept in
+    shared memory, so the combined rate of all processes never exceeds
+    ``rate``. Create it in the parent and pass it to the worker processes.
+    """
+    def __init__(self, rate: float, ctx=None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if ctx is None:
+            import multiprocessing as ctx
+        self.rate: float = rate
+        self._next = ctx.Value('d', 0.0, lock=False)
+        self._lock = ctx.Lock()
+
+    def reserve(self, tokens: float = 1):
+        """Take ``tokens`` straight away, pushing the next free slot back for everyone else."""
+        with self._lock:
+            self._next.value = max(time.time(), self._next.value) + tokens / self.rate
+
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = None) -> bool:
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._next.value)
+            if timeout is not None and slot - now > timeout:
+                return False
+            self._next.value = slot + tokens / self.rate
+        if slot > now:
+            time.sleep(slot - now)
+        return True
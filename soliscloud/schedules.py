@@ -0,0 +1,140 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
+import threading
+import time
+import weakref
+from soliscloud.deadline import propagate
+from soliscloud.models import ChargeDischargeSchedule, SolisSetResult
+
+if TYPE_CHECKING:
+    from soliscloud.soliscloud import SolisCloud
+
+
+class ScheduleCache():
+    def __init__(self, cloud: SolisCloud, ttl: float = 3600.0, clock: Callable[[], float] = time.monotonic):
+        """Caches charge / discharge schedules by inverter serial number.
+
+        Schedules read through the cache are frozen and interned: every
+        inverter running the same schedule shares one ``ChargeDischargeSchedule``
+        object, so a fleet holds a handful of templates rather than one copy per
+        inverter, and ``group_by_schedule`` is a dict lookup per inverter.
+        Interned templates are dropped once no cache entry or caller holds them.
+
+        Args:
+            cloud (SolisCloud): Client used to read schedules
+            ttl (float): Seconds a cached schedule stays valid
+            clock (Callable): Monotonic clock, replaceable in tests
+        """
+        self.cloud: SolisCloud = cloud
+        self.ttl: float = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[float, Optional[ChargeDischargeSchedule]]] = {}
+        self._templates: weakref.WeakValueDictionary[str, ChargeDischargeSchedule] = weakref.WeakValueDictionary()
+
+    def intern(self, schedule: Optional[ChargeDischargeSchedule]) -> Optional[ChargeDischargeSchedule]:
+        """Return the shared frozen instance equal to ``schedule``."""
+        if schedule is None:
+            return None
+        value = schedule.to_value()
+        with self._lock:
+            template = self._templates.get(value)
+            if template is None:
+                template = schedule if schedule.frozen else schedule.copy()
+                self._templates[value] = template.freeze()
+        return template
+
+    def put(self, sn: str, schedule: Optional[ChargeDischargeSchedule]) -> Optional[ChargeDischargeSchedule]:
+        schedule = self.intern(schedule)
+        with self._lock:
+            self._entries[sn] = (self._clock() + self.ttl, schedule)
+        return schedule
+
+    def _lookup(self, sn: str) -> tuple[bool, Optional[ChargeDischargeSchedule]]:
+        with self._lock:
+            entry = self._entries.get(sn)
+        if entry is not None and entry[0] > self._clock():
+            return True, entry[1]
+        return False, None
+
+    def peek(self, sn: str) -> Optional[ChargeDischargeSchedule]:
+        """The cached schedule for ``sn`` if it has not expired, without reading it."""
+        return self._lookup(sn)[1]
+
+    def get(self, sn: str, refresh: bool = False) -> Optional[ChargeDischargeSchedule]:
+        """The schedule of one inverter, read from SolisCloud when missing or expired.
+
+        Args:
+            sn (str): Inverter serial number
+            refresh (bool): Ignore the cached entry
+
+        Returns:
+            ChargeDischargeSchedule: A frozen, shared schedule (``copy()`` it to edit)
+        """
+        if not refresh:
+            hit, schedule = self._lookup(sn)
+            if hit:
+                return schedule
+        return self.put(sn, self.cloud.get_charge_discharge_schedule(sn))
+
+    def get_many(self, sns: Iterable[str], max_workers: int = 8, refresh: bool = False) -> tuple[dict[str, Optional[ChargeDischargeSchedule]], dict[str, Exception]]:
+        """Schedules for many inverters; only missing or expired entries are read.
+
+        Returns:
+            tuple[dict, dict]: schedules by serial number, and the errors of the reads that failed
+        """
+        schedules, errors, missing = {}, {}, []
+        for sn in dict.fromkeys(sns):
+            hit, schedule = (False, None) if refresh else self._lookup(sn)
+            if hit:
+                schedules[sn] = schedule
+            else:
+                missing.append(sn)
+        if missing:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(missing)))) as executor:
+                get = propagate(self.get)
+                futures = {sn: executor.submit(get, sn, True) for sn in missing}
+                for sn, future in futures.items():
+                    try:
+                        schedules[sn] = future.result()
+                    except Exception as err:
+                        errors[sn] = err
+        return schedules, errors
+
+    def set(self, id: str, sn: str, schedule: ChargeDischargeSchedule) -> SolisSetResult:
+        """Write a schedule to the inverter and, on success, to the cache."""
+        result = self.cloud.set_inverter_charge_discharge_schedule(id, sn, schedule)
+        if result.success:
+            self.put(sn, schedule)
+        else:
+            self.invalidate(sn)
+        return result
+
+    def group_by_schedule(self, sns: Optional[Iterable[str]] = None) -> dict[ChargeDischargeSchedule, list[str]]:
+        """Serial numbers grouped by their cached, unexpired schedule (inverters without one are left out)."""
+        now = self._clock()
+        with self._lock:
+            entries = self._entries if sns is None else {sn: self._entries[sn] for sn in sns if sn in self._entries}
+            groups: dict[ChargeDischargeSchedule, list[str]] = {}
+            for sn, (expires, schedule) in entries.items():
+                if schedule is not None and expires > now:
+                    groups.setdefault(schedule, []).append(sn)
+        return groups
+
+    def templates(self) -> list[ChargeDischargeSchedule]:
+        with self._lock:
+            return list(self._templates.values())
+
+    def invalidate(self, sn: Optional[str] = None):
+        with self._lock:
+            if sn is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(sn, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, sn: str) -> bool:
+        return self._lookup(sn)[0]
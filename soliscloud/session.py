@@ -0,0 +1,29 @@
+from __future__ import annotations
+from requests import Session
+
+
+class RequestsSession(Session):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rate_limited: int = 0
+
+    def request(self, method, url, **kwargs):
+        # retries are made by SolisCloud so that every attempt is signed afresh
+        response = super().request(method, url, **kwargs)
+
+        if response.status_code == 429:
+            self.rate_limited += 1
+
+        return response
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request('PUT', url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('DELETE', url, **kwargs)
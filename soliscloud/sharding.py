@@ -0,0 +1,146 @@
+from __future__ import annotations
+from queue import Empty
+from typing import Callable, Iterable, Iterator, Literal, Optional
+import json
+import zlib
+from soliscloud.ratelimit import SharedRateLimiter
+from soliscloud.soliscloud import SolisCloud
+
+Partition = Literal["sn", "station"]
+
+
+def shard_for(key: str, shards: int) -> int:
+    """Stable shard number for ``key`` (unlike ``hash()``, identical in every process)."""
+    return zlib.crc32(str(key).encode()) % shards
+
+
+def _target(item) -> tuple[str, str, str]:
+    if isinstance(item, dict):
+        return item.get("id", ""), item.get("sn", ""), item.get("stationId", "")
+    if isinstance(item, (tuple, list)):
+        return (tuple(item) + ("", "", ""))[:3]
+    return getattr(item, "id", ""), getattr(item, "sn", ""), getattr(item, "stationId", "")
+
+
+def partition_targets(targets: Iterable, shards: int, partition: Partition = "sn") -> list[list[tuple[str, str, str]]]:
+    """Split inverters into ``shards`` groups.
+
+    ``targets`` may hold ``SolisInverter`` objects, inverter records (dicts) or
+    ``(id, sn[, stationId])`` tuples. With ``partition="station"`` all
+    inverters of a station land in the same shard.
+    """
+    groups = [[] for _ in range(0, shards)]
+    for item in targets:
+        target = _target(item)
+        key = target[2] if partition == "station" and target[2] else target[1]
+        groups[shard_for(key, shards)].append(target)
+    return groups
+
+
+def encode_message(message: list) -> bytes:
+    return json.dumps(message, separators=(',',':')).encode()
+
+
+def decode_message(payload: bytes) -> list:
+    return json.loads(payload)
+
+
+def _poll_shard(shard: int, key_id: str, key_secret: str, base_url: str, targets: list, fields: Optional[list[str]], limiter, queue, client_factory: Optional[Callable[[], SolisCloud]]):
+    if client_factory:
+        client = client_factory()
+    else:
+        client = SolisCloud(key_id, key_secret, base_url, coalesce_requests=False)
+    client.rate_limiter = limiter
+    for id, sn, _ in targets:
+        try:
+            data = client.get_inverter_detail_data(id, sn)
+            values = [data.get(x) for x in fields] if fields else data
+            message = [id, sn, values, None]
+        except Exception as err:
+            message = [id, sn, None, str(err) or err.__class__.__name__]
+        queue.put(encode_message(message))
+    queue.put(encode_message([shard]))
+
+
+class ShardedPoller():
+    def __init__(self, key_id: str, key_secret: str, base_url: str = "https://www.soliscloud.com:13333", processes: int = 4, rate: float = 2.0, partition: Partition = "sn", mp_context=None, client_factory: Optional[Callable[[], SolisCloud]] = None):
+        """Polls inverter details for very large fleets from several processes.
+
+        Inverters are partitioned across ``processes`` worker processes, each
+        with its own SolisCloud session. All workers draw from one
+        ``SharedRateLimiter`` so the fleet stays within a single rate budget.
+        Workers send each result back as compact JSON bytes (a field list, not
+        a pickled model object), which the parent streams to the caller.
+
+        Args:
+            key_id (str): Your Key ID as provided in your SolisCloud account
+            key_secret (str): Your Key Secret as provided in your SolisCloud account
+            base_url (str): The Base URL for SolisCloud API
+            processes (int): Number of worker processes (shards)
+            rate (float): Requests per second allowed across all workers
+            partition (str): ``sn`` to spread inverters by serial hash, ``station`` to keep stations together
+            mp_context: A ``multiprocessing`` context, e.g. ``multiprocessing.get_context("spawn")``
+            client_factory (Callable): Builds the SolisCloud client inside each worker (must be picklable under spawn)
+        """
+        if mp_context is None:
+            import multiprocessing as mp_context
+        self.key_id: str = key_id
+        self.key_secret: str = key_secret
+        self.base_url: str = base_url
+        self.processes: int = max(1, processes)
+        self.rate: float = rate
+        self.partition: Partition = partition
+        self.client_factory = client_factory
+        self._ctx = mp_context
+
+    def poll(self, targets: Iterable, fields: Optional[list[str]] = None, poll_interval: float = 0.5) -> Iterator[tuple[str, str, Optional[dict], Optional[str]]]:
+        """Fetch inverter details for every target, yielding results as they arrive.
+
+        Args:
+            targets (Iterable): ``SolisInverter`` objects, inverter records or ``(id, sn[, stationId])`` tuples
+            fields (list[str]): Only transfer these detail fields (default: all)
+
+        Yields:
+            tuple: ``(id, sn, data, error)``; ``data`` is the detail record (restricted to
+            ``fields``) or ``None`` when ``error`` describes why the inverter failed.
+        """
+        groups = partition_targets(targets, self.processes, self.partition)
+        limiter = SharedRateLimiter(self.rate, self._ctx)
+        queue = self._ctx.Queue()
+        workers = {}
+        for shard, group in enumerate(groups):
+            if not group:
+                continue
+            process = self._ctx.Process(
+                target=_poll_shard,
+                args=(shard, self.key_id, self.key_secret, self.base_url, group, fields, limiter, queue, self.client_factory),
+                daemon=True
+            )
+            process.start()
+            workers[shard] = process
+        pending = {shard: {(x[0], x[1]) for x in groups[shard]} for shard in workers}
+        shard_of = {(x[0], x[1]): shard for shard in workers for x in groups[shard]}
+        try:
+            while pending:
+                try:
+                    message = decode_message(queue.get(timeout=poll_interval))
+                except Empty:
+                    for shard in [x for x in pending if not workers[x].is_alive()]:
+                        for id, sn in pending.pop(shard):
+                            yield id, sn, None, f"Worker for shard {shard} exited with code {workers[shard].exitcode}"
+                    continue
+                if len(message) == 1:
+                    pending.pop(message[0], None)
+                    continue
+                id, sn, values, error = message
+                shard = shard_of.get((id, sn))
+                if shard in pending:
+                    pending[shard].discard((id, sn))
+                if values is not None and fields:
+                    values = dict(zip(fields, values))
+                yield id, sn, values, error
+        finally:
+            for process in workers.values():
+                if process.is_alive():
+                    process.terminate()
+                process.join()
@@ -0,0 +1,248 @@
+from __future__ import annotations
+from operator import itemgetter
+from struct import Struct
+from typing import Optional, Union
+import json
+import zlib
+from soliscloud.models import SolisEPM, SolisInverter, SolisStation
+
+MAGIC = b"SC"
+VERSION = 1
+FLAG_DELTA = 1
+FLAG_ZLIB = 2
+# Attributes holding related objects rather than telemetry are not part of a snapshot
+EXCLUDED_FIELDS = {"inverters", "charge_discharge_schedule"}
+
+_HEADER = Struct("<2sBBI")
+_DOUBLE = Struct("<d")
+
+TAG_NONE = 0
+TAG_FALSE = 1
+TAG_TRUE = 2
+TAG_INT = 3
+TAG_FLOAT = 4
+TAG_STR = 5
+TAG_JSON = 6
+TAG_EMPTY_STR = 7
+TAG_ZERO = 8
+TAG_ZERO_FLOAT = 9
+
+
+class SnapshotError(Exception):
+    def __init__(self, *args):
+        super().__init__(*args)
+
+
+def _write_varint(out: bytearray, value: int):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _write_value(out: bytearray, value):
+    if value is None:
+        out.append(TAG_NONE)
+    elif value is True:
+        out.append(TAG_TRUE)
+    elif value is False:
+        out.append(TAG_FALSE)
+    elif isinstance(value, int):
+        if value == 0:
+            out.append(TAG_ZERO)
+        else:
+            out.append(TAG_INT)
+            _write_varint(out, value << 1 if value > 0 else ((-value) << 1) - 1)
+    elif isinstance(value, float):
+        if value == 0.0:
+            out.append(TAG_ZERO_FLOAT)
+        else:
+            out.append(TAG_FLOAT)
+            out += _DOUBLE.pack(value)
+    elif isinstance(value, str):
+        if not value:
+            out.append(TAG_EMPTY_STR)
+        else:
+            raw = value.encode()
+            out.append(TAG_STR)
+            _write_varint(out, len(raw))
+            out += raw
+    else:
+        raw = json.dumps(value, separators=(',',':')).encode()
+        out.append(TAG_JSON)
+        _write_varint(out, len(raw))
+        out += raw
+
+
+def _read_value(data: bytes, pos: int) -> tuple[object, int]:
+    tag = data[pos]
+    pos += 1
+    if tag == TAG_STR or tag == TAG_JSON:
+        length, pos = _read_varint(data, pos)
+        raw = bytes(data[pos:pos + length])
+        pos += length
+        return (raw.decode() if tag == TAG_STR else json.loads(raw)), pos
+    if tag == TAG_INT:
+        value, pos = _read_varint(data, pos)
+        return (-((value + 1) >> 1) if value & 1 else value >> 1), pos
+    if tag == TAG_FLOAT:
+        return _DOUBLE.unpack_from(data, pos)[0], pos + 8
+    if tag == TAG_ZERO:
+        return 0, pos
+    if tag == TAG_ZERO_FLOAT:
+        return 0.0, pos
+    if tag == TAG_EMPTY_STR:
+        return "", pos
+    if tag == TAG_NONE:
+        return None, pos
+    if tag == TAG_TRUE:
+        return True, pos
+    if tag == TAG_FALSE:
+        return False, pos
+    raise SnapshotError(f"Unknown value tag {tag}")
+
+
+class SnapshotCodec():
+    """Binary encoding for one model class.
+
+    Field ids are the positions of the model's attributes in definition
+    order, and the schema fingerprint (a crc32 of the field names) is stored
+    in every frame so frames are never decoded against a different schema.
+    A frame only carries the fields that differ from its base: the model's
+    defaults for a full snapshot, or the previous snapshot for a delta.
+    """
+    def __init__(self, model_cls: type):
+        template = model_cls(None)
+        defaults = {key: value for key, value in template._to_json().items() if key not in EXCLUDED_FIELDS}
+        self.model_cls: type = model_cls
+        self.fields: list[str] = list(defaults)
+        self.field_ids: dict[str, int] = {key: x for x, key in enumerate(self.fields)}
+        self.defaults: list = [defaults[x] for x in self.fields]
+        self.fingerprint: int = zlib.crc32("\n".join([model_cls.__name__] + self.fields).encode())
+        self._getter = itemgetter(*self.fields)
+
+    def _values(self, obj: Union[dict, object]) -> list:
+        data = obj if isinstance(obj, dict) else obj._to_json()
+        try:
+            return list(self._getter(data))
+        except KeyError:
+            return [data.get(key, default) for key, default in zip(self.fields, self.defaults)]
+
+    def encode(self, obj: Union[dict, object], previous: Optional[Union[dict, object]] = None, compress: bool = False) -> bytes:
+        """Encode a model object (or its ``_to_json()`` dict) into a frame.
+
+        Args:
+            obj: The snapshot to encode
+            previous: The previous snapshot of the same device; when given a delta frame is written
+            compress (bool): zlib-compress the frame body
+        """
+        values = self._values(obj)
+        base = self.defaults if previous is None else self._values(previous)
+        body = bytearray()
+        changed = [x for x, (a, b) in enumerate(zip(values, base)) if a != b or type(a) is not type(b)]
+        _write_varint(body, len(changed))
+        last = 0
+        for x in changed:
+            _write_varint(body, x - last)
+            last = x
+            _write_value(body, values[x])
+        flags = (FLAG_DELTA if previous is not None else 0)
+        if compress:
+            body = zlib.compress(bytes(body))
+            flags |= FLAG_ZLIB
+        return _HEADER.pack(MAGIC, VERSION, flags, self.fingerprint) + bytes(body)
+
+    def decode(self, payload: bytes, previous: Optional[Union[dict, object]] = None) -> dict:
+        """Decode a frame into a ``_to_json()``-style dict; delta frames need the previous snapshot."""
+        magic, version, flags, fingerprint = _HEADER.unpack_from(payload, 0)
+        if magic != MAGIC or version != VERSION:
+            raise SnapshotError("Not a snapshot frame")
+        if fingerprint != self.fingerprint:
+            raise SnapshotError(f"Frame was written for a different {self.model_cls.__name__} schema")
+        body = memoryview(payload)[_HEADER.size:]
+        if flags & FLAG_ZLIB:
+            body = zlib.decompress(body)
+        if flags & FLAG_DELTA:
+            if previous is None:
+                raise SnapshotError("Delta frame decoded without a previous snapshot")
+            values = self._values(previous)
+        else:
+            values = list(self.defaults)
+        count, pos = _read_varint(body, 0)
+        field = 0
+        for _ in range(0, count):
+            step, pos = _read_varint(body, pos)
+            field += step
+            values[field], pos = _read_value(body, pos)
+        return dict(zip(self.fields, values))
+
+    def decode_into(self, payload: bytes, obj: object, previous: Optional[Union[dict, object]] = None) -> object:
+        return obj._from_json(self.decode(payload, previous))
+
+
+_CODECS: dict[type, SnapshotCodec] = {}
+
+
+def codec_for(model_cls: type) -> SnapshotCodec:
+    codec = _CODECS.get(model_cls)
+    if codec is None:
+        codec = _CODECS[model_cls] = SnapshotCodec(model_cls)
+    return codec
+
+
+class SnapshotEncoder():
+    """Stateful encoder for a stream of polls.
+
+    Keeps the last snapshot per device and writes delta frames against it,
+    with a full frame every ``keyframe_interval`` snapshots so a stream can
+    be read from any keyframe.
+    """
+    def __init__(self, model_cls: type = SolisInverter, keyframe_interval: int = 96, compress: bool = False):
+        self.codec: SnapshotCodec = codec_for(model_cls)
+        self.keyframe_interval: int = keyframe_interval
+        self.compress: bool = compress
+        self._last: dict[str, tuple[dict, int]] = {}
+
+    def encode(self, key: str, obj: Union[dict, object]) -> bytes:
+        data = obj if isinstance(obj, dict) else obj._to_json()
+        previous, count = self._last.get(key, (None, 0))
+        if count % self.keyframe_interval == 0:
+            previous = None
+        frame = self.codec.encode(data, previous, self.compress)
+        self._last[key] = (data, count + 1)
+        return frame
+
+
+class SnapshotDecoder():
+    def __init__(self, model_cls: type = SolisInverter):
+        self.codec: SnapshotCodec = codec_for(model_cls)
+        self._last: dict[str, dict] = {}
+
+    def decode(self, key: str, payload: bytes) -> dict:
+        data = self.codec.decode(payload, self._last.get(key))
+        self._last[key] = data
+        return data
+
+
+def encode_inverter(inverter: Union[SolisInverter, dict], previous=None, compress: bool = False) -> bytes:
+    return codec_for(SolisInverter).encode(inverter, previous, compress)
+
+
+def encode_station(station: Union[SolisStation, dict], previous=None, compress: bool = False) -> bytes:
+    return codec_for(SolisStation).encode(station, previous, compress)
+
+
+def encode_epm(epm: Union[SolisEPM, dict], previous=None, compress: bool = False) -> bytes:
+    return codec_for(SolisEPM).encode(epm, previous, compress)
@@ -1,1309 +1,143 @@
 from __future__ import annotations
-from requests import Session
-from datetime import datetime, time, date, timezone
-from base64 import b64encode
-from typing import Optional, Literal
-import hashlib
-import pytz
-import hmac
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, time, date
+from importlib import import_module
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 import json
-from requests.exceptions import RequestException
-from tenacity import retry, stop_after_attempt, wait_fixed, wait_exponential
-
-
-EPMFields = Literal["u_ac1","u_ac2","u_ac3","i_ac1","i_ac2","i_ac3","p_ac1","p_ac2","p_ac3","power_factor","fac_meter","p_load","e_total_inverter","e_total_load","e_total_buy","e_total_sell"]
-
-class StatusVo():
+import sys
+import threading
+from soliscloud.concurrency import AdaptiveConcurrency, RateLimitCounter
+from soliscloud.deadline import Deadline, current_deadline, propagate
+from soliscloud.endpoints import (
+    Endpoint, EndpointRequest, Middleware, build_pipeline, STATION_LIST, STATION_DETAIL, STATION_DAY, STATION_MONTH,
+    STATION_YEAR, EPM_LIST, EPM_DETAIL, EPM_DAY, EPM_MONTH, EPM_YEAR, COLLECTOR_LIST, ALARM_LIST, INVERTER_LIST,
+    INVERTER_DETAIL, INVERTER_DAY, INVERTER_MONTH, INVERTER_YEAR, CONTROL, AT_READ
+)
+from soliscloud.exceptions import SolisConnectException, SolisTimeoutException
+from soliscloud.ratelimit import RateLimiter
+from soliscloud.signing import RequestSigner
+
+if TYPE_CHECKING:
+    from soliscloud.models import (
+        EPMFields, StatusVo, SolisStation, EPMDayData, EPMMonthYearData, SolisEPM, SolisInverter,
+        ChargeDischargeSchedule, SolisSetResult, SolisCollector, HistoryData, SolisAlarm
+    )
+
+# the models are imported where they are first needed, so creating a client
+# does not load them; these names stay importable from this module
+_MODEL_NAMES = frozenset((
+    "EPMFields", "StatusVo", "SolisStation", "EPMDataDayItem", "EPMDataMonthYearItem", "EPMDayData", "EPMMonthYearData",
+    "SolisEPM", "SolisStations", "SolisInverter", "ScheduleDateTime", "ScheduleDate", "ChargeData", "Schedule",
+    "ChargeDischargeSchedule", "SolisSetResult", "SolisCollector", "HistoryData", "SolisAlarm"
+))
+
+
+def __getattr__(name):
+    if name in _MODEL_NAMES:
+        return getattr(import_module("soliscloud.models"), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+PERIOD_KEYS = {"day": "time", "month": "month", "year": "year"}
+
+
+def history_periods(start: date, end: date, period: str = "day") -> list[date]:
+    """Every day, or the first day of every month / year, from ``start`` to ``end`` inclusive."""
+    if period not in PERIOD_KEYS:
+        raise ValueError(f"Unknown period {period!r}")
+    periods = []
+    if period == "day":
+        current = start
+        while current <= end:
+            periods.append(current)
+            current = date.fromordinal(current.toordinal() + 1)
+    elif period == "month":
+        year, month = start.year, start.month
+        while (year, month) <= (end.year, end.month):
+            periods.append(date(year, month, 1))
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    else:
+        periods = [date(year, 1, 1) for year in range(start.year, end.year + 1)]
+    return periods
+
+
+def _not_sent(err: OSError) -> bool:
+    """Whether ``err`` was raised before the request could reach the server (a connect failure)."""
+    requests = sys.modules.get("requests")
+    if requests is not None:
+        if isinstance(err, requests.exceptions.ConnectTimeout):
+            return True
+        if isinstance(err, requests.exceptions.Timeout):
+            # a read timeout: the server may have acted on the request
+            return False
+        if isinstance(err, requests.exceptions.ConnectionError):
+            return True
+    return isinstance(err, ConnectionRefusedError)
+
+
+class _InFlightCall():
     def __init__(self):
-        self.all: int = 0
-        self.normal: int = 0
-        self.fault: int = 0
-        self.offline: int = 0
-        self.building: int = 0
-        self.mppt: int = 0
-    
-    def _from_json(self, json_data) -> StatusVo:
-        if json_data:
-            for key, value in json_data.items():
-                if hasattr(self, key):
-                    setattr(self, key, value)
-        return self
-    
-    def _to_json(self) -> dict:
-        return {key: value for key, value in self.__dict__.items() if not key.startswith("_")}
-
-
-class SolisConnectException(Exception):
-    def __init__(self, *args):
-        super().__init__(*args)
-
-
-class SolisStation():
-    def __init__(self, __parent__: SolisCloud = None):
-        self.__parent__: SolisCloud = __parent__
-        self.inverters: Optional[list[SolisInverter]] = None
-        self.accessTime: int = 0
-        self.accessTimeStr: str = ""
-        self.addrOrigin: str = ""
-        self.alarmCount: int = 0
-        self.alarmLongStr: str = ""
-        self.allEnergy: float = 0.0
-        self.allEnergy1: float = 0.0
-        self.allEnergyStr: str = ""
-        self.allIncome: float = 0.0
-        self.azimuth: float = 0.0
-        self.batteryTodayChargeEnergy: float = 0.0
-        self.batteryTodayDischargeEnergy: float = 0.0
-        self.batteryTotalChargeEnergy: float = 0.0
-        self.batteryTotalDischargeEnergy: float = 0.0
-        self.capacity: float = 0.0
-        self.capacity1: float = 0.0
-        self.capacityPercent: float = 0.0
-        self.capacityStr: str = ""
-        self.chargerCount: int = 0
-        self.city: str = ""
-        self.cityStr: str = ""
-        self.condCodeD: str = ""
-        self.condTxtD: str = ""
-        self.connectTime: int = 0
-        self.connectTimeStr: str = ""
-        self.country: str = ""
-        self.countryStr: str = ""
-        self.createDate: int = 0
-        self.createDateStr: str = ""
-        self.dataTimestamp: str = ""
-        self.dataTimestampStr: str = ""
-        self.dayEnergy: float = 0.0
-        self.dayEnergy1: float = 0.0
-        self.dayEnergyStr: str = ""
-        self.dayIncome: float = 0.0
-        self.dayPowerGeneration: float = 0.0
-        self.daylight: int = 0
-        self.dcInputType: int = 0
-        self.dip: float = 0.0
-        self.epmCount: int = 0
-        self.epmType: int = 0
-        self.fisGenerateTime: int = 0
-        self.fisGenerateTimeStr: str = ""
-        self.fisPowerTime: int = 0
-        self.fisPowerTimeStr: str = ""
-        self.fullHour: float = 0.0
-        self.gridPurchasedTodayEnergy: float = 0.0
-        self.gridPurchasedTotalEnergy: float = 0.0
-        self.gridSellTodayEnergy: float = 0.0
-        self.gridSellTotalEnergy: float = 0.0
-        self.gridSwitch: int = 0
-        self.gridSwitch1: int = 0
-        self.groupId: str = ""
-        self.homeLoadTodayEnergy: float = 0.0
-        self.homeLoadTotalEnergy: float = 0.0
-        self.id: str = ""
-        self.installer: str = ""
-        self.inverterCount: int = 0
-        self.inverterOnlineCount: int = 0
-        self.inverterStateOrder: int = 0
-        self.jxbType: int = 0
-        self.module: str = ""
-        self.money: str = ""
-        self.monthCarbonDioxide: float = 0.0
-        self.monthEnergy: float = 0.0
-        self.monthEnergy1: float = 0.0
-        self.monthEnergyStr: str = ""
-        self.oneSelf: float = 0.0
-        self.oneSelfTotal: float = 0.0
-        self.pic1Url: str = ""
-        self.picName: str = ""
-        self.power: float = 0.0
-        self.power1: float = 0.0
-        self.powerStr: str = ""
-        self.price: float = 0.0
-        self.region: str = ""
-        self.regionStr: str = ""
-        self.shareProcess: int = 0
-        self.simFlowState: int = 0
-        self.sno: str = ""
-        self.state: int = 0
-        self.stationName: str = ""
-        self.stationTypeNew: int = 0
-        self.synchronizationType: int = 0
-        self.timeZone: float = 0.0
-        self.timeZoneId: str = ""
-        self.timeZoneName: str = ""
-        self.timeZoneStr: str = ""
-        self.type: int = 0
-        self.updateDate: int = 0
-        self.userId: str = ""
-        self.yearEnergy: float = 0.0
-        self.yearEnergy1: float = 0.0
-        self.yearEnergyStr: str = ""
-
-    def _from_json(self, json_data) -> SolisStation:
-        for key, value in json_data.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
-        return self
-    
-    def _to_json(self) -> dict:
-        return {key: value for key, value in self.__dict__.items() if not key.startswith("_")}
-    
-    def list_inverters(self) -> list[SolisInverter]:
-        if self.__parent__:
-            self.inverters = self.__parent__.list_inverters(stationId=self.id)
-            return self.inverters
+        self.done: threading.Event = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
 
 
-class EPMDataDayItem():
+class SingleFlight():
+    """Runs at most one call per key at a time. Callers asking for a key that is
+    already in flight wait for it and share its result (or its exception).
+    A leader that ran out of time is not shared: its waiters try again, each
+    under its own deadline.
+    """
     def __init__(self):
-        self.alarm_count: int = 0
-        self.current_state: int = 0
-        self.datetime: datetime
-        self.e_total_buy: float = 0.0
-        self.e_total_inverter: float = 0.0
-        self.e_total_load: float = 0.0
-        self.e_total_sell: float = 0.0
-        self.fac_meter: float = 0.0
-        self.fault_bit: int = 0
-        self.i_ac1: float = 0.0
-        self.i_ac2: float = 0.0
-        self.i_ac3: float = 0.0
-        self.is_relatime: float = 0.0
-        self.p_ac1: float = 0.0
-        self.p_ac2: float = 0.0
-        self.p_ac3: float = 0.0
-        self.power_factor: int = 0
-        self.u_ac1: float = 0.0
-        self.u_ac2: float = 0.0
-        self.u_ac3: float = 0.0
-        self.state: int = 0
-    
-    def _to_json_(self) -> dict:
-        json_obj = {}
-        for k, v in dict(sorted(self.__dict__.items())):
-            if not k.startswith("_"):
-                json_obj[k] = v
-        return json_obj
-    
-    def _from_json_(self, json_obj: dict) -> EPMDataDayItem:
-        if isinstance(json_obj, dict):
-            for k, v in json_obj.items():
-                if hasattr(self, k):
-                    setattr(self, k, v)
-        return self
-
-
-class EPMDataMonthYearItem:
-    def __init__(self):
-        self.backUpEnergy: int = 0
-        self.consumeEnergy: int = 0
-        self.date: int = 0
-        self.datetime: datetime = None
-        self.dateStr: str = ""
-        self.directR: int = 0
-        self.directRKwh: int = 0
-        self.energy: float = 0.0
-        self.energyPec: str = ""
-        self.energyStr: str = ""
-        self.epmBuyEnergy: float = 0.0
-        self.epmLoadEnergy: float = 0.0
-        self.epmSellEnergy: float = 0.0
-        self.errorFlag: int = 0
-        self.generatorEnergy: float = 0.0
-        self.generatorPercent: float = 0.0
-        self.gridBatteryE: int = 0
-        self.gridPurchasedEnergy: int = 0
-        self.gridPurchasedIncome: float = 0.0
-        self.gridPurchasedPercent: float = 0.0
-        self.gridSellEnergy: int = 0
-        self.gridSellIncome: float = 0.0
-        self.homeGridEnergy: int = 0
-        self.id: str = ""
-        self.invAcE: int = 0
-        self.money: float = 0.0
-        self.oneSelfPercent: float = 0.0
-        self.produceEnergy: int = 0
-        self.systemEfficiency: int = 0
-        self.timeZone: int = 0
-        self.toConsumption: int = 0
-        self.toGrid: int = 0
-        self.totalR: int = 0
-        self.totalRKwh: int = 0
-
-    def _from_json_(self, json_obj: dict):
-        for key in json_obj:
-            if hasattr(self, key):
-                setattr(self, key, json_obj[key])
-            if key == "date":
-                self.datetime = datetime.fromtimestamp(int(json_obj[key]) / 1000)
-
-    def _to_json_(self) -> dict:
-        json_obj = {}
-        for k, v in self.__dict__.items():
-            if k == "datetime":
+        self._lock = threading.Lock()
+        self._calls: dict[str, _InFlightCall] = {}
+        self.shared: int = 0
+
+    def do(self, key: str, fn, deadline: Optional[Deadline] = None):
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = _InFlightCall()
+                    self._calls[key] = call
+                else:
+                    self.shared += 1
+            if leader:
+                break
+            if deadline is None:
+                call.done.wait()
+            else:
+                deadline.wait(call.done)
+            if isinstance(call.error, SolisTimeoutException):
+                # the leader's deadline (or cancellation) is not ours
                 continue
-            if not k.startswith("_"):
-                json_obj[k] = v
-        return json_obj
-
-
-class EPMDayData():
-    def __init__(self):
-        self.formatted_data: list[EPMDataDayItem] = []
-
-    def _from_json_(self, json_data: dict) -> EPMDayData:
-        if json_data:
-            keys = [x for x in json_data.keys()]
-            if "data_timestamp" in keys:
-                data_timestamp = json_data.get('data_timestamp', [])
-                keys.remove('data_timestamp')                
-                for x in range(0, len(data_timestamp)):
-                    try:
-                        dt_dt = datetime.fromtimestamp(int(data_timestamp[x])/ 1000)
-                        epm = EPMDataDayItem()
-                        epm.datetime = dt_dt
-                        for key in keys:
-                            if hasattr(epm, key):
-                                setattr(epm, key, json_data[key][x])
-                        self.formatted_data.append(epm)
-                    except Exception as err:
-                        pass
-        return self
-    
-    def convert_to_json(self) -> dict:
-        json_obj = {}
-        for item in self.formatted_data:
-            json_obj[item.datetime.isoformat()] = item._to_json_()
-        return dict(sorted(json_obj.items()))
-
-
-class EPMMonthYearData():
-    def __init__(self):
-        self.formatted_data: list[EPMDataMonthYearItem] = []
-
-    def _from_json_(self, json_data: dict) -> EPMMonthYearData:
-        if json_data:
-            for item in json_data:
-                epm = EPMDataMonthYearItem()
-                epm._from_json_(item)
-                self.formatted_data.append(epm)
-        return self
-    
-    def convert_to_json(self) -> dict:
-        json_obj = {}
-        for item in self.formatted_data:
-            json_obj[item.datetime.isoformat()] = item._to_json_()
-        return dict(sorted(json_obj.items()))
-
-
-class SolisEPM():
-    collectorId: str
-    collectorSn: str
-    ctRatio: float
-    currentState: str
-    dataTimestamp: str
-    daylight: int
-    eToaalInverter: str
-    eToaalInverterOrigin: float
-    eToaalInverterStr: float
-    eTodayBuy: 0
-    eTodayBuyOrigin: 0
-    eTodayBuyStr: str
-    eTodaySell: str
-    eTodaySellOrigin: str
-    eTodaySellStr: str
-    eTotalBuy: str
-    eTotalBuyOrigin: str
-    eTotalBuyStr: str
-    eTotalLoad: str
-    eTotalLoadOrigin: str
-    eTotalLoadStr: str
-    eTotalSell: str
-    eTotalSellOrigin: str
-    eTotalSellStr: str
-    empSoftwareVersion: str
-    epmDataTime: str
-    epmModel: str
-    epmMonthLoadEnergy: str
-    epmMonthLoadEnergyOrigin: str
-    epmMonthLoadEnergyStr: str
-    epmTodayLoadEnergy: str
-    epmTodayLoadEnergyOrigin: str
-    epmTodayLoadEnergyStr: str
-    epmTotalLoadEnergy: str
-    epmTotalLoadEnergyOrigin: str
-    epmTotalLoadEnergyStr: str
-    epmType: str
-    facMeter: str
-    failSafe: str
-    g100v2State: str
-    gridSwitch1: str
-    iAc1: str
-    iAc1Str: str
-    iAc2: str
-    iAc2Str: str
-    iAc3: str
-    iAc3Str: str
-    id: str
-    inverterModel: str
-    inverterNum: str
-    isRealtime: str
-    monthBuy: str
-    monthBuyOrigin: str
-    monthBuyStr: str
-    monthSell: str
-    monthSellOrigin: str
-    monthSellStr: str
-    pAc1: str
-    pAc1Str: str
-    pAc2: str
-    pAc2Str: str
-    pAc3: str
-    pAc3Str: str
-    pEpmTotal: str
-    pEpmTotalOrigin: str
-    pEpmTotalPec: str
-    pEpmTotalStr: str
-    pInverterTotal: str
-    pInverterTotalOrigin: str
-    pInverterTotalStr: str
-    pLimit: str
-    pLoad: str
-    pLoadOrigin: str
-    pLoadStr: str
-    pSet: str
-    pSetOrigin: str
-    pSetStr: str
-    powerFactor: str
-    rs485ComAddr: str
-    sn: str
-    sno: str
-    state: str
-    stateExceptionFlag: str
-    stationId: str
-    stationName: str
-    stationType: str
-    stationTypeNew: str
-    synchronizationType: str
-    tag: str
-    timeZone: str
-    timeZoneStr: str
-    uAc1: str
-    uAc1Str: str
-    uAc2: str
-    uAc2Str: str
-    uAc3: str
-    uAc3Str: str
-    userId: str
-    def __init__(self, __parent__: SolisCloud):
-        self.__parent__: SolisCloud = __parent__
-        self.collectorId = ""
-        self.collectorSn = ""
-        self.ctRatio = 0.0
-        self.currentState = ""
-        self.dataTimestamp = ""
-        self.daylight = 0
-        self.eToaalInverter = 0.0
-        self.eToaalInverterOrigin = 0.0
-        self.eToaalInverterStr = ""
-        self.eTodayBuy = 0
-        self.eTodayBuyOrigin = 0
-        self.eTodayBuyStr = ""
-        self.eTodaySell = ""
-        self.eTodaySellOrigin = ""
-        self.eTodaySellStr = ""
-        self.eTotalBuy = ""
-        self.eTotalBuyOrigin = ""
-        self.eTotalBuyStr = ""
-        self.eTotalLoad = ""
-        self.eTotalLoadOrigin = ""
-        self.eTotalLoadStr = ""
-        self.eTotalSell = ""
-        self.eTotalSellOrigin = ""
-        self.eTotalSellStr = ""
-        self.empSoftwareVersion = ""
-        self.epmDataTime = ""
-        self.epmModel = ""
-        self.epmMonthLoadEnergy = ""
-        self.epmMonthLoadEnergyOrigin = ""
-        self.epmMonthLoadEnergyStr = ""
-        self.epmTodayLoadEnergy = ""
-        self.epmTodayLoadEnergyOrigin = ""
-        self.epmTodayLoadEnergyStr = ""
-        self.epmTotalLoadEnergy = ""
-        self.epmTotalLoadEnergyOrigin = ""
-        self.epmTotalLoadEnergyStr = ""
-        self.epmType = ""
-        self.facMeter = ""
-        self.failSafe = ""
-        self.g100v2State = ""
-        self.gridSwitch1 = ""
-        self.iAc1 = ""
-        self.iAc1Str = ""
-        self.iAc2 = ""
-        self.iAc2Str = ""
-        self.iAc3 = ""
-        self.iAc3Str = ""
-        self.id = ""
-        self.inverterModel = ""
-        self.inverterNum = ""
-        self.isRealtime = ""
-        self.monthBuy = ""
-        self.monthBuyOrigin = ""
-        self.monthBuyStr = ""
-        self.monthSell = ""
-        self.monthSellOrigin = ""
-        self.monthSellStr = ""
-        self.pAc1 = ""
-        self.pAc1Str = ""
-        self.pAc2 = ""
-        self.pAc2Str = ""
-        self.pAc3 = ""
-        self.pAc3Str = ""
-        self.pEpmTotal = ""
-        self.pEpmTotalOrigin = ""
-        self.pEpmTotalPec = ""
-        self.pEpmTotalStr = ""
-        self.pInverterTotal = ""
-        self.pInverterTotalOrigin = ""
-        self.pInverterTotalStr = ""
-        self.pLimit = ""
-        self.pLoad = ""
-        self.pLoadOrigin = ""
-        self.pLoadStr = ""
-        self.pSet = ""
-        self.pSetOrigin = ""
-        self.pSetStr = ""
-        self.powerFactor = ""
-        self.rs485ComAddr = ""
-        self.sn = ""
-        self.sno = ""
-        self.state = ""
-        self.stateExceptionFlag = ""
-        self.stationId = ""
-        self.stationName = ""
-        self.stationType = ""
-        self.stationTypeNew = ""
-        self.synchronizationType = ""
-        self.tag = ""
-        self.timeZone = ""
-        self.timeZoneStr = ""
-        self.uAc1 = ""
-        self.uAc1Str = ""
-        self.uAc2 = ""
-        self.uAc2Str = ""
-        self.uAc3 = ""
-        self.uAc3Str = ""
-        self.userId = ""
-    
-    def get_data_for_day(self, dt: date, timeZone: int, searchinfo: list[EPMFields] = [], **kwargs) -> EPMDayData:
-        data: EPMDayData = self.__parent__.get_epm_data_for_day(sn=self.sn, dt=dt, timeZone=timeZone, searchinfo=searchinfo, **kwargs)
-        return data
-    
-    def get_data_for_month(self, dt: date, **kwargs) -> EPMMonthYearData:
-        data: EPMMonthYearData = self.__parent__.get_epm_data_for_month(sn=self.sn, dt=dt, **kwargs)
-        return data
-    
-    def get_data_for_year(self, dt: date, **kwargs) -> EPMMonthYearData:
-        data: EPMMonthYearData = self.__parent__.get_epm_data_for_year(sn=self.sn, dt=dt, **kwargs)
-        return data
-
-    def _to_json(self):
-        return {key: value for key, value in self.__dict__.items() if not key.startswith("_")}
-        
-    def _from_json(self, json_data) -> SolisEPM:
-        if json_data:
-            for key, value in json_data.items():
-                if hasattr(self, key):
-                    setattr(self, key, value)
-        return self
-
-
-class SolisStations():
-    def __init__(self):
-        self.stationStatusVo: StatusVo = StatusVo()
-        self.stations: list[SolisStation] = []
-    
-    def _from_json(self, json_data) -> SolisStations:
-        for key, value in json_data.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
-        return self
-    
-    def _to_json(self) -> dict:
-        json_obj = {}
-        json_obj['stationsStatusVo'] = self.stationStatusVo._to_json()
-        json_obj['stations'] = [x._to_json() for x in self.stations]
-        return json_obj
-
-
-class SolisInverter():
-    def __init__(self, __parent__: SolisCloud = None):
-        self.__parent__: SolisCloud = __parent__
-        self.charge_discharge_schedule: ChargeDischargeSchedule = None
-        self.chartAllParams: str = ''
-        self.id: str = ''
-        self.userId: str = ''
-        self.sn: str = ''
-        self.inverterMeterModel: int = 0
-        self.collectorsn: str = ''
-        self.collectorId: str = ''
-        self.state: int = 0
-        self.stateExceptionFlag: int = 0
-        self.mpptSwitch: int = 0
-        self.collectorState: int = 0
-        self.collectorModel: str = ''
-        self.simFlowState: int = 0
-        self.ammeterId: str = ''
-        self.electricMeter: int = 0
-        self.fullHour: float = 0.0
-        self.fullHourStr: str = ''
-        self.currentState: str = ''
-        self.alarmState: int = 0
-        self.warningInfoData: int = 0
-        self.shelfBeginTime: int = 0
-        self.shelfEndTime: int = 0
-        self.updateShelfEndTime: int = 0
-        self.updateShelfEndTimeStr: str = ''
-        self.shelfState: str = ''
-        self.timeZone: float = 0.0
-        self.timeZoneStr: str = ''
-        self.daylight: int = 0
-        self.daylightSwitch: int = 0
-        self.model: str = ''
-        self.productModel: str = ''
-        self.isS5: int = 0
-        self.isSeparateLoad: int = 0
-        self.isShowPowerFactor: int = 0
-        self.isShowInternalBatteryI: int = 0
-        self.ctrlCommand: int = 0
-        self.inverterType: int = 0
-        self.nationalStandards: str = ''
-        self.nationalStandardstr: str = ''
-        self.inverterTemperature: float = 0.0
-        self.inverterTemperatureUnit: str = ''
-        self.inverterTemperature2: float = 0.0
-        self.inverterTemperatureUnit2: str = ''
-        self.temp: float = 0.0
-        self.tempName: str = ''
-        self.stationName: str = ''
-        self.stationType: int = 0
-        self.stationTypeNew: int = 0
-        self.epmType: int = 0
-        self.synchronizationType: int = 0
-        self.gridSwitch1: int = 0
-        self.sno: str = ''
-        self.money: str = ''
-        self.stationId: str = ''
-        self.version: str = ''
-        self.version2: str = ''
-        self.acOutputType: int = 0
-        self.dcInputtype: int = 0
-        self.rs485ComAddr: str = ''
-        self.dataTimestamp: str = ''
-        self.timeStr: str = ''
-        self.tag: str = ''
-        self.reactivePower: float = 0.0
-        self.apparentPower: float = 0.0
-        self.dcPac: float = 0.0
-        self.uInitGnd: int = 0
-        self.uInitGndStr: str = ''
-        self.dcBus: float = 0.0
-        self.dcBusStr: str = ''
-        self.dcBusHalf: float = 0.0
-        self.dcBusHalfStr: str = ''
-        self.power: float = 0.0
-        self.powerStr: str = ''
-        self.powerPec: str = ''
-        self.porwerPercent: float = 0.0
-        self.pac: float = 0.0
-        self.pacStr: str = ''
-        self.pacPec: str = ''
-        self.oneSelf: float = 0.0
-        self.eToday: float = 0.0
-        self.eTodayStr: str = ''
-        self.eMonth: float = 0.0
-        self.eMonthStr: str = ''
-        self.eYear: float = 0.0
-        self.eYearStr: str = ''
-        self.eTotal: float = 0.0
-        self.eTotalStr: str = ''
-        self.dayInCome: float = 0.0
-        self.monthInCome: float = 0.0
-        self.yearInCome: float = 0.0
-        self.allInCome: float = 0.0
-        self.uPv1: int = 0
-        self.uPv1Str: str = ''
-        self.iPv1: int = 0
-        self.iPv1Str: str = ''
-        self.uPv2: int = 0
-        self.uPv2Str: str = ''
-        self.iPv2: int = 0
-        self.iPv2Str: str = ''
-        self.uPv3: int = 0
-        self.uPv3Str: str = ''
-        self.iPv3: int = 0
-        self.iPv3Str: str = ''
-        self.uPv4: int = 0
-        self.uPv4Str: str = ''
-        self.iPv4: int = 0
-        self.iPv4Str: str = ''
-        self.uPv5: int = 0
-        self.uPv5Str: str = ''
-        self.iPv5: int = 0
-        self.iPv5Str: str = ''
-        self.uPv6: int = 0
-        self.uPv6Str: str = ''
-        self.iPv6: int = 0
-        self.iPv6Str: str = ''
-        self.uPv7: int = 0
-        self.uPv7Str: str = ''
-        self.iPv7: int = 0
-        self.iPv7Str: str = ''
-        self.uPv8: int = 0
-        self.uPv8Str: str = ''
-        self.iPv8: int = 0
-        self.iPv8Str: str = ''
-        self.uPv9: int = 0
-        self.uPv9Str: str = ''
-        self.iPv9: int = 0
-        self.iPv9Str: str = ''
-        self.uPv10: int = 0
-        self.uPv10Str: str = ''
-        self.iPv10: int = 0
-        self.iPv10Str: str = ''
-        self.uPv11: int = 0
-        self.uPv11Str: str = ''
-        self.iPv11: int = 0
-        self.iPv11Str: str = ''
-        self.uPv12: int = 0
-        self.uPv12Str: str = ''
-        self.iPv12: int = 0
-        self.iPv12Str: str = ''
-        self.uPv13: int = 0
-        self.uPv13Str: str = ''
-        self.iPv13: int = 0
-        self.iPv13Str: str = ''
-        self.uPv14: int = 0
-        self.uPv14Str: str = ''
-        self.iPv14: int = 0
-        self.iPv14Str: str = ''
-        self.uPv15: int = 0
-        self.uPv15Str: str = ''
-        self.iPv15: int = 0
-        self.iPv15Str: str = ''
-        self.uPv16: int = 0
-        self.uPv16Str: str = ''
-        self.iPv16: int = 0
-        self.iPv16Str: str = ''
-        self.uPv17: int = 0
-        self.uPv17Str: str = ''
-        self.iPv17: int = 0
-        self.iPv17Str: str = ''
-        self.uPv18: int = 0
-        self.uPv18Str: str = ''
-        self.iPv18: int = 0
-        self.iPv18Str: str = ''
-        self.uPv19: int = 0
-        self.uPv19Str: str = ''
-        self.iPv19: int = 0
-        self.iPv19Str: str = ''
-        self.uPv20: int = 0
-        self.uPv20Str: str = ''
-        self.iPv20: int = 0
-        self.iPv20Str: str = ''
-        self.uPv21: int = 0
-        self.uPv21Str: str = ''
-        self.iPv21: int = 0
-        self.iPv21Str: str = ''
-        self.uPv22: int = 0
-        self.uPv22Str: str = ''
-        self.iPv22: int = 0
-        self.iPv22Str: str = ''
-        self.uPv23: int = 0
-        self.uPv23Str: str = ''
-        self.iPv23: int = 0
-        self.iPv23Str: str = ''
-        self.uPv24: int = 0
-        self.uPv24Str: str = ''
-        self.iPv24: int = 0
-        self.iPv24Str: str = ''
-        self.uPv25: int = 0
-        self.uPv25Str: str = ''
-        self.iPv25: int = 0
-        self.iPv25Str: str = ''
-        self.uPv26: int = 0
-        self.uPv26Str: str = ''
-        self.iPv26: int = 0
-        self.iPv26Str: str = ''
-        self.uPv27: int = 0
-        self.uPv27Str: str = ''
-        self.iPv27: int = 0
-        self.iPv27Str: str = ''
-        self.uPv28: int = 0
-        self.uPv28Str: str = ''
-        self.iPv28: int = 0
-        self.iPv28Str: str = ''
-        self.uPv29: int = 0
-        self.uPv29Str: str = ''
-        self.iPv29: int = 0
-        self.iPv29Str: str = ''
-        self.uPv30: int = 0
-        self.uPv30Str: str = ''
-        self.iPv30: int = 0
-        self.iPv30Str: str = ''
-        self.uPv31: int = 0
-        self.uPv31Str: str = ''
-        self.iPv31: int = 0
-        self.iPv31Str: str = ''
-        self.uPv32: int = 0
-        self.uPv32Str: str = ''
-        self.iPv32: int = 0
-        self.iPv32Str: str = ''
-        self.pow1: int = 0
-        self.pow1Str: str = ''
-        self.pow2: int = 0
-        self.pow2Str: str = ''
-        self.pow3: int = 0
-        self.pow3Str: str = ''
-        self.pow4: int = 0
-        self.pow4Str: str = ''
-        self.pow5: int = 0
-        self.pow5Str: str = ''
-        self.pow6: int = 0
-        self.pow6Str: str = ''
-        self.pow7: int = 0
-        self.pow7Str: str = ''
-        self.pow8: int = 0
-        self.pow8Str: str = ''
-        self.pow9: int = 0
-        self.pow9Str: str = ''
-        self.pow10: int = 0
-        self.pow10Str: str = ''
-        self.pow11: int = 0
-        self.pow11Str: str = ''
-        self.pow12: int = 0
-        self.pow12Str: str = ''
-        self.pow13: int = 0
-        self.pow13Str: str = ''
-        self.pow14: int = 0
-        self.pow14Str: str = ''
-        self.pow15: int = 0
-        self.pow15Str: str = ''
-        self.pow16: int = 0
-        self.pow16Str: str = ''
-        self.pow17: int = 0
-        self.pow17Str: str = ''
-        self.pow18: int = 0
-        self.pow18Str: str = ''
-        self.pow19: int = 0
-        self.pow19Str: str = ''
-        self.pow20: int = 0
-        self.pow20Str: str = ''
-        self.pow21: int = 0
-        self.pow21Str: str = ''
-        self.pow22: int = 0
-        self.pow22Str: str = ''
-        self.pow23: int = 0
-        self.pow23Str: str = ''
-        self.pow24: int = 0
-        self.pow24Str: str = ''
-        self.pow25: int = 0
-        self.pow25Str: str = ''
-        self.pow26: int = 0
-        self.pow26Str: str = ''
-        self.pow27: int = 0
-        self.pow27Str: str = ''
-        self.pow28: int = 0
-        self.pow28Str: str = ''
-        self.pow29: int = 0
-        self.pow29Str: str = ''
-        self.pow30: int = 0
-        self.pow30Str: str = ''
-        self.pow31: int = 0
-        self.pow31Str: str = ''
-        self.pow32: int = 0
-        self.pow32Str: str = ''
-        self.uAc1: float = 0.0
-        self.uAc1Str: str = ''
-        self.iAc1: float = 0.0
-        self.iAc1Str: str = ''
-        self.uAc2: float = 0.0
-        self.uAc2Str: str = ''
-        self.iAc2: float = 0.0
-        self.iAc2Str: str = ''
-        self.uAc3: float = 0.0
-        self.uAc3Str: str = ''
-        self.iAc3: float = 0.0
-        self.iAc3Str: str = ''
-        self.powerFactor: float = 0.0
-        self.batteryDischargeEnergy: float = 0.0
-        self.batteryDischargeEnergyStr: str = ''
-        self.batteryChargeEnergy: float = 0.0
-        self.batteryChargeEnergyStr: str = ''
-        self.homeLoadEnergy: float = 0.0
-        self.homeLoadEnergyStr: str = ''
-        self.gridPurchasedEnergy: float = 0.0
-        self.gridPurchasedEnergyStr: str = ''
-        self.gridSellEnergy: float = 0.0
-        self.gridSellEnergyStr: str = ''
-        self.fac: float = 0.0
-        self.facStr: str = ''
-        self.batteryPower: float = 0.0
-        self.batteryPowerStr: str = ''
-        self.batteryPowerPec: str = ''
-        self.batteryPowerZheng: int = 0
-        self.batteryPowerFu: float = 0.0
-        self.storageBatteryVoltage: float = 0.0
-        self.storageBatteryVoltageStr: str = ''
-        self.storageBatteryCurrent: float = 0.0
-        self.storageBatteryCurrentStr: str = ''
-        self.batteryCapacitySoc: float = 0.0
-        self.batteryHealthSoh: float = 0.0
-        self.batteryVoltage: float = 0.0
-        self.batteryVoltageStr: str = ''
-        self.bstteryCurrent: float = 0.0
-        self.bstteryCurrentStr: str = ''
-        self.batteryPowerBms: float = 0.0
-        self.batteryPowerBmsStr: str = ''
-        self.internalBatteryI: float = 0.0
-        self.batteryChargingCurrent: float = 0.0
-        self.batteryChargingCurrentStr: str = ''
-        self.batteryDischargeLimiting: float = 0.0
-        self.batteryDischargeLimitingStr: str = ''
-        self.batteryFailureInformation01: str = ''
-        self.batteryFailureInformation02: str = ''
-        self.batteryTotalChargeEnergy: float = 0.0
-        self.batteryTotalChargeEnergyStr: str = ''
-        self.batteryTodayChargeEnergy: float = 0.0
-        self.batteryTodayChargeEnergyStr: str = ''
-        self.batteryMonthChargeEnergy: float = 0.0
-        self.batteryMonthChargeEnergyStr: str = ''
-        self.batteryYearChargeEnergy: float = 0.0
-        self.batteryYearChargeEnergyStr: str = ''
-        self.batteryYesterdayChargeEnergy: float = 0.0
-        self.batteryYesterdayChargeEnergyStr: str = ''
-        self.batteryTotalDischargeEnergy: float = 0.0
-        self.batteryTotalDischargeEnergyStr: str = ''
-        self.batteryTodayDischargeEnergy: float = 0.0
-        self.batteryTodayDischargeEnergyStr: str = ''
-        self.batteryMonthDischargeEnergy: float = 0.0
-        self.batteryMonthDischargeEnergyStr: str = ''
-        self.batteryYearDischargeEnergy: float = 0.0
-        self.batteryYearDischargeEnergyStr: str = ''
-        self.batteryYesterdayDischargeEnergy: float = 0.0
-        self.batteryYesterdayDischargeEnergyStr: str = ''
-        self.gridPurchasedTotalEnergy: float = 0.0
-        self.gridPurchasedTotalEnergyStr: str = ''
-        self.gridPurchasedYearEnergy: float = 0.0
-        self.gridPurchasedYearEnergyStr: str = ''
-        self.gridPurchasedMonthEnergy: float = 0.0
-        self.gridPurchasedMonthEnergyStr: str = ''
-        self.gridPurchasedTodayEnergy: float = 0.0
-        self.gridPurchasedTodayEnergyStr: str = ''
-        self.gridPurchasedYesterdayEnergy: float = 0.0
-        self.gridPurchasedYesterdayEnergyStr: str = ''
-        self.gridSellTotalEnergy: float = 0.0
-        self.gridSellTotalEnergyStr: str = ''
-        self.gridSellYearEnergy: float = 0.0
-        self.gridSellYearEnergyStr: str = ''
-        self.gridSellMonthEnergy: float = 0.0
-        self.gridSellMonthEnergyStr: str = ''
-        self.gridSellTodayEnergy: float = 0.0
-        self.gridSellTodayEnergyStr: str = ''
-        self.gridSellYesterdayEnergy: float = 0.0
-        self.gridSellYesterdayEnergyStr: str = ''
-        self.homeLoadTodayEnergy: float = 0.0
-        self.homeLoadTodayEnergyStr: str = ''
-        self.homeLoadMonthEnergy: float = 0.0
-        self.homeLoadMonthEnergyStr: str = ''
-        self.homeLoadYearEnergy: float = 0.0
-        self.homeLoadYearEnergyStr: str = ''
-        self.homeLoadTotalEnergy: float = 0.0
-        self.homeLoadTotalEnergyStr: str = ''
-        self.totalLoadPower: float = 0.0
-        self.totalLoadPowerStr: str = ''
-        self.homeLoadYesterdayEnergy: float = 0.0
-        self.homeLoadYesterdayEnergyStr: str = ''
-        self.familyLoadPower: float = 0.0
-        self.familyLoadPowerStr: str = ''
-        self.familyLoadPercent: float = 0.0
-        self.homeGridYesterdayEnergy: float = 0.0
-        self.homeGridYesterdayEnergyStr: str = ''
-        self.homeGridTodayEnergy: float = 0.0
-        self.homeGridTodayEnergyStr: str = ''
-        self.homeGridMonthEnergy: float = 0.0
-        self.homeGridMonthEnergyStr: str = ''
-        self.homeGridYearEnergy: float = 0.0
-        self.homeGridYearEnergyStr: str = ''
-        self.homeGridTotalEnergy: float = 0.0
-        self.homeGridTotalEnergyStr: str = ''
-        self.bypassLoadPower: float = 0.0
-        self.bypassLoadPowerStr: str = ''
-        self.backupYesterdayEnergy: float = 0.0
-        self.backupYesterdayEnergyStr: str = ''
-        self.backupTodayEnergy: float = 0.0
-        self.backupTodayEnergyStr: str = ''
-        self.backupMonthEnergy: float = 0.0
-        self.backupMonthEnergyStr: str = ''
-        self.backupYearEnergy: float = 0.0
-        self.backupYearEnergyStr: str = ''
-        self.backupTotalEnergy: float = 0.0
-        self.backupTotalEnergyStr: str = ''
-        self.bypassAcVoltage: float = 0.0
-        self.bypassAcVoltageB: float = 0.0
-        self.bypassAcVoltageC: float = 0.0
-        self.bypassAcCurrent: float = 0.0
-        self.bypassAcCurrentB: float = 0.0
-        self.bypassAcCurrentC: float = 0.0
-        self.pLimitSet: float = 0.0
-        self.pFactorLimitSet: float = 0.0
-        self.pReactiveLimitSet: float = 0.0
-        self.batteryType: str = ''
-        self.batteryTypeCode: str = ''
-        self.batteryModel: int = 0
-        self.socDischargeSet: float = 0.0
-        self.socChargingSet: float = 0.0
-        self.pEpmSet: float = 0.0
-        self.pEpmSetStr: str = ''
-        self.epmFailSafe: float = 0.0
-        self.epmSafe: int = 0
-        self.pEpm: float = 0.0
-        self.pEpmStr: str = ''
-        self.psumCalPec: str = ''
-        self.insulationResistance: float = 0.0
-        self.dispersionRate: float = 0.0
-        self.sirRealtime: int = 0
-        self.iLeakLimt: int = 0
-        self.upvTotal: int = 0
-        self.upvTotalStr: str = ''
-        self.ipvTotal: int = 0
-        self.ipvTotalStr: str = ''
-        self.powTotal: int = 0
-        self.powTotalStr: str = ''
-        self.parallelStatus: int = 0
-        self.parallelAddr: int = 0
-        self.parallelPhase: int = 0
-        self.parallelBattery: int = 0
-        self.batteryAlarm: str = ''
-        self.bypassAcOnoffSet: float = 0.0
-        self.bypassAcVoltageSet: float = 0.0
-        self.bypassAcCurrentSet: float = 0.0
-        self.batteryCDEnableSet: float = 0.0
-        self.batteryCDSet: float = 0.0
-        self.batteryCDISet: float = 0.0
-        self.batteryCMaxiSet: float = 0.0
-        self.batteryDMaxiSet: float = 0.0
-        self.batteryUvpSet: float = 0.0
-        self.batteryFcvSet: float = 0.0
-        self.batteryAcvSet: float = 0.0
-        self.batteryOvpSet: float = 0.0
-        self.batteryOlvEnableSet: float = 0.0
-        self.batteryLaTemp: float = 0.0
-        self.offGridDDepth: float = 0.0
-        self.epsDDepth: float = 0.0
-        self.epsSwitchTime: str = ''
-        self.groupId: str = ''
-        self.isGrouped: int = 0
-        self.bmsState: int = 0
-        self.isShow: bool = False
-        self.isShowBattery: int = 0
-        self.acInType: int = 0
-        self.energyStorageControl: str = ''
-        self.dsp14Ver: str = ''
-        self.meter1Type: int = 0
-        self.meter2Type: int = 0
-        self.meter1SiteHigh: int = 0
-        self.meter2SiteHigh: int = 0
-        self.meter1TypeLow: int = 0
-        self.meter2TypeLow: int = 0
-        self.generatorPower: float = 0.0
-        self.generatorPowerStr: str = ''
-        self.generatorPowerPec: str = ''
-        self.generatorTodayEnergy: float = 0.0
-        self.generatorTodayEnergyStr: str = ''
-        self.generatorTodayEnergyPec: str = ''
-        self.generatorMonthEnergy: float = 0.0
-        self.generatorMonthEnergyStr: str = ''
-        self.generatorMonthEnergyPec: str = ''
-        self.generatorYearEnergy: float = 0.0
-        self.generatorYearEnergyStr: str = ''
-        self.generatorYearEnergyPec: str = ''
-        self.generatorTotalEnergy: float = 0.0
-        self.generatorTotalEnergyStr: str = ''
-        self.generatorTotalEnergyPec: str = ''
-        self.generatorWarning: str = ''
-        self.generatorWarningMsg: str = ''
-        self.generatorSet: str = ''
-        self.generatorSet01: float = 0.0
-        self.parallelOnoff: str = ''
-        self.parallelOnoff01: float = 0.0
-        self.parallelOnoff02: float = 0.0
-        self.parallelNumber: float = 0.0
-        self.parallelOnline: float = 0.0
-        self.tempFlag: int = 0
-        self.iA: float = 0.0
-        self.uA: float = 0.0
-        self.pA: float = 0.0
-        self.iB: float = 0.0
-        self.uB: float = 0.0
-        self.pB: float = 0.0
-        self.iC: float = 0.0
-        self.uC: float = 0.0
-        self.pC: float = 0.0
-        self.aReactivePower: float = 0.0
-        self.aLookedPower: float = 0.0
-        self.aPhasePowerFactor: float = 0.0
-        self.bReactivePower: float = 0.0
-        self.bLookedPower: float = 0.0
-        self.bPhasePowerFactor: float = 0.0
-        self.cReactivePower: float = 0.0
-        self.cLookedPower: float = 0.0
-        self.cPhasePowerFactor: float = 0.0
-        self.averagePowerFactor: float = 0.0
-        self.pvShow: int = 0
-        self.mpptShow: int = 0
-        self.mpptIpv1: int = 0
-        self.mpptUpv1: int = 0
-        self.mpptPow1: int = 0
-        self.mpptIpv2: int = 0
-        self.mpptUpv2: int = 0
-        self.mpptPow2: int = 0
-        self.mpptIpv3: int = 0
-        self.mpptUpv3: int = 0
-        self.mpptPow3: int = 0
-        self.mpptIpv4: int = 0
-        self.mpptPow4: int = 0
-        self.mpptUpv4: int = 0
-        self.mpptIpv5: int = 0
-        self.mpptUpv5: int = 0
-        self.mpptPow5: int = 0
-        self.mpptIpv6: int = 0
-        self.mpptUpv6: int = 0
-        self.mpptPow6: int = 0
-        self.mpptIpv7: int = 0
-        self.mpptUpv7: int = 0
-        self.mpptPow7: int = 0
-        self.mpptIpv8: int = 0
-        self.mpptUpv8: int = 0
-        self.mpptPow8: int = 0
-        self.mpptIpv9: int = 0
-        self.mpptUpv9: int = 0
-        self.mpptPow9: int = 0
-        self.mpptIpv10: int = 0
-        self.mpptUpv10: int = 0
-        self.mpptPow10: int = 0
-        self.mpptIpv11: int = 0
-        self.mpptUpv11: int = 0
-        self.mpptPow11: int = 0
-        self.mpptIpv12: int = 0
-        self.mpptUpv12: int = 0
-        self.mpptPow12: int = 0
-        self.mpptIpv13: int = 0
-        self.mpptUpv13: int = 0
-        self.mpptPow13: int = 0
-        self.mpptIpv14: int = 0
-        self.mpptUpv14: int = 0
-        self.mpptPow14: int = 0
-        self.mpptIpv15: int = 0
-        self.mpptUpv15: int = 0
-        self.mpptPow15: int = 0
-        self.mpptIpv16: int = 0
-        self.mpptUpv16: int = 0
-        self.mpptPow16: int = 0
-        self.mpptIpv17: int = 0
-        self.mpptUpv17: int = 0
-        self.mpptPow17: int = 0
-        self.mpptIpv18: int = 0
-        self.mpptUpv18: int = 0
-        self.mpptPow18: int = 0
-        self.mpptIpv19: int = 0
-        self.mpptUpv19: int = 0
-        self.mpptPow19: int = 0
-        self.mpptIpv20: int = 0
-        self.mpptUpv20: int = 0
-        self.mpptPow20: int = 0
-        self.dcInputTypeMppt: int = 0
-        self.afciType: str = ''
-        self.afciTypeStr: str = ''
-        self.afciVer: str = ''
-        self.fisTimeStr: str = ''
-        self.fisGenerateTime: int = 0
-        self.fisGenerateTimeStr: str = ''
-        self.outDateStr: str = ''
-        self.g100v2State: int = 0
-        self.faultCodeDesc: str = ''
-        self.machine: str = ''
-        self.batteryState: int = 0
-        self.sphSet: int = 0
-        self.sphSn: str = ''
-        self.dcAcPower: float = 0.0
-        self.backupLookedPower: float = 0.0
-        self.backupLookedPowerStr: str = ''
-        self.backupLookedPowerOriginal: float = 0.0
-        self.backupLookedPowerA: float = 0.0
-        self.backupLookedPowerB: float = 0.0
-        self.backupLookedPowerC: float = 0.0
-        self.batteryNum: int = 0
-        self.batteryType2: int = 0
-        self.batteryList: list = []
-        self.hmilcdVer: str = ''
-        self.afciDataFlag: int = 0
-        self.backup2Power: float = 0.0
-        self.backup2PowerStr: str = ''
-        self.backup2PowerA: float = 0.0
-        self.backup2PowerB: float = 0.0
-        self.backup2PowerC: float = 0.0
-        self.backup2LookedPower: float = 0.0
-        self.backup2LookedPowerStr: str = ''
-        self.backup2LookedPowerOriginal: float = 0.0
-        self.backup2LookedPowerA: float = 0.0
-        self.backup2LookedPowerB: float = 0.0
-        self.backup2LookedPowerC: float = 0.0
-        self.backup2TodayEnergy: float = 0.0
-        self.backup2TodayEnergyStr: str = ''
-        self.backup2MonthEnergy: float = 0.0
-        self.backup2MonthEnergyStr: str = ''
-        self.backup2YearEnergy: float = 0.0
-        self.backup2YearEnergyStr: str = ''
-        self.backup2TotalEnergy: float = 0.0
-        self.backup2TotalEnergyStr: str = ''
-        self.acCoupledTodayEnergy: float = 0.0
-        self.acCoupledTodayEnergyStr: str = ''
-        self.acCoupledMonthEnergy: float = 0.0
-        self.acCoupledMonthEnergyStr: str = ''
-        self.acCoupledYearEnergy: float = 0.0
-        self.acCoupledYearEnergyStr: str = ''
-        self.acCoupledTotalEnergy: float = 0.0
-        self.acCoupledTotalEnergyStr: str = ''
-        self.energyControl: str = ''
-        self.energyControl00: int = 0
-        self.energyControl01: int = 0
-        self.pumpControl: str = ''
-        self.pumpControl00: int = 0
-        self.gridPortDeviceType: int = 0
-        self.cpldVer: str = ''
-        self.hmiVersionAll: str = ''
-        self.dspmVersionAll: str = ''
-        self.dspsVersionAll: str = ''
-        self.hmilcdVersionAll: str = ''
-        self.cpldVersionAll: str = ''
-        self.sphVersionAll: str = ''
-        self.afciVersionAll: str = ''
-        self.bat1BmsVer: str = ''
-        self.bat1DcdcVer: str = ''
-        self.bat2BmsVer: str = ''
-        self.bat2DcdcVer: str = ''
-        self.showChipEvent: bool = False
-        self.showDebugParam: bool = False
-        self.dataTimestampStr: str = ''
-        self.existEpm: bool = False
-        self.model3P3W: int = 0
-        self.isShowApparent: int = 0
-        self.familyLoadPowerPec: str = ''
-        self.psum: float = 0.0
-        self.psumCal: float = 0.0
-        self.bypassLoadPowerOriginal: float = 0.0
-        self.reactivePowerStr: str = ''
-        self.apparentPowerStr: str = ''
-        self.backup2PowerOriginal: float = 0.0
-        self.dcPacStr: str = ''
-        self.psumCalStr: str = ''
-        self.psumStr: str = ''
-
-    def _from_json(self, json_data) -> SolisInverter:
-        if json_data:
-            for key, value in json_data.items():
-                if hasattr(self, key):
-                    setattr(self, key, value)
-        return self
-    
-    def get_charge_discharge_schedules(self) -> ChargeDischargeSchedule:
-        if self.__parent__:
-            self.charge_discharge_schedule = self.__parent__.get_charge_discharge_schedule(self.sn)
-            return self.charge_discharge_schedule
-    
-    def set_charge_discharge_schedules(self, charge_discharge_schedule: ChargeDischargeSchedule) -> SolisSetResult:
-        if self.__parent__:
-            return self.__parent__.set_inverter_charge_discharge_schedule(self.id, self.sn, charge_discharge_schedule)
-    
-    def _to_json(self) -> dict:
-        return {key: value for key, value in self.__dict__.items() if not key.startswith("_")}
-
-
-class ScheduleDateTime():
-    def __init__(self):
-        self.start: datetime
-        self.end: datetime
-
-
-class ScheduleDate():
-    def __init__(self):
-        self.start: date = date(1970, 1, 1)
-        self.end: date = date(1970, 1, 1)
-
-
-class ChargeData():
-    def __init__(self):
-        self.current: int = 0
-        self.start: time = time(0, 0, 0, 0)
-        self.end: time = time(0, 0, 0, 0)
-
-
-class Schedule():
-    def __init__(self):
-        self.charge: ChargeData = ChargeData()
-        self.discharge: ChargeData = ChargeData()
-
-
-class ChargeDischargeSchedule():
-
-    def __init__(self):
-        self.one: Schedule = Schedule()
-        self.two: Schedule = Schedule()
-        self.three: Schedule = Schedule()
-    
-    def to_value(self) -> str:
-        value = f"{self.one.charge.current},{self.one.discharge.current},{self.one.charge.start.strftime('%H:%M')},{self.one.charge.end.strftime('%H:%M')},{self.one.discharge.start.strftime('%H:%M')},{self.one.discharge.end.strftime('%H:%M')},{self.two.charge.current},{self.two.discharge.current},{self.two.charge.start.strftime('%H:%M')},{self.two.charge.end.strftime('%H:%M')},{self.two.discharge.start.strftime('%H:%M')},{self.two.discharge.end.strftime('%H:%M')},{self.three.charge.current},{self.three.discharge.current},{self.three.charge.start.strftime('%H:%M')},{self.three.charge.end.strftime('%H:%M')},{self.three.discharge.start.strftime('%H:%M')},{self.three.discharge.end.strftime('%H:%M')}"
-        return value
-    
-    def _to_json(self) -> dict:
-        json_obj = {}
-
-
-class SolisSetResult():
-    def __init__(self):
-        self.success: bool = True
-        self.error: str = ""
-        self.message: str = ""
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
 
 
 class SolisCloud():
-    class RequestsSession(Session):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, **kwargs)
+    class _LazySessionClass():
+        def __get__(self, obj, objtype=None):
+            from soliscloud.session import RequestsSession
+            return RequestsSession
 
-        @retry(stop=stop_after_attempt(5), wait=wait_exponential(max=60))
-        def request(self, method, url, **kwargs):
-            response = super().request(method, url, **kwargs)
-            
-            if response.status_code == 429:
-                print(f"Rate limit hit: {url} with status 429. Retrying...")
-                raise RequestException("Rate limit exceeded")
-            
-            return response
+    RequestsSession = _LazySessionClass()
 
-        def get(self, url, **kwargs):
-            return self.request('GET', url, **kwargs)
-
-        def post(self, url, **kwargs):
-            return self.request('POST', url, **kwargs)
-
-        def put(self, url, **kwargs):
-            return self.request('PUT', url, **kwargs)
-
-        def delete(self, url, **kwargs):
-            return self.request('DELETE', url, **kwargs)
-
-    def __init__(self, key_id: str, key_secret: str, base_url: str = "https://www.soliscloud.com:13333"):
+    def __init__(self, key_id: str, key_secret: str, base_url: str = "https://www.soliscloud.com:13333", coalesce_requests: bool = True, client=None, rate_limiter: Optional[RateLimiter] = None, middleware: Iterable[Middleware] = (), retries: int = 5, timeout: Optional[float] = 30.0):
         """_summary_
         This class provides connectivity to the SolisCloud API.
 
@@ -1311,25 +145,159 @@ class SolisCloud():
             base_url (str): The Base URL for SolisCloud API (typically https://www.soliscloud.com:13333)
             key_id (str): Your Key ID as provided in your SolicCloud account
             key_secret (str): Your Key Secret as provided in your SolicCloud account
+            coalesce_requests (bool): Share one network call between concurrent identical read requests
+            client (RequestsSession): Session to send requests with, e.g. one shared by several accounts
+            rate_limiter (RateLimiter): Limits how fast requests are sent with this key
+            middleware (Iterable): Callables ``(request, call_next) -> response`` every endpoint call passes through, outermost first
+            retries (int): Attempts for a request that is rate limited (429) or fails to connect
+            timeout (float): Seconds to wait for the server on each attempt
         """
         self.key_id: str = key_id
         self.key_secret: str = key_secret
         self.base_url: str = base_url
-        self.client = self.RequestsSession()
+        self._client = client
+        self._client_lock = threading.Lock()
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter
+        self.signer: RequestSigner = RequestSigner(key_id, key_secret)
         self.headers = {}
+        self.coalesce_requests: bool = coalesce_requests
+        self._single_flight: SingleFlight = SingleFlight()
+        self._middleware: list[Middleware] = list(middleware)
+        self._pipeline = None
+        self.retries: int = retries
+        self.retry_max_wait: float = 60.0
+        self._sleep = sleep
+        self.timeout: Optional[float] = timeout
+        self.page_retries: int = 2
     
+    @property
+    def client(self):
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self.RequestsSession()
+        return self._client
+
+    @client.setter
+    def client(self, value):
+        self._client = value
+
     def __generate_authorization__(self, verb: str = "POST", body: str = "", content_type: str = "application/json", uri: str = "/"):
-        now = datetime.now(pytz.UTC).strftime("%a, %d %b %Y %H:%M:%S GMT")
-        content_md5 = b64encode(hashlib.md5(body.encode()).digest()).decode()
-        message = ("\n".join([verb, content_md5, content_type, now, uri]))
-        sign = b64encode(hmac.new(self.key_secret.encode(), msg=message.encode(), digestmod=hashlib.sha1).digest())
-        self.headers = {
-            "Authorization": f"API {self.key_id}:{sign.decode()}",
-            "Content-Type": content_type,
-            "Content-MD5": content_md5,
-            "Date": now
-        }
+        self.headers = self.signer.sign(body.encode(), uri, verb, content_type)
+        return self.headers
+
+    def deadline(self, timeout: Optional[float] = None) -> Deadline:
+        """A deadline / cancellation token to enter around one or more calls.
+
+        ```
+        with soliscloud.deadline(20) as deadline:
+            status, inverters = soliscloud.list_inverters(concurrency=4)
+        ```
+
+        Listings that run out of time raise ``SolisTimeoutException`` with
+        the records fetched so far in its ``partial`` attribute.
+        """
+        return Deadline(timeout)
+
+    def __send__(self, uri: str, body: dict, attrs: Optional[dict] = None):
+        # every attempt is signed with a fresh Date, corrected by the clock
+        # offset learnt from earlier responses, so a retry is never rejected
+        # for a stale or skewed signature
+        deadline: Optional[Deadline] = attrs.get("deadline") if attrs else None
+        rate_limits: Optional[RateLimitCounter] = attrs.get("rate_limits") if attrs else None
+        write: bool = bool(attrs.get("write")) if attrs else False
+        payload = self.signer.serialize(body)
+        url = f"{self.base_url}{uri}"
+        attempt = 0
+        resigned = False
+        while True:
+            attempt += 1
+            timeout = self.timeout
+            if deadline is not None:
+                deadline.check()
+                remaining = deadline.remaining()
+                if remaining is not None:
+                    timeout = remaining if timeout is None else min(timeout, remaining)
+            client = self.client
+            kwargs = {}
+            if self.rate_limiter and getattr(client, "takes_rate_limiter", False):
+                # the client takes the token once the request's turn comes
+                kwargs["rate_limiter"] = self.rate_limiter
+            elif self.rate_limiter and not self.rate_limiter.acquire(timeout=None if deadline is None else deadline.remaining()):
+                raise SolisTimeoutException(f"There was an error - the rate limit for {uri} leaves no time before the deadline")
+            headers = self.signer.sign(payload, uri)
+            self.headers = headers
+            sent = monotonic()
+            try:
+                res = client.post(url, data=payload, headers=headers, timeout=timeout, **kwargs)
+            except OSError as err:
+                # requests' exceptions (timeouts included) derive from IOError;
+                # a write is only sent again when it cannot have arrived
+                if attempt >= self.retries or (write and not _not_sent(err)):
+                    raise
+                self.__wait__(self.__backoff__(attempt), deadline)
+                continue
+            offset = self.signer.clock_offset
+            response_headers = getattr(res, "headers", None)
+            if response_headers:
+                self.signer.observe_date(response_headers.get("Date"), monotonic() - sent)
+            if res.status_code in (401, 403) and not resigned and self.signer.clock_offset != offset:
+                # rejected because our clock is off; sign again straight away
+                # without using up an attempt
+                resigned = True
+                attempt -= 1
+                continue
+            if res.status_code == 429 and rate_limits is not None:
+                rate_limits.add()
+            if res.status_code == 429 and attempt < self.retries:
+                self.__wait__(self.__backoff__(attempt), deadline)
+                continue
+            return res
+
+    def __wait__(self, seconds: float, deadline: Optional[Deadline]):
+        if deadline is None:
+            self._sleep(seconds)
+        else:
+            deadline.sleep(seconds)
+
+    def __backoff__(self, attempt: int) -> float:
+        return min(float(2 ** (attempt - 1)), self.retry_max_wait)
+
+    def __post__(self, uri: str, body: dict, coalesce: bool = True, attrs: Optional[dict] = None):
+        if not (coalesce and self.coalesce_requests):
+            return self.__send__(uri, body, attrs)
+        key = f"{uri}\n{json.dumps(body, sort_keys=True, separators=(',',':'))}"
+        return self._single_flight.do(key, lambda: self.__send__(uri, body, attrs), attrs.get("deadline") if attrs else None)
     
+    def use(self, middleware: Middleware) -> Middleware:
+        """Append a middleware to the chain every endpoint call passes through."""
+        self._middleware.append(middleware)
+        self._pipeline = None
+        return middleware
+
+    def __dispatch__(self, request: EndpointRequest):
+        coalesce = not (request.endpoint.write or request.attrs.get("hedge"))
+        return self.__post__(request.endpoint.uri, request.body, coalesce, request.attrs)
+
+    def __execute__(self, endpoint: Endpoint, body: dict):
+        pipeline = self._pipeline
+        if pipeline is None:
+            pipeline = self._pipeline = build_pipeline(self._middleware, self.__dispatch__)
+        request = EndpointRequest(endpoint, body)
+        if endpoint.write:
+            request.attrs["write"] = True
+        deadline = current_deadline()
+        if deadline is not None:
+            deadline.check()
+            request.attrs["deadline"] = deadline
+        rate_limits = RateLimitCounter.current()
+        if rate_limits is not None:
+            request.attrs["rate_limits"] = rate_limits
+        return pipeline(request)
+
+    def __request__(self, endpoint: Endpoint, params: dict, extra: Optional[dict] = None, default=None):
+        return endpoint.unwrap(self.__execute__(endpoint, endpoint.build_body(params, extra)), default)
+
     def __expose_error__(self, res_json) -> str:
         error_message = ""
         data = res_json.get('data', {}) or {}
@@ -1350,342 +318,373 @@ class SolisCloud():
             ret_val = None
         return ret_val
 
-    def list_stations(self, pageNo: int = 1, pageSize: int = 20, NmiCode: str = None, **kwargs) -> tuple[StatusVo, list[SolisStation]]:
-        has_more = True
-        stations: list[SolisStation] = []
+    def __fetch_page__(self, endpoint: Endpoint, body: dict, pageNo: int) -> tuple[dict, list[dict], int]:
+        attempt = 0
+        while True:
+            attempt += 1
+            res = self.__execute__(endpoint, dict(body, pageNo=pageNo))
+            # listings are reads, so a page the server failed on is asked for
+            # again on its own instead of failing the whole sweep
+            if res.status_code < 500 or attempt > self.page_retries:
+                break
+            self.__wait__(self.__backoff__(attempt), current_deadline())
+        data = endpoint.unwrap(res, {})
+        # most listings nest the page under "page", alarmList returns it as data itself
+        page = data.get('page', data) or {}
+        return data, page.get('records', []) or [], page.get('pages', 1) or 1
+
+    def __paginate__(self, endpoint: Endpoint, body: dict, concurrency: int = 1, errors: Optional[dict] = None) -> Iterator[tuple[dict, list[dict]]]:
+        def fetch(pageNo: int):
+            try:
+                return self.__fetch_page__(endpoint, body, pageNo)
+            except SolisTimeoutException:
+                raise
+            except (SolisConnectException, OSError) as err:
+                if errors is None:
+                    raise
+                errors[pageNo] = err
+                return None
+
+        seen = set()
+
+        def unique(records: list[dict]) -> list[dict]:
+            # records shifting between pages while the sweep runs show up twice
+            if endpoint.key is None:
+                return records
+            fresh = []
+            for record in records:
+                value = record.get(endpoint.key)
+                if value is None or value not in seen:
+                    seen.add(value)
+                    fresh.append(record)
+            return fresh
+
+        pageNo = body.get("pageNo", 1)
+        page = fetch(pageNo)
+        if page is None:
+            return
+        data, records, pages = page
+        yield data, unique(records)
+        if concurrency <= 1:
+            while pages > pageNo:
+                pageNo += 1
+                page = fetch(pageNo)
+                if page is not None:
+                    data, records, pages = page
+                    yield data, unique(records)
+            return
+        # the page count of the first page fixes the sweep; pages are fetched
+        # in a sliding window but yielded in order
+        fetch = propagate(fetch)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            window = deque()
+            next_page = pageNo + 1
+            try:
+                while window or next_page <= pages:
+                    while next_page <= pages and len(window) < concurrency:
+                        window.append(executor.submit(fetch, next_page))
+                        next_page += 1
+                    page = window.popleft().result()
+                    if page is not None:
+                        yield page[0], unique(page[1])
+            finally:
+                for future in window:
+                    future.cancel()
+
+    def __iter_records__(self, endpoint: Endpoint, params: dict, extra: dict, concurrency: int = 1, errors: Optional[dict] = None) -> Iterator:
+        factory = endpoint.model
+        for _, records in self.__paginate__(endpoint, endpoint.build_body(params, extra), concurrency, errors):
+            for record in records:
+                yield factory(self)._from_json(record)
+
+    def __list__(self, endpoint: Endpoint, params: dict, extra: dict, concurrency: int = 1, errors: Optional[dict] = None) -> tuple[StatusVo, list]:
+        from soliscloud.models import StatusVo
         status_vo: StatusVo = StatusVo()
-        while has_more:
-            body = {
-                "pageNo": pageNo, 
-                "pageSize": pageSize
-            }
-            if NmiCode:
-                body.update({
-                    "NmiCode": NmiCode
-                })
-            for k, v in kwargs:
-                body.update({
-                    k: v
-                })
-            uri = "/v1/api/userStationList"
-            url = f"{self.base_url}{uri}"
-            self.__generate_authorization__("POST", json.dumps(body, separators=(',',':')), "application/json", uri)
-            res = self.client.post(url, json=body, headers=self.headers)
-            if res.status_code == 200:
-                res_json = res.json()
-                data = res_json.get('data', {})
-                station_status_vo = data.get('stationStatusVo', {})
-                page = data.get('page', {})
-                total_pages = page.get('pages', 1)
-                if total_pages > pageNo:
-                    has_more = True
-                else:
-                    has_more = False
-                station_list = page.get('records')
-                status_vo._from_json(station_status_vo)
-                [stations.append(SolisStation(self)._from_json(x)) for x in station_list]
-                if has_more:
-                    pageNo += 1
-            else:
-                has_more = False
-                raise SolisConnectException(f"There was an error - {res.status_code} - {res.reason}")
-        return status_vo, stations
+        items = []
+        factory = endpoint.model
+        try:
+            for data, records in self.__paginate__(endpoint, endpoint.build_body(params, extra), concurrency, errors):
+                status_vo._from_json(data.get(endpoint.status_key, {}) or {})
+                items.extend(factory(self)._from_json(x) for x in records)
+        except SolisConnectException as err:
+            err.partial = (status_vo, items)
+            raise
+        return status_vo, items
+
+    def iter_stations(self, pageSize: int = 100, nmiCode: str = None, concurrency: int = 1, errors: Optional[dict] = None, **kwargs) -> Iterator[SolisStation]:
+        """Stream all stations page by page, fetching up to ``concurrency`` pages at once."""
+        return self.__iter_records__(STATION_LIST, {"pageSize": pageSize, "nmiCode": nmiCode}, kwargs, concurrency, errors)
+
+    def iter_inverters(self, pageSize: int = 100, stationId: str = None, nmiCode: str = None, concurrency: int = 1, errors: Optional[dict] = None, **kwargs) -> Iterator[SolisInverter]:
+        """Stream all inverters page by page, fetching up to ``concurrency`` pages at once."""
+        return self.__iter_records__(INVERTER_LIST, {"pageSize": pageSize, "stationId": stationId, "nmiCode": nmiCode}, kwargs, concurrency, errors)
+
+    def iter_inverter_pages(self, pageSize: int = 100, stationId: str = None, nmiCode: str = None, concurrency: int = 1, errors: Optional[dict] = None, **kwargs) -> Iterator[list[dict]]:
+        """Stream the raw inverter records page by page, without building model objects."""
+        body = INVERTER_LIST.build_body({"pageSize": pageSize, "stationId": stationId, "nmiCode": nmiCode}, kwargs)
+        for _, records in self.__paginate__(INVERTER_LIST, body, concurrency, errors):
+            yield records
+
+    def iter_epms(self, pageSize: int = 100, stationId: str = None, nmiCode: str = None, concurrency: int = 1, errors: Optional[dict] = None, **kwargs) -> Iterator[SolisEPM]:
+        """Stream all EPMs page by page, fetching up to ``concurrency`` pages at once."""
+        return self.__iter_records__(EPM_LIST, {"pageSize": pageSize, "stationId": stationId, "nmiCode": nmiCode}, kwargs, concurrency, errors)
+
+    def iter_collectors(self, pageSize: int = 100, stationId: str = None, nmiCode: str = None, concurrency: int = 4, errors: Optional[dict] = None, **kwargs) -> Iterator[SolisCollector]:
+        """Stream all collectors (dataloggers) page by page, fetching up to ``concurrency`` pages at once."""
+        return self.__iter_records__(COLLECTOR_LIST, {"pageSize": pageSize, "stationId": stationId, "nmiCode": nmiCode}, kwargs, concurrency, errors)
+
+    def list_stations(self, pageNo: int = 1, pageSize: int = 20, NmiCode: str = None, concurrency: int = 1, errors: Optional[dict] = None, **kwargs) -> tuple[StatusVo, list[SolisStation]]:
+        return self.__list__(STATION_LIST, {"pageNo": pageNo, "pageSize": pageSize, "nmiCode": NmiCode}, kwargs, concurrency, errors)
     
+    def get_station_detail_data(self, id: int, nmiCode: str = None, **kwargs) -> dict:
+        return self.__request__(STATION_DETAIL, {"id": id, "nmiCode": nmiCode}, kwargs, {})
+
     def get_station_detail(self, id: int, nmiCode: str = None, **kwargs) -> SolisStation:
-        body = {
-            "id": id
-        }
-        if nmiCode:
-            body.update({
-                "nmiCode": nmiCode
-            })
-        for k,v in kwargs:
-            body.update({
-                k: v
-            })
-        uri = "/v1/api/stationDetail"
-        url = f"{self.base_url}{uri}"
-        self.__generate_authorization__("POST", json.dumps(body, separators=(',',':')), "application/json", uri)
-        res = self.client.post(url, json=body, headers=self.headers)
-        if res.status_code == 200:
-            res_json = res.json()
-            success = res_json.get('success', False)
-            msg = res_json.get('msg', '')
-            if not success:
-                raise SolisConnectException(f"There was an error - {msg} - {res.status_code} - {res.reason}")
-            data = res_json.get('data', {}) or {}
-            station = SolisStation()._from_json(data)
-            return station
-            
-        else:
-            raise SolisConnectException(f"There was an error - {res.status_code} - {res.reason}")
+        data = self.get_station_detail_data(id, nmiCode, **kwargs)
+        return STATION_DETAIL.model(self)._from_json(data)
 
-    def list_epms(self, pageNo: int = 1, pageSize: int = 20, stationId: str = "", NmiCode: str = None, **kwargs) -> tuple[StatusVo, list[SolisEPM]]:
-        has_more = True
-        epms: list[SolisEPM] = []
-        status_vo: StatusVo = StatusVo()
-        while has_more:
-            body = {
-                "pageNo": pageNo, 
-                "pageSize": pageSize
-            }
-            if NmiCode:
-                body.update({
-                    "NmiCode": NmiCode
-                })
-            if stationId:
-                body.update({
-                    "stationId": stationId
-                })
-            for k, v in kwargs:
-                body.update({
-                    k: v
-                })
-            uri = "/v1/api/epmList"
-            url = f"{self.base_url}{uri}"
-            self.__generate_authorization__("POST", json.dumps(body, separators=(',',':')), "application/json", uri)
-            res = self.client.post(url, json=body, headers=self.headers)
-            if res.status_code == 200:
-                res_json = res.json()
-                success = res_json.get('success', False)
-                msg = res_json.get('msg', '')
-                if not success:
-                    raise SolisConnectException(f"There was an error - {msg} - {res.status_code} - {res.reason}")
-                data = res_json.get('data', {})
-                station_status_vo = data.get('epmStatusVo', {})
-                page = data.get('page', {})
-                total_pages = page.get('pages', 1)
-                if total_pages > pageNo:
-                    has_more = True
-                else:
-                    has_more = False
-                epm_list = page.get('records')
-                status_vo._from_json(station_status_vo)
-                [epms.append(SolisEPM(self)._from_json(x)) for x in epm_list]
-                if has_more:
-                    pageNo += 1
-            else:
-                has_more = False
-                raise SolisConnectException(f"There was an error - {res.status_code} - {res.reason}")
-        return status_vo, epms
+    def list_epms(self, pageNo: int = 1, pageSize: int = 20, stationId: str = "", NmiCode: str = None, concurrency: int = 1, errors: Optional[dict] = None, **kwargs) -> tuple[StatusVo, list[SolisEPM]]:
+        return self.__list__(EPM_LIST, {"pageNo": pageNo, "pageSize": pageSize, "stationId": stationId, "nmiCode": NmiCode}, kwargs, concurrency, errors)
+
+    def get_epm_detail_data(self, sn: int, **kwargs) -> dict:
+        return self.__request__(EPM_DETAIL, {"sn": sn}, kwargs, {})
 
     def get_epm_detail(self, sn: int, **kwargs) -> SolisEPM:
-        body = {
-            "sn": sn
-        }
-        for k,v in kwargs:
-            body.update({
-                k: v
-            })
-        uri = "/v1/api/epmDetail"
-        url = f"{self.base_url}{uri}"
-        self.__generate_authorization__("POST", json.dumps(body, separators=(',',':')), "application/json", uri)
-        res = self.client.post(url, json=body, headers=self.headers)
-        if res.status_code == 200:
-            res_json = res.json()
-            success = res_json.get('success', False)
-            msg = res_json.get('msg', '')
-            if not success:
-                raise SolisConnectException(f"There was an error - {msg} - {res.status_code} - {res.reason}")
-            data = res_json.get('data', {}) or {}
-            epm = SolisEPM(self)._from_json(data)
-            return epm
-            
-        else:
-            raise SolisConnectException(f"There was an error - {res.status_code} - {res.reason}")
+        data = self.get_epm_detail_data(sn, **kwargs)
+        return EPM_DETAIL.model(self)._from_json(data)
 
     def get_epm_data_for_day(self, sn: str, dt: date, timeZone: int, searchinfo: list[EPMFields] = [], **kwargs) -> EPMDayData:
         default_fields = ["u_ac1","u_ac2","u_ac3","i_ac1","i_ac2","i_ac3","p_ac1","p_ac2","p_ac3","power_factor","fac_meter","p_load","e_total_inverter","e_total_load","e_total_buy","e_total_sell"]
-        body = {
-            "sn": sn,
-            "time": dt.strftime("%Y-%m-%d"),
-            "timeZone": timeZone
-        }
-        if searchinfo:
-            body.update({
-                "searchinfo": ",".join(searchinfo)
-            })
-        else:
-            body.update({
-                "searchinfo": ",".join(default_fields)
-            })
-        for k, v in kwargs.items():
-            body.update({
-                k: v
-            })
-        uri = "/v1/api/epm/day"
-        url = f"{self.base_url}{uri}"
-        self.__generate_authorization__("POST", json.dumps(body, separators=(',',':')), "application/json", uri)
-        res = self.client.post(url, json=body, headers=self.headers)
-        if res.status_code == 200:
-            res_json = res.json()
-            success = res_json.get('success', False)
-            msg = res_json.get('msg', '')
-            if not success:
-                raise SolisConnectException(f"There was an error - {msg} - {res.status_code} - {res.reason}")
-            data = res_json.get('data', {}) or {}
-            day_data = EPMDayData()._from_json_(data)
-            return day_data
-        else:
-            raise SolisConnectException(f"There was an error - {res.status_code} - {res.reason}")
+        params = {"sn": sn, "time": dt, "timeZone": timeZone, "searchinfo": ",".join(searchinfo or default_fields)}
+        data = self.__request__(EPM_DAY, params, kwargs, {})
+        from soliscloud.models import EPMDayData
+        return EPMDayData(timeZone)._from_json_(data)
     
     def get_epm_data_for_month(self, sn: str, dt: date, **kwargs) -> EPMMonthYearData:
-        body = {
-            "sn": sn,
-            "month": dt.strftime("%Y-%m")
-        }
-        for k, v in kwargs.items():
-            body.update({
-                k: v
-            })
-        uri = "/v1/api/epm/month"
-        url = f"{self.base_url}{uri}"
-        self.__generate_authorization__("POST", json.dumps(body, separators=(',',':')), "application/json", uri)
-        res = self.client.post(url, json=body, headers=self.headers)
-        if res.status_code == 200:
-            res_json = res.json()
-            success = res_json.get('success', False)
-            msg = res_json.get('msg', '')
-            if not success:
-                raise SolisConnectException(f"There was an error - {msg} - {res.status_code} - {res.reason}")
-            data = res_json.get('data', {}) or {}
-            month_data = EPMMonthYearData()._from_json_(data)
-            return month_data
-        else:
-            raise SolisConnectException(f"There was an error - {res.status_code} - {res.reason}")
+        data = self.__request__(EPM_MONTH, {"sn": sn, "month": dt}, kwargs, {})
+        from soliscloud.models import EPMMonthYearData
+        return EPMMonthYearData()._from_json_(data)
     
     def get_epm_data_for_year(self, sn: str, dt: date, **kwargs) -> EPMMonthYearData:
-        body = {
-            "sn": sn,
-            "year": dt.strftime("%Y")
+        data = self.__request__(EPM_YEAR, {"sn": sn, "year": dt}, kwargs, {})
+        from soliscloud.models import EPMMonthYearData
+        return EPMMonthYearData()._from_json_(data)
+
+    def __get_history__(self, endpoint: Endpoint, params: dict, extra: dict, period: str) -> HistoryData:
+        data = self.__request__(endpoint, params, extra, [])
+        from soliscloud.models import HistoryData
+        return HistoryData(params["timeZone"], period)._from_json_(data)
+
+    def get_station_data_for_day(self, id: str, dt: date, timeZone: float = 0, money: str = "", **kwargs) -> HistoryData:
+        return self.__get_history__(STATION_DAY, {"id": id, "time": dt, "timeZone": timeZone, "money": money}, kwargs, "day")
+
+    def get_station_data_for_month(self, id: str, dt: date, timeZone: float = 0, money: str = "", **kwargs) -> HistoryData:
+        return self.__get_history__(STATION_MONTH, {"id": id, "month": dt, "timeZone": timeZone, "money": money}, kwargs, "month")
+
+    def get_station_data_for_year(self, id: str, dt: date, timeZone: float = 0, money: str = "", **kwargs) -> HistoryData:
+        return self.__get_history__(STATION_YEAR, {"id": id, "year": dt, "timeZone": timeZone, "money": money}, kwargs, "year")
+
+    def get_inverter_data_for_day(self, id: str, sn: str, dt: date, timeZone: float = 0, money: str = "", **kwargs) -> HistoryData:
+        return self.__get_history__(INVERTER_DAY, {"id": id, "sn": sn, "time": dt, "timeZone": timeZone, "money": money}, kwargs, "day")
+
+    def get_inverter_data_for_month(self, id: str, sn: str, dt: date, timeZone: float = 0, money: str = "", **kwargs) -> HistoryData:
+        return self.__get_history__(INVERTER_MONTH, {"id": id, "sn": sn, "month": dt, "timeZone": timeZone, "money": money}, kwargs, "month")
+
+    def get_inverter_data_for_year(self, id: str, sn: str, dt: date, timeZone: float = 0, money: str = "", **kwargs) -> HistoryData:
+        return self.__get_history__(INVERTER_YEAR, {"id": id, "sn": sn, "year": dt, "timeZone": timeZone, "money": money}, kwargs, "year")
+
+    def __get_history_range__(self, fetch, start: date, end: date, period: str, timeZone: float, concurrency: int) -> HistoryData:
+        from soliscloud.models import HistoryData
+        periods = history_periods(start, end, period)
+        result = HistoryData(timeZone, period)
+        try:
+            if concurrency <= 1 or len(periods) <= 1:
+                for dt in periods:
+                    result.extend(fetch(dt))
+                return result
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(periods))) as executor:
+                for data in executor.map(propagate(fetch), periods):
+                    result.extend(data)
+        except SolisTimeoutException as err:
+            # the periods before the one that timed out
+            err.partial = result
+            raise
+        return result
+
+    def get_station_history(self, id: str, start: date, end: date, period: str = "day", timeZone: float = 0, money: str = "", concurrency: int = 4, **kwargs) -> HistoryData:
+        """Fetch station history for every day, month or year from ``start`` to ``end`` (inclusive).
+
+        Periods are requested concurrently and concatenated in order.
+
+        Args:
+            id (str): Station ID
+            start (date): First day (or any day in the first month / year)
+            end (date): Last day (or any day in the last month / year)
+            period (str): ``day``, ``month`` or ``year``
+            timeZone (float): Station time zone in hours
+            money (str): Currency code for income values
+            concurrency (int): Periods fetched at once
+        """
+        fetchers = {
+            "day": self.get_station_data_for_day, "month": self.get_station_data_for_month, "year": self.get_station_data_for_year
         }
-        for k, v in kwargs.items():
-            body.update({
-                k: v
-            })
-        uri = "/v1/api/epm/year"
-        url = f"{self.base_url}{uri}"
-        self.__generate_authorization__("POST", json.dumps(body, separators=(',',':')), "application/json", uri)
-        res = self.client.post(url, json=body, headers=self.headers)
-        if res.status_code == 200:
-            res_json = res.json()
-            success = res_json.get('success', False)
-            msg = res_json.get('msg', '')
-            if not success:
-                raise SolisConnectException(f"There was an error - {msg} - {res.status_code} - {res.reason}")
-            data = res_json.get('data', {}) or {}
-            year_data = EPMMonthYearData()._from_json_(data)
-            return year_data
-        else:
-            raise SolisConnectException(f"There was an error - {res.status_code} - {res.reason}")
+        if period not in fetchers:
+            raise ValueError(f"Unknown period {period!r}")
+        fetch = fetchers[period]
+        return self.__get_history_range__(lambda dt: fetch(id, dt, timeZone, money, **kwargs), start, end, period, timeZone, concurrency)
+
+    def get_inverter_history(self, id: str, sn: str, start: date, end: date, period: str = "day", timeZone: float = 0, money: str = "", concurrency: int = 4, **kwargs) -> HistoryData:
+        """Fetch inverter history for every day, month or year from ``start`` to ``end``; see ``get_station_history``."""
+        fetchers = {
+            "day": self.get_inverter_data_for_day, "month": self.get_inverter_data_for_month, "year": self.get_inverter_data_for_year
+        }
+        if period not in fetchers:
+            raise ValueError(f"Unknown period {period!r}")
+        fetch = fetchers[period]
+        return self.__get_history_range__(lambda dt: fetch(id, sn, dt, timeZone, money, **kwargs), start, end, period, timeZone, concurrency)
 
-    def list_collectors(self, page_number: int = 1, page_size: int = 20, nmi_code: str = None, station_id: int = None):
-        args = [{k: v} for k, v in locals().items() if k != "self"]
-        body = {}
-        [body.update(x) for x in args]
-        return_value = {}
-        uri = "/v1/api/collectorList"
-        url = f"{self.base_url}{uri}"
-        self.__generate_authorization__("POST", json.dumps(body, separators=(',',':')), "application/json", uri)
-        res = self.client.post(url, json=body, headers=self.headers)
-        if res.status_code == 200:
-            return_value = res.json()
-        return return_value
+    def iter_alarms(self, pageSize: int = 100, stationId: str = None, alarmDeviceSn: str = None, alarmBeginTime: date = None, alarmEndTime: date = None, nmiCode: str = None, concurrency: int = 1, errors: Optional[dict] = None, **kwargs) -> Iterator[SolisAlarm]:
+        """Stream alarms page by page, fetching up to ``concurrency`` pages at once.
+
+        Args:
+            stationId (str): Only alarms of this station
+            alarmDeviceSn (str): Only alarms of this device
+            alarmBeginTime (date): Only alarms raised on or after this day
+            alarmEndTime (date): Only alarms raised on or before this day
+            errors (dict): Collect pages that fail here instead of raising; see ``list_collectors``
+        """
+        params = {
+            "pageSize": pageSize, "stationId": stationId, "alarmDeviceSn": alarmDeviceSn,
+            "alarmBeginTime": alarmBeginTime, "alarmEndTime": alarmEndTime, "nmiCode": nmiCode
+        }
+        return self.__iter_records__(ALARM_LIST, params, kwargs, concurrency, errors)
+
+    def list_alarms(self, pageSize: int = 100, stationId: str = None, alarmDeviceSn: str = None, alarmBeginTime: date = None, alarmEndTime: date = None, nmiCode: str = None, concurrency: int = 4, errors: Optional[dict] = None, **kwargs) -> list[SolisAlarm]:
+        return list(self.iter_alarms(pageSize, stationId, alarmDeviceSn, alarmBeginTime, alarmEndTime, nmiCode, concurrency, errors, **kwargs))
+
+    def list_collectors(self, pageNo: int = 1, pageSize: int = 100, stationId: str = None, nmiCode: str = None, concurrency: int = 4, errors: Optional[dict] = None, **kwargs) -> tuple[StatusVo, list[SolisCollector]]:
+        """List all collectors (dataloggers), fetching pages concurrently.
+
+        Args:
+            pageNo (int): First page to fetch
+            pageSize (int): Collectors per page
+            stationId (str): Only list the collectors of this station
+            nmiCode (str): Only list the collectors for this NMI code
+            concurrency (int): Pages fetched at once after the first
+            errors (dict): Collect pages that fail here (page number to exception) and return the
+                other pages instead of raising
+        """
+        return self.__list__(COLLECTOR_LIST, {"pageNo": pageNo, "pageSize": pageSize, "stationId": stationId, "nmiCode": nmiCode}, kwargs, concurrency, errors)
     
-    def list_inverters(self, pageNo: int = 1, pageSize: int = 100, stationId: str = None, nmiCode: str = None, **kwargs) -> tuple[StatusVo, list[SolisInverter]]:
-        isvo: StatusVo = StatusVo()
-        solis_inverters: list[SolisInverter] = []
-        has_more = True
-        while has_more:
-            body = {
-                "pageNo": pageNo,
-                "pageSize": pageSize
-            }
-            if stationId:
-                body.update({
-                    "stationId": stationId
-                })
-            if nmiCode:
-                body.update({
-                    "nmiCode": nmiCode
-                })
-            for k, v in kwargs:
-                body.update({
-                    k: v
-                })
-            uri = "/v1/api/inverterList"
-            url = f"{self.base_url}{uri}"
-            self.__generate_authorization__("POST", json.dumps(body, separators=(',',':')), "application/json", uri)
-            
-            res = self.client.post(url, json=body, headers=self.headers)
-            if res.status_code == 200:
-                res_json = res.json()
-                success = res_json.get('success', False)
-                msg = res_json.get('msg', '')
-                if not success:
-                    has_more = False
-                    raise SolisConnectException(f"There was an error - {msg}")
-                data = res_json.get('data', {}) or {}
-                inverter_status_vo = data.get('inverterStatusVo', {}) or {}
-                isvo: StatusVo = StatusVo()._from_json(inverter_status_vo)
-                page = data.get('page', {})
-                total_pages = page.get('pages', 1)
-                if total_pages > pageNo:
-                    has_more = True
-                else:
-                    has_more = False
-                records = page.get('records', []) or []
-                [solis_inverters.append(SolisInverter(self)._from_json(x)) for x in records]
-                if has_more:
-                    pageNo += 1
-                    body.update({
-                        "pageNo": pageNo
-                    })
-            else:
-                has_more = False
-                raise SolisConnectException(f"There was an error - {res.status_code} - {res.reason}")
-        return isvo, solis_inverters
+    def list_inverters(self, pageNo: int = 1, pageSize: int = 100, stationId: str = None, nmiCode: str = None, concurrency: int = 1, errors: Optional[dict] = None, **kwargs) -> tuple[StatusVo, list[SolisInverter]]:
+        return self.__list__(INVERTER_LIST, {"pageNo": pageNo, "pageSize": pageSize, "stationId": stationId, "nmiCode": nmiCode}, kwargs, concurrency, errors)
+
+    def get_inverter_detail_data(self, id: str, sn: str, **kwargs) -> dict:
+        return self.__request__(INVERTER_DETAIL, {"id": id, "sn": sn}, kwargs, {})
 
     def get_inverter_details(self, id: str, sn: str, **kwargs) -> SolisInverter:
-        body = {
-            "id": id,
-            "sn": sn
-        }
-        for k, v in kwargs:
-            body.update({
-                k: v
-            })
-        uri = "/v1/api/inverterDetail"
-        url = f"{self.base_url}{uri}"
-        self.__generate_authorization__("POST", json.dumps(body, separators=(',',':')), "application/json", uri)
-        res = self.client.post(url, json=body, headers=self.headers)
-        if res.status_code == 200:
-            res_json = res.json()
-            success = res_json.get('success', False)
-            msg = res_json.get('msg', '')
-            if not success:
-                raise SolisConnectException(f"There was an error - {msg} - {res.status_code} - {res.reason}")
-            data = res_json.get('data', {})
-            inverter = SolisInverter(self)._from_json(data)
-            inverter.charge_discharge_schedule = inverter.get_charge_discharge_schedules()
-            return inverter
-        else:
-            raise SolisConnectException(f"There was an error - {res.status_code} - {res.reason}")
+        data = self.get_inverter_detail_data(id, sn, **kwargs)
+        inverter = INVERTER_DETAIL.model(self)._from_json(data)
+        inverter.charge_discharge_schedule = inverter.get_charge_discharge_schedules()
+        return inverter
+
+    def get_inverter_details_many(self, inverters: Iterable[tuple[str, str]], max_concurrency: int = 16, initial_concurrency: int = 4, target_latency: float = 2.0, with_schedule: bool = False, **kwargs) -> Iterator[tuple[str, str, Optional[SolisInverter], Optional[Exception]]]:
+        """Fetch details for many inverters concurrently, yielding results as they complete.
+
+        Concurrency starts at ``initial_concurrency`` and adapts AIMD-style:
+        it grows while requests return within ``target_latency`` and is cut
+        when requests are slow or hit the rate limit (429).
+
+        Args:
+            inverters (Iterable[tuple[str, str]]): ``(id, sn)`` pairs
+            max_concurrency (int): Upper bound for requests in flight
+            initial_concurrency (int): Requests in flight at the start
+            target_latency (float): Seconds above which a request counts as congestion
+            with_schedule (bool): Also read each inverter's charge / discharge schedule (one extra request each)
+
+        Yields:
+            tuple: ``(id, sn, inverter, error)``; a failed inverter yields ``None`` and its exception
+            instead of aborting the batch.
+        """
+        limiter = AdaptiveConcurrency(initial_concurrency, 1, max_concurrency, target_latency)
+        remaining = deque(inverters)
+
+        def fetch(id: str, sn: str):
+            # counts only the 429s of this inverter's own requests
+            with RateLimitCounter() as rate_limits:
+                started = monotonic()
+                try:
+                    inverter = INVERTER_DETAIL.model(self)._from_json(self.get_inverter_detail_data(id, sn, **kwargs))
+                    if with_schedule:
+                        inverter.get_charge_discharge_schedules()
+                    return inverter, None, monotonic() - started, rate_limits.count > 0
+                except Exception as err:
+                    return None, err, monotonic() - started, rate_limits.count > 0
+
+        fetch_bound = propagate(fetch)
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            in_flight = {}
+            while remaining or in_flight:
+                while remaining and len(in_flight) < limiter.current:
+                    id, sn = remaining.popleft()
+                    in_flight[executor.submit(fetch_bound, id, sn)] = (id, sn)
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    id, sn = in_flight.pop(future)
+                    inverter, error, latency, rate_limited = future.result()
+                    if rate_limited:
+                        limiter.on_congestion()
+                    elif error is None:
+                        limiter.on_success(latency)
+                    else:
+                        limiter.on_error()
+                    yield id, sn, inverter, error
+
+    def __refresh_from_listing__(self, objects: Iterable, endpoint: Endpoint, pageSize: int, key: str) -> dict[str, set[str]]:
+        by_key = {getattr(x, key): x for x in objects}
+        changes = {}
+        for _, records in self.__paginate__(endpoint, endpoint.build_body({"pageSize": pageSize})):
+            for record in records:
+                obj = by_key.get(record.get(key))
+                if obj is not None:
+                    changes[record[key]] = obj._update_from_json(record)
+        return changes
+
+    def refresh_stations(self, stations: Iterable[SolisStation], pageSize: int = 100) -> dict[str, set[str]]:
+        """Update station objects in place from one sweep of the station list.
+
+        Returns:
+            dict[str, set[str]]: The changed fields per station id, for every station found in the listing
+        """
+        return self.__refresh_from_listing__(stations, STATION_LIST, pageSize, "id")
+
+    def refresh_epms(self, epms: Iterable[SolisEPM], pageSize: int = 100) -> dict[str, set[str]]:
+        """Update EPM objects in place from one sweep of the EPM list; returns the changed fields per sn."""
+        return self.__refresh_from_listing__(epms, EPM_LIST, pageSize, "sn")
+
+    def refresh_inverters(self, inverters: Iterable[SolisInverter], details: bool = False, max_workers: int = 8, pageSize: int = 100) -> dict[str, set[str]]:
+        """Update inverter objects in place.
+
+        Args:
+            inverters (Iterable[SolisInverter]): The inverters to refresh
+            details (bool): Re-read each inverter's detail endpoint concurrently instead of
+                sweeping the (cheaper, but less detailed) inverter list
+            max_workers (int): Concurrent detail requests when ``details`` is set
+
+        Returns:
+            dict[str, set[str]]: The changed fields per inverter sn
+        """
+        inverters = list(inverters)
+        if not details:
+            return self.__refresh_from_listing__(inverters, INVERTER_LIST, pageSize, "sn")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip([x.sn for x in inverters], executor.map(lambda x: x.refresh(), inverters)))
 
     def set_inverter_charge_discharge_schedule(self, id: str, sn: str, schedule: ChargeDischargeSchedule) -> SolisSetResult:
-        value = schedule.to_value()
-        body = {
-            "inverterSn": sn,
-            "inverterId": id,
-            "cid": 103,
-            "value": value
-        }
-        return_value = {}
-        uri = "/v2/api/control"
-        url = f"{self.base_url}{uri}"
-        self.__generate_authorization__("POST", json.dumps(body, separators=(',',':')), "application/json", uri)
-        res = self.client.post(url, json=body, headers=self.headers)
+        body = CONTROL.build_body({"inverterSn": sn, "inverterId": id, "cid": 103, "value": schedule.to_value()})
+        res = self.__execute__(CONTROL, body)
         res_json = res.json()
+        from soliscloud.models import SolisSetResult
         result = SolisSetResult()
         if res.status_code == 200:
             data = res_json.get('data', []) or []
@@ -1700,14 +699,7 @@ class SolisCloud():
         return result
     
     def get_charge_discharge_schedule(self, sn: str) -> ChargeDischargeSchedule:
-        body = {
-            "inverterSn": sn,
-            "cid": 103,
-        }
-        uri = "/v2/api/atRead"
-        url = f"{self.base_url}{uri}"
-        self.__generate_authorization__("POST", json.dumps(body, separators=(',',':')), "application/json", uri)
-        res = self.client.post(url, json=body, headers=self.headers)
+        res = self.__execute__(AT_READ, AT_READ.build_body({"inverterSn": sn, "cid": 103}))
         if res.status_code == 200:
             res_json = res.json()
             data = res_json.get('data', {}) or {}
@@ -1718,6 +710,7 @@ class SolisCloud():
             msg = data.get('msg', "") or ""
             if msg:
                 msg_split: list = msg.split(",")
+                from soliscloud.models import ChargeDischargeSchedule
                 s = ChargeDischargeSchedule()
                 
                 s.one.charge.current = msg_split.pop(0)
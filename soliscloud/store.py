@@ -0,0 +1,212 @@
+from __future__ import annotations
+from array import array
+from datetime import datetime
+from typing import Iterable, Optional, Union
+import sqlite3
+import threading
+import time
+from soliscloud.models import EPMDayData
+
+DEFAULT_INVERTER_FIELDS = (
+    "pac", "eToday", "eTotal", "state", "inverterTemperature", "batteryPower", "batteryCapacitySoc",
+    "familyLoadPower", "gridPurchasedTodayEnergy", "gridSellTodayEnergy", "psum", "uPv1", "iPv1", "uPv2", "iPv2"
+)
+
+Timestamp = Union[int, float, datetime]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS series (
+    id INTEGER PRIMARY KEY,
+    sn TEXT NOT NULL,
+    field TEXT NOT NULL,
+    UNIQUE (sn, field)
+);
+CREATE TABLE IF NOT EXISTS samples (
+    series_id INTEGER NOT NULL,
+    ts INTEGER NOT NULL,
+    value REAL,
+    PRIMARY KEY (series_id, ts)
+) WITHOUT ROWID;
+"""
+
+_AGGREGATES = {"avg": "AVG", "min": "MIN", "max": "MAX", "sum": "SUM", "count": "COUNT", "first": "MIN", "last": "MAX"}
+
+
+def to_millis(value: Timestamp) -> int:
+    if isinstance(value, datetime):
+        return int(value.timestamp() * 1000)
+    return int(value)
+
+
+def _number(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class TelemetryStore():
+    def __init__(self, path: str = ":memory:"):
+        """Embedded append-only store for polled telemetry, backed by SQLite.
+
+        Samples are kept per (serial number, field) series in a table
+        clustered on ``(series, timestamp)``, so a range read for one field of
+        one device is a single index range scan. Timestamps are epoch
+        milliseconds.
+
+        Args:
+            path (str): Database file, or ``:memory:`` for a process-local store
+        """
+        self.path: str = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._series: dict[tuple[str, str], int] = {
+            (sn, field): id for id, sn, field in self._conn.execute("SELECT id, sn, field FROM series")
+        }
+
+    def _lookup(self, sn: str, field: str) -> Optional[int]:
+        # the cache misses series another connection (or process) created
+        # after this store was opened, so fall back to the table
+        key = (sn, field)
+        series_id = self._series.get(key)
+        if series_id is None:
+            row = self._conn.execute("SELECT id FROM series WHERE sn = ? AND field = ?", key).fetchone()
+            if row is not None:
+                series_id = self._series[key] = row[0]
+        return series_id
+
+    def _series_id(self, sn: str, field: str, created: dict[tuple[str, str], int]) -> int:
+        key = (sn, field)
+        series_id = self._series.get(key) or created.get(key)
+        if series_id is None:
+            self._conn.execute("INSERT OR IGNORE INTO series (sn, field) VALUES (?, ?)", key)
+            series_id = self._conn.execute("SELECT id FROM series WHERE sn = ? AND field = ?", key).fetchone()[0]
+            created[key] = series_id
+        return series_id
+
+    def append_many(self, rows: Iterable[tuple[str, str, Timestamp, object]]) -> int:
+        """Append ``(sn, field, timestamp, value)`` rows; samples already stored for a timestamp are kept."""
+        created: dict[tuple[str, str], int] = {}
+        with self._lock:
+            with self._conn:
+                samples = []
+                for sn, field, ts, value in rows:
+                    number = _number(value)
+                    if number is not None:
+                        samples.append((self._series_id(sn, field, created), to_millis(ts), number))
+                self._conn.executemany("INSERT OR IGNORE INTO samples (series_id, ts, value) VALUES (?, ?, ?)", samples)
+            # series created by a transaction that rolled back must not be cached
+            self._series.update(created)
+        return len(samples)
+
+    def append(self, sn: str, field: str, ts: Timestamp, value) -> int:
+        return self.append_many([(sn, field, ts, value)])
+
+    def append_inverters(self, inverters: Iterable, fields: Iterable[str] = DEFAULT_INVERTER_FIELDS) -> int:
+        """Append one poll of inverters (``SolisInverter`` objects or inverter records).
+
+        The sample time is the inverter's ``dataTimestamp``, falling back to now.
+        """
+        fields = tuple(fields)
+        now = int(time.time() * 1000)
+        rows = []
+        for inverter in inverters:
+            data = inverter if isinstance(inverter, dict) else inverter.__dict__
+            sn = data.get("sn", "")
+            ts = _number(data.get("dataTimestamp"))
+            ts = int(ts) if ts is not None else now
+            rows.extend((sn, field, ts, data.get(field)) for field in fields if field in data)
+        return self.append_many(rows)
+
+    def append_epm_day(self, sn: str, day: EPMDayData, fields: Optional[Iterable[str]] = None) -> int:
+        """Append the columns of an ``EPMDayData`` for the meter ``sn``."""
+        rows = []
+        for field in (fields or day.columns.keys()):
+            values = day.columns.get(field)
+            if values is not None:
+                rows.extend((sn, field, ts, value) for ts, value in zip(day.timestamps, values))
+        return self.append_many(rows)
+
+    def query(self, sn: str, field: str, start: Timestamp = 0, end: Optional[Timestamp] = None) -> tuple[array, array]:
+        """Read the raw samples of one series in ``[start, end)``.
+
+        Returns:
+            tuple[array, array]: epoch-millisecond timestamps and values
+        """
+        timestamps, values = array('q'), array('d')
+        end_ms = to_millis(end) if end is not None else 2 ** 62
+        with self._lock:
+            series_id = self._lookup(sn, field)
+            if series_id is None:
+                return timestamps, values
+            rows = self._conn.execute(
+                "SELECT ts, value FROM samples WHERE series_id = ? AND ts >= ? AND ts < ? ORDER BY ts",
+                (series_id, to_millis(start), end_ms)
+            ).fetchall()
+        for ts, value in rows:
+            timestamps.append(ts)
+            values.append(value)
+        return timestamps, values
+
+    def downsample(self, sn: str, field: str, start: Timestamp, end: Timestamp, interval: int, how: str = "avg") -> tuple[array, array]:
+        """Read one series in ``[start, end)`` aggregated into ``interval``-second buckets.
+
+        Args:
+            how (str): One of ``avg``, ``min``, ``max``, ``sum``, ``count``, ``first`` or ``last``
+        """
+        if how not in _AGGREGATES:
+            raise ValueError(f"Unknown aggregation {how!r}")
+        timestamps, values = array('q'), array('d')
+        step = int(interval * 1000)
+        if how in ("first", "last"):
+            # SQLite returns the bare column from the row holding the MIN/MAX
+            sql = (
+                f"SELECT ts / :step * :step AS bucket, value, {_AGGREGATES[how]}(ts) FROM samples "
+                "WHERE series_id = :id AND ts >= :start AND ts < :end GROUP BY bucket ORDER BY bucket"
+            )
+        else:
+            sql = (
+                f"SELECT ts / :step * :step AS bucket, {_AGGREGATES[how]}(value) FROM samples "
+                "WHERE series_id = :id AND ts >= :start AND ts < :end GROUP BY bucket ORDER BY bucket"
+            )
+        with self._lock:
+            series_id = self._lookup(sn, field)
+            if series_id is None:
+                return timestamps, values
+            rows = self._conn.execute(sql, {"step": step, "id": series_id, "start": to_millis(start), "end": to_millis(end)}).fetchall()
+        for row in rows:
+            bucket, value = row[0], row[1]
+            timestamps.append(bucket)
+            values.append(value)
+        return timestamps, values
+
+    def latest(self, sn: str, field: str) -> Optional[tuple[int, float]]:
+        with self._lock:
+            series_id = self._lookup(sn, field)
+            if series_id is None:
+                return None
+            return self._conn.execute(
+                "SELECT ts, value FROM samples WHERE series_id = ? ORDER BY ts DESC LIMIT 1", (series_id,)
+            ).fetchone()
+
+    def serials(self) -> list[str]:
+        with self._lock:
+            return [sn for sn, in self._conn.execute("SELECT DISTINCT sn FROM series ORDER BY sn")]
+
+    def fields(self, sn: str) -> list[str]:
+        with self._lock:
+            return [field for field, in self._conn.execute("SELECT field FROM series WHERE sn = ? ORDER BY field", (sn,))]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> TelemetryStore:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
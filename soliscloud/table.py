@@ -0,0 +1,216 @@
+from __future__ import annotations
+from array import array
+from heapq import nlargest, nsmallest
+from itertools import compress, repeat
+from math import isnan, nan
+from typing import TYPE_CHECKING, Iterable, Optional, Union
+import operator
+
+if TYPE_CHECKING:
+    from soliscloud.soliscloud import SolisCloud
+
+DEFAULT_NUMERIC_FIELDS = (
+    "pac", "eToday", "eTotal", "power", "state", "batteryCapacitySoc", "batteryPower",
+    "familyLoadPower", "inverterTemperature", "dataTimestamp"
+)
+DEFAULT_STRING_FIELDS = ("id", "sn", "stationId", "stationName", "collectorsn", "model")
+
+_OPERATORS = {
+    "==": operator.eq, "!=": operator.ne, "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+}
+
+Condition = tuple[str, str, object]
+Selection = Union[bytearray, Iterable[int]]
+
+
+def _number(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return nan
+
+
+class InverterTable():
+    def __init__(self, numeric_fields: Iterable[str] = DEFAULT_NUMERIC_FIELDS, string_fields: Iterable[str] = DEFAULT_STRING_FIELDS):
+        """Column-oriented table of a fleet of inverters.
+
+        Every numeric field is one contiguous ``array('d')`` (unreadable values
+        are NaN) and every string field an ``array('l')`` of codes into a
+        per-field dictionary, so row ``x`` of the fleet is index ``x`` of every
+        column. Filters and group-bys are single passes over the columns; the
+        table is built without creating ``SolisInverter`` objects and holds a
+        fleet in far less memory, but a filter is still one comparison per
+        row in Python, so it is no faster than a loop over objects already
+        built.
+
+        Args:
+            numeric_fields (Iterable[str]): Inverter record fields stored as floats
+            string_fields (Iterable[str]): Inverter record fields stored dictionary-encoded
+        """
+        self.numeric_fields: tuple[str, ...] = tuple(numeric_fields)
+        self.string_fields: tuple[str, ...] = tuple(string_fields)
+        self.columns: dict[str, array] = {x: array('d') for x in self.numeric_fields}
+        self.codes: dict[str, array] = {x: array('l') for x in self.string_fields}
+        self.dictionaries: dict[str, list[str]] = {x: [] for x in self.string_fields}
+        self._lookups: dict[str, dict[str, int]] = {x: {} for x in self.string_fields}
+
+    @classmethod
+    def from_cloud(cls, cloud: SolisCloud, numeric_fields: Iterable[str] = DEFAULT_NUMERIC_FIELDS, string_fields: Iterable[str] = DEFAULT_STRING_FIELDS, concurrency: int = 4, **kwargs) -> InverterTable:
+        """Build the table straight from the ``inverterList`` pages; no ``SolisInverter`` objects are created."""
+        table = cls(numeric_fields, string_fields)
+        for records in cloud.iter_inverter_pages(concurrency=concurrency, **kwargs):
+            table.extend(records)
+        return table
+
+    @classmethod
+    def from_records(cls, records: Iterable, numeric_fields: Iterable[str] = DEFAULT_NUMERIC_FIELDS, string_fields: Iterable[str] = DEFAULT_STRING_FIELDS) -> InverterTable:
+        table = cls(numeric_fields, string_fields)
+        table.extend(records)
+        return table
+
+    def _encode(self, field: str, value) -> int:
+        lookup = self._lookups[field]
+        value = "" if value is None else str(value)
+        code = lookup.get(value)
+        if code is None:
+            code = lookup[value] = len(self.dictionaries[field])
+            self.dictionaries[field].append(value)
+        return code
+
+    def extend(self, records: Iterable):
+        """Append inverter records (dicts, e.g. one listing page) or ``SolisInverter`` objects."""
+        records = [x if isinstance(x, dict) else x.__dict__ for x in records]
+        for field, column in self.columns.items():
+            column.extend(_number(x.get(field)) for x in records)
+        for field, codes in self.codes.items():
+            codes.extend(self._encode(field, x.get(field)) for x in records)
+
+    def __len__(self) -> int:
+        for column in self.columns.values():
+            return len(column)
+        for codes in self.codes.values():
+            return len(codes)
+        return 0
+
+    def column(self, field: str) -> array:
+        return self.columns[field]
+
+    def strings(self, field: str, rows: Optional[Iterable[int]] = None) -> list[str]:
+        """Decode a string column (optionally only ``rows``)."""
+        dictionary, codes = self.dictionaries[field], self.codes[field]
+        if rows is None:
+            return [dictionary[x] for x in codes]
+        return [dictionary[codes[x]] for x in rows]
+
+    def row(self, x: int) -> dict:
+        record = {field: column[x] for field, column in self.columns.items()}
+        record.update({field: self.dictionaries[field][codes[x]] for field, codes in self.codes.items()})
+        return record
+
+    def mask(self, field: str, op: str, value) -> bytearray:
+        """One byte per row, 1 where ``field op value`` holds.
+
+        ``op`` is one of ``==``, ``!=``, ``<``, ``<=``, ``>``, ``>=`` or ``in``
+        (``value`` is then a collection). String columns support ``==``,
+        ``!=`` and ``in`` and are compared on their codes.
+        """
+        if field in self.codes:
+            codes = self.codes[field]
+            lookup = self._lookups[field]
+            if op == "in":
+                wanted = {lookup[x] for x in value if x in lookup}
+                return bytearray(map(wanted.__contains__, codes))
+            if op not in ("==", "!="):
+                raise ValueError(f"Operator {op!r} is not supported on string field {field}")
+            code = lookup.get(str(value), -1)
+            return bytearray(map(_OPERATORS[op], codes, repeat(code)))
+        column = self.columns[field]
+        if op == "in":
+            wanted = {float(x) for x in value}
+            return bytearray(map(wanted.__contains__, column))
+        if op not in _OPERATORS:
+            raise ValueError(f"Unknown operator {op!r}")
+        return bytearray(map(_OPERATORS[op], column, repeat(float(value))))
+
+    def where(self, *conditions: Condition) -> array:
+        """Row numbers matching every ``(field, op, value)`` condition."""
+        selected = None
+        for field, op, value in conditions:
+            mask = self.mask(field, op, value)
+            selected = mask if selected is None else bytearray(map(operator.and_, selected, mask))
+        if selected is None:
+            return array('q', range(0, len(self)))
+        return array('q', compress(range(0, len(selected)), selected))
+
+    def take(self, rows: Selection) -> InverterTable:
+        """A new table holding only ``rows`` (row numbers or a mask), with its own copy of the string dictionaries."""
+        if isinstance(rows, (bytes, bytearray)):
+            rows = compress(range(0, len(rows)), rows)
+        rows = list(rows)
+        table = InverterTable(self.numeric_fields, self.string_fields)
+        for field, column in self.columns.items():
+            table.columns[field] = array('d', map(column.__getitem__, rows))
+        for field, codes in self.codes.items():
+            table.codes[field] = array('l', map(codes.__getitem__, rows))
+        # codes stay valid against copies, and extending either table leaves the other alone
+        table.dictionaries = {field: list(x) for field, x in self.dictionaries.items()}
+        table._lookups = {field: dict(x) for field, x in self._lookups.items()}
+        return table
+
+    def filter(self, *conditions: Condition) -> InverterTable:
+        return self.take(self.where(*conditions))
+
+    def group_by(self, key: str = "stationId", field: str = "pac", how: str = "sum") -> dict[str, float]:
+        """Aggregate a numeric column per value of a string column, skipping NaN.
+
+        Args:
+            key (str): String field to group on (default: station)
+            field (str): Numeric field to aggregate
+            how (str): One of ``sum``, ``mean``, ``min``, ``max`` or ``count``
+        """
+        if how not in ("sum", "mean", "min", "max", "count"):
+            raise ValueError(f"Unknown aggregation {how!r}")
+        dictionary, codes, column = self.dictionaries[key], self.codes[key], self.columns[field]
+        size = len(dictionary)
+        counts = array('q', bytes(8 * size))
+        if how in ("min", "max"):
+            values = array('d', [nan]) * size
+            better = operator.lt if how == "min" else operator.gt
+            for code, value in zip(codes, column):
+                if value == value:
+                    counts[code] += 1
+                    current = values[code]
+                    if current != current or better(value, current):
+                        values[code] = value
+        else:
+            values = array('d', bytes(8 * size))
+            for code, value in zip(codes, column):
+                if value == value:
+                    counts[code] += 1
+                    values[code] += value
+        groups = {}
+        for code in set(codes):
+            if how == "count":
+                groups[dictionary[code]] = counts[code]
+            elif how == "mean":
+                groups[dictionary[code]] = values[code] / counts[code] if counts[code] else nan
+            else:
+                groups[dictionary[code]] = values[code]
+        return groups
+
+    def top(self, field: str, n: int = 10, ascending: bool = False) -> list[int]:
+        """Row numbers of the ``n`` highest (or lowest) values of a numeric field, NaN last."""
+        column = self.columns[field]
+        rows = [x for x, value in enumerate(column) if not isnan(value)]
+        pick = nsmallest if ascending else nlargest
+        return pick(n, rows, key=column.__getitem__)
+
+    def sum(self, field: str, rows: Optional[Selection] = None) -> float:
+        column = self.columns[field]
+        if rows is None:
+            values = column
+        elif isinstance(rows, (bytes, bytearray)):
+            values = compress(column, rows)
+        else:
+            values = map(column.__getitem__, rows)
+        return sum(x for x in values if x == x)
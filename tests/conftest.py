@@ -0,0 +1,43 @@
+import json
+import time
+
+REASONS = {200: "OK", 403: "Forbidden", 429: "Too Many Requests", 502: "Bad Gateway"}
+
+
+class FakeResponse():
+    def __init__(self, json_data=None, status_code=200, reason=None, headers=None):
+        self.status_code = status_code
+        self.reason = reason or REASONS.get(status_code, "")
+        self.headers = headers or {}
+        self._json = json_data
+
+    def json(self):
+        return self._json
+
+
+class FakeClient():
+    """Answers every request with the same JSON body and records ``(url, kwargs)``."""
+    def __init__(self, json_data, status_code=200, delay=0.0):
+        self.json_data = json_data
+        self.status_code = status_code
+        self.delay = delay
+        self.calls = []
+
+    def post(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        time.sleep(self.delay)
+        return FakeResponse(self.json_data, self.status_code)
+
+
+class FakeRoutingClient():
+    """Answers by URI from ``routes`` (a body or a function of the request body) and records ``(uri, body)``."""
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = []
+
+    def post(self, url, data=None, **kwargs):
+        uri = url.split(":13333", 1)[1]
+        body = json.loads(data)
+        self.calls.append((uri, body))
+        response = self.routes[uri]
+        return FakeResponse(response(body) if callable(response) else response)
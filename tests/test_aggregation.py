@@ -0,0 +1,48 @@
+from datetime import date
+from soliscloud import aggregation
+from soliscloud.models import EPMDayData
+
+BASE = 1700006400000  # 2023-11-15 00:00:00 UTC
+
+
+def make_day(offset_minutes=(0, 5, 10, 15, 20), p_load=(100, 300, 200, 50, 150), e_total_buy=(10, 11, 13, 0.5, 1.5), tz=0):
+    return EPMDayData(tz)._from_json_({
+        "data_timestamp": [BASE + x * 60000 for x in offset_minutes],
+        "p_ac1": [1, 2, 3, 4, 5],
+        "p_load": list(p_load),
+        "e_total_buy": list(e_total_buy),
+    })
+
+
+def test_phase_stats_and_peak():
+    day = make_day()
+    stats = aggregation.phase_stats(day)
+    assert (stats["p_ac1"].min, stats["p_ac1"].max, stats["p_ac1"].mean) == (1, 5, 3)
+    assert aggregation.peak_demand(day)[1] == 300
+    assert aggregation.peak_demand(day, interval=900)[1] == 200
+
+
+def test_resample_and_daily_totals():
+    day = make_day()
+    rollup = aggregation.resample(day, 900, ("p_load",))
+    assert list(rollup.timestamps) == [BASE, BASE + 900000]
+    assert list(rollup.columns["p_load"]) == [200, 100]
+    assert list(rollup.counts) == [3, 2]
+    # after the counter reset between 13 and 0.5 the 0.5 read since counts
+    assert aggregation.daily_totals(day) == {date(2023, 11, 15): {"e_total_buy": 4.5}}
+
+
+def test_daily_totals_count_the_step_across_midnight():
+    day = make_day(offset_minutes=(1430, 1435, 1445, 1450, 1455), e_total_buy=(10, 11, 13, 14, 16))
+    assert aggregation.daily_totals(day) == {date(2023, 11, 15): {"e_total_buy": 1.0}, date(2023, 11, 16): {"e_total_buy": 5.0}}
+
+
+def test_aggregate_meters_sums_buckets():
+    per_meter, fleet = aggregation.aggregate_meters({"a": make_day(), "b": make_day()}, 900, ("p_load",))
+    assert set(per_meter) == {"a", "b"}
+    assert list(fleet.columns["p_load"]) == [400, 200]
+    try:
+        aggregation.aggregate_meters({"a": make_day(), "b": make_day(tz=5.5)})
+        assert False
+    except ValueError:
+        pass
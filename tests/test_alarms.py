@@ -0,0 +1,42 @@
+import json
+from soliscloud.alarms import DAY_MS, AlarmCursor
+from soliscloud.models import SolisAlarm
+
+NOW = 1710000000000
+
+
+class FakeCloud():
+    def __init__(self):
+        self.alarms = []
+        self.calls = []
+
+    def iter_alarms(self, **kwargs):
+        self.calls.append(kwargs)
+        return [SolisAlarm()._from_json(x) for x in self.alarms]
+
+
+def alarm(id, begin, state="0"):
+    return {"id": id, "alarmDeviceSn": "A", "alarmCode": "1010", "alarmBeginTime": begin, "state": state}
+
+
+def test_poll_reports_only_new_and_cleared(tmp_path):
+    cloud = FakeCloud()
+    path = str(tmp_path / "cursor.json")
+    cursor = AlarmCursor(path)
+    cloud.alarms = [alarm("1", NOW - 5000), alarm("2", NOW - 4000, state="2")]
+    new, cleared = cursor.poll(cloud, now=NOW)
+    assert [x.id for x in new] == ["1", "2"] and [x.id for x in cleared] == ["2"]
+    assert cursor.poll(cloud, now=NOW + 1000) == ([], [])
+    cloud.alarms = [alarm("1", NOW - 5000, state="2"), alarm("3", NOW + 500)]
+    reloaded = AlarmCursor(path)
+    new, cleared = reloaded.poll(cloud, now=NOW + 2000)
+    assert [x.id for x in new] == ["3"] and [x.id for x in cleared] == ["1"]
+    assert json.load(open(path))["last_seen"] == NOW + 500
+
+
+def test_window_covers_oldest_active_alarm():
+    cursor = AlarmCursor(overlap=60)
+    cursor.known = {"old": [NOW - 3 * DAY_MS, False], "done": [NOW - 5 * DAY_MS, True]}
+    cursor.last_seen = NOW
+    assert cursor.window_start(NOW) == NOW - 3 * DAY_MS
+    assert AlarmCursor(lookback=2).window_start(NOW) == NOW - 2 * DAY_MS
@@ -0,0 +1,92 @@
+import threading
+import time
+from soliscloud.deadline import Deadline, current_deadline, propagate
+from soliscloud.exceptions import SolisConnectException, SolisTimeoutException
+
+
+class FakeClock():
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_nested_deadline_never_outlives_outer():
+    clock = FakeClock()
+    with Deadline(5, clock=clock) as outer:
+        with Deadline(60, clock=clock) as inner:
+            assert current_deadline() is inner
+            assert inner.remaining() == 5
+            clock.now += 5
+            assert inner.expired
+            try:
+                inner.check()
+                assert False
+            except SolisTimeoutException as err:
+                assert isinstance(err, SolisConnectException) and "deadline" in err.args[0]
+        assert current_deadline() is outer
+    assert current_deadline() is None
+
+
+def test_backoff_past_deadline_fails_at_once():
+    deadline = Deadline(1.0)
+    try:
+        deadline.sleep(30)
+        assert False
+    except SolisTimeoutException as err:
+        assert "30s" in err.args[0]
+
+
+def test_cancel_reaches_worker_threads():
+    seen = []
+    with Deadline() as deadline:
+        fn = propagate(lambda: seen.append(current_deadline()))
+    thread = threading.Thread(target=fn)
+    thread.start()
+    thread.join()
+    assert seen == [deadline] and current_deadline() is None
+    event = threading.Event()
+    threading.Timer(0.05, deadline.cancel).start()
+    try:
+        deadline.wait(event)
+        assert False
+    except SolisTimeoutException as err:
+        assert "cancelled" in err.args[0]
+
+
+def test_single_flight_does_not_share_a_leader_timeout():
+    from soliscloud.soliscloud import SingleFlight
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def leader_call():
+        calls.append("leader")
+        started.set()
+        release.wait(5)
+        raise SolisTimeoutException("There was an error - the deadline passed")
+
+    def follower_call():
+        calls.append("follower")
+        return "result"
+    errors = []
+
+    def lead():
+        try:
+            flight.do("key", leader_call)
+        except SolisTimeoutException as err:
+            errors.append(err)
+    thread = threading.Thread(target=lead)
+    thread.start()
+    started.wait(5)
+    results = []
+    follower = threading.Thread(target=lambda: results.append(flight.do("key", follower_call)))
+    follower.start()
+    while not flight.shared:
+        time.sleep(0.001)
+    release.set()
+    thread.join()
+    follower.join()
+    # the follower had no deadline, so it runs the call itself
+    assert len(errors) == 1 and results == ["result"] and calls == ["leader", "follower"]
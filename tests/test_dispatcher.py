@@ -0,0 +1,95 @@
+import threading
+import time
+from conftest import FakeResponse, FakeRoutingClient
+from soliscloud.dispatcher import PriorityDispatcher, classify
+
+BASE = "https://www.soliscloud.com:13333"
+
+
+class GatedClient():
+    def __init__(self):
+        self.started = []
+        self.gate = threading.Event()
+        self.lock = threading.Lock()
+
+    def post(self, url, headers=None, **kwargs):
+        with self.lock:
+            first = not self.started
+            self.started.append((url[len(BASE):], headers["Authorization"][4:5]))
+        if first:
+            self.gate.wait(5)
+        return FakeResponse()
+
+
+def post(dispatcher, uri, account):
+    return threading.Thread(target=dispatcher.post, args=(f"{BASE}{uri}",), kwargs={"headers": {"Authorization": f"API {account}:sig"}})
+
+
+def wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+def test_classes_are_ordered_and_accounts_take_turns():
+    assert classify(f"{BASE}/v2/api/control") == "control"
+    assert classify(f"{BASE}/v1/api/inverterDay") == "bulk" and classify(f"{BASE}/v1/api/inverterDetail") == "detail"
+    client = GatedClient()
+    dispatcher = PriorityDispatcher(client, {"bulk": 1}, max_in_flight=1)
+    threads = [post(dispatcher, "/v1/api/inverterList", "A")]
+    threads[0].start()
+    wait_for(lambda: client.started)
+    for uri, account in [("/v1/api/inverterList", "A"), ("/v1/api/inverterList", "A"), ("/v1/api/inverterList", "B"), ("/v1/api/stationDetail", "A")]:
+        threads.append(post(dispatcher, uri, account))
+        threads[-1].start()
+        wait_for(lambda: sum(dispatcher.waiting().values()) == len(threads) - 1)
+    # a control write does not wait behind the queued reads
+    dispatcher.post(f"{BASE}/v2/api/control", headers={"Authorization": "API A:sig"})
+    assert client.started[-1] == ("/v2/api/control", "A")
+    client.gate.set()
+    for thread in threads:
+        thread.join()
+    assert client.started[2:] == [
+        ("/v1/api/stationDetail", "A"), ("/v1/api/inverterList", "A"), ("/v1/api/inverterList", "B"), ("/v1/api/inverterList", "A")
+    ]
+    assert dispatcher.in_flight() == {"control": 0, "detail": 0, "bulk": 0}
+
+
+class GatedLimiter():
+    """Rate limiter whose tokens are held back until ``gate`` is set."""
+    def __init__(self):
+        self.gate = threading.Event()
+        self.acquired = []
+        self.reserved = []
+
+    def acquire(self, tokens=1, timeout=None):
+        self.acquired.append(threading.current_thread())
+        self.gate.wait(5)
+        return True
+
+    def reserve(self, tokens=1):
+        self.reserved.append(threading.current_thread())
+
+
+def test_control_writes_go_ahead_of_rate_limited_reads():
+    from soliscloud import SolisCloud
+    from soliscloud.models import ChargeDischargeSchedule
+    client = FakeRoutingClient({
+        "/v1/api/inverterDetail": {"success": True, "data": {"id": "1", "sn": "A"}},
+        "/v2/api/control": {"success": True, "data": []},
+    })
+    limiter = GatedLimiter()
+    cloud = SolisCloud("abc", "xyz", client=PriorityDispatcher(client), rate_limiter=limiter, coalesce_requests=False)
+    readers = [threading.Thread(target=cloud.get_inverter_detail_data, args=("1", "A")) for _ in range(8)]
+    for thread in readers:
+        thread.start()
+    # every read holds a slot and waits for a token
+    wait_for(lambda: len(limiter.acquired) == 8)
+    cloud.set_inverter_charge_discharge_schedule("1", "A", ChargeDischargeSchedule())
+    # the write reserved its token without waiting and went out ahead of the reads
+    assert [uri for uri, _ in client.calls] == ["/v2/api/control"]
+    assert limiter.reserved == [threading.current_thread()] and threading.current_thread() not in limiter.acquired
+    limiter.gate.set()
+    for thread in readers:
+        thread.join()
+    assert len(client.calls) == 9
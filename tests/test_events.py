@@ -0,0 +1,37 @@
+import asyncio
+from soliscloud import events
+from soliscloud.models import StatusVo
+
+
+def test_inverter_transitions_are_emitted_once():
+    stream = events.EventStream(power_threshold=0.5)
+    received = []
+    stream.subscribe(received.append)
+    assert stream.process_inverters([{"sn": "A", "state": 1, "pac": 2.0}, {"sn": "B", "state": 1, "pac": 2.0}]) == []
+    stream.process_inverters([{"sn": "A", "state": 2, "pac": 0}, {"sn": "B", "state": 1, "pac": 0.1}])
+    stream.process_inverters([{"sn": "A", "state": 3, "pac": 0}, {"sn": "B", "state": 1, "pac": 0.1}])
+    kinds = [(x.key, x.kind) for x in received]
+    assert kinds == [
+        ("A", events.WENT_OFFLINE), ("B", events.POWER_BELOW_THRESHOLD),
+        ("A", events.CAME_ONLINE), ("A", events.FAULT_RAISED),
+    ]
+
+
+def test_station_alarms_and_status_counts():
+    stream = events.EventStream()
+    stream.process_stations([{"id": "1", "state": 1, "alarmCount": 0}])
+    changes = stream.process_stations([{"id": "1", "state": 1, "alarmCount": 2}])
+    assert [(x.kind, x.previous, x.current) for x in changes] == [(events.ALARM_COUNT_CHANGED, 0, 2)]
+    stream.process_status("inverters", StatusVo()._from_json({"all": 3, "fault": 0}))
+    changes = stream.process_status("inverters", StatusVo()._from_json({"all": 3, "fault": 1}))
+    assert changes[0].current == {"fault": 1}
+
+
+def test_events_reach_asyncio_queue():
+    async def main():
+        stream = events.EventStream()
+        queue = stream.asyncio_queue()
+        stream.process_inverters([{"sn": "A", "state": 1}])
+        await asyncio.get_running_loop().run_in_executor(None, stream.process_inverters, [{"sn": "A", "state": 2}])
+        return await asyncio.wait_for(queue.get(), 1)
+    assert asyncio.run(main()).kind == events.WENT_OFFLINE
@@ -0,0 +1,28 @@
+from soliscloud.fleet import FleetIndex
+from soliscloud.models import SolisInverter
+
+
+def inverter(sn, station, state=1, model="3105"):
+    return SolisInverter()._from_json({"id": f"id-{sn}", "sn": sn, "stationId": station, "state": state, "model": model, "collectorsn": f"c-{station}"})
+
+
+def test_lookups_and_filters():
+    index = FleetIndex()
+    index.update([inverter("A", "s1"), inverter("B", "s1", state=2), inverter("C", "s2", state=3, model="5kW")])
+    assert index.get("A").stationId == "s1"
+    assert index.get_by_id("id-C").sn == "C"
+    assert {x.sn for x in index.station("s1")} == {"A", "B"}
+    assert [x.sn for x in index.offline()] == ["B"]
+    assert [x.sn for x in index.faulted()] == ["C"]
+    assert index.serials(stationId="s1", state=[1, 3]) == {"A"}
+    assert index.counts("model") == {"3105": 2, "5kW": 1}
+
+
+def test_incremental_update_reports_changes():
+    index = FleetIndex()
+    index.update([inverter("A", "s1"), inverter("B", "s1")])
+    added, changed, removed = index.update([inverter("A", "s1", state=2), inverter("D", "s3")], complete=True)
+    assert (added, changed, removed) == ({"D"}, {"A"}, {"B"})
+    assert index.serials(state=1) == {"D"}
+    assert "B" not in index and index.get_by_id("id-B") is None
+    assert index.serials(stationId="s1") == {"A"}
@@ -0,0 +1,18 @@
+import subprocess
+import sys
+
+
+def loaded_after(statement: str) -> set:
+    snippet = f"import sys\n{statement}\nprint(' '.join(sys.modules))"
+    out = subprocess.run([sys.executable, "-c", snippet], capture_output=True, text=True, check=True)
+    return set(out.stdout.split())
+
+
+def test_package_import_is_lazy():
+    modules = loaded_after("import soliscloud")
+    assert not {"requests", "tenacity", "pytz", "soliscloud.models", "soliscloud.soliscloud"} & modules
+
+
+def test_client_import_defers_http_stack():
+    modules = loaded_after("from soliscloud import SolisCloud\nSolisCloud('abc', 'xyz')")
+    assert not {"requests", "tenacity", "pytz", "soliscloud.models"} & modules
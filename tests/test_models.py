@@ -0,0 +1,35 @@
+from datetime import datetime, timedelta, timezone
+from soliscloud.models import EPMDayData, EPMMonthYearData
+
+
+def test_epm_day_data_is_timezone_aware_and_reports_dropped_rows():
+    data = {
+        "data_timestamp": ["1700000000000", "bad", "1700000300000", "1700000600000"],
+        "p_ac1": [1.0, 2.0, 3.0],
+        "u_ac1": [230.0, 231.0, 232.0, 233.0],
+    }
+    day = EPMDayData(timeZone=1)._from_json_(data)
+    assert list(day.timestamps) == [1700000000000, 1700000300000]
+    assert day.columns["p_ac1"] == [1.0, 3.0]
+    assert [x[0] for x in day.dropped] == [1, 3]
+    items = day.formatted_data
+    assert items[1].datetime == datetime(2023, 11, 14, 23, 18, 20, tzinfo=timezone(timedelta(hours=1)))
+    assert items[1].u_ac1 == 232.0
+    assert list(day.convert_to_json())[0] == "2023-11-14T23:13:20+01:00"
+
+
+def test_epm_day_data_defers_row_objects():
+    day = EPMDayData()._from_json_({"data_timestamp": [0, 1000], "p_load": [5, 6]})
+    assert day._formatted_data is None
+    assert day.epoch_seconds() == [0.0, 1.0]
+    assert day.dropped == []
+
+
+def test_epm_month_data_uses_row_timezone():
+    month = EPMMonthYearData()._from_json_([
+        {"date": 1700000000000, "timeZone": 8, "energy": 1.5},
+        {"date": None, "energy": 2.0},
+    ])
+    assert len(month.formatted_data) == 1
+    assert month.formatted_data[0].datetime.utcoffset() == timedelta(hours=8)
+    assert month.dropped[0][0] == 1
@@ -0,0 +1,36 @@
+from conftest import FakeClient
+from soliscloud import SolisCloudPool
+from soliscloud.ratelimit import RateLimiter
+
+
+def station_page(*ids):
+    return {"success": True, "data": {"stationStatusVo": {"all": len(ids), "normal": len(ids)}, "page": {"pages": 1, "records": [{"id": x} for x in ids]}}}
+
+
+def test_pool_aggregates_accounts_and_isolates_errors():
+    with SolisCloudPool(max_workers=4) as pool:
+        pool.add_account("a", "s").client = FakeClient(station_page("1", "2"))
+        pool.add_account("b", "s").client = FakeClient(station_page("3"))
+        pool.add_account("c", "s").client = FakeClient({}, status_code=403)
+        result = pool.list_stations()
+    assert set(result.results) == {"a", "b"}
+    assert set(result.errors) == {"c"}
+    assert sorted(x.id for x in result.records()) == ["1", "2", "3"]
+    assert result.status().all == 3
+    assert pool.accounts["a"].rate_limiter is not pool.accounts["b"].rate_limiter
+
+
+def test_rate_limiter_waits_for_tokens():
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    limiter = RateLimiter(2.0, burst=2, clock=lambda: now[0], sleep=sleep)
+    for _ in range(4):
+        limiter.acquire()
+    assert sleeps == [0.5, 0.5]
+    assert limiter.try_acquire() is False
+    assert limiter.acquire(timeout=0.1) is False
@@ -0,0 +1,30 @@
+from soliscloud.models import SolisInverter
+from soliscloud.pvstrings import StringMatrix, find_underperforming_strings
+
+
+def detail(sn, station, currents, unit="A"):
+    data = {"sn": sn, "stationId": station, "dcInputtype": len(currents) - 1}
+    for x, current in enumerate(currents, start=1):
+        data.update({f"uPv{x}": 350, f"uPv{x}Str": "V", f"iPv{x}": current, f"iPv{x}Str": unit})
+    return data
+
+
+def test_matrix_normalises_units():
+    matrix = StringMatrix.from_inverters([detail("A", "s1", [8000, 7900], unit="mA"), SolisInverter()._from_json(detail("B", "s1", [8.1]))], channels=4)
+    assert matrix.row(0).tolist() == [8.0, 7.9]
+    assert matrix.row(1, "power").tolist() == [350 * 8.1]
+    assert len(matrix.current) == 8 and matrix.counts.tolist() == [2, 1]
+
+
+def test_flags_strings_below_inverter_and_station_peers():
+    matrix = StringMatrix.from_inverters([
+        detail("A", "s1", [8.0, 7.9, 1.0]),
+        detail("B", "s1", [5.0]),
+        detail("C", "s1", [8.1, 8.0]),
+        detail("D", "s2", [0.1, 0.1]),
+    ])
+    flagged = {(x.sn, x.channel): x for x in find_underperforming_strings(matrix)}
+    assert set(flagged) == {("A", 3), ("B", 1)}
+    assert flagged[("A", 3)].inverter_ratio < 0.2
+    assert flagged[("B", 1)].inverter_ratio != flagged[("B", 1)].inverter_ratio
+    assert round(flagged[("B", 1)].station_ratio, 2) == 0.63
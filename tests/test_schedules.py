@@ -0,0 +1,70 @@
+from datetime import time
+import pytest
+from soliscloud.models import ChargeDischargeSchedule, SolisSetResult
+from soliscloud.schedules import ScheduleCache
+
+
+def schedule(current):
+    s = ChargeDischargeSchedule()
+    s.one.charge.current = current
+    s.one.charge.start, s.one.charge.end = time(1, 0), time(5, 0)
+    return s
+
+
+class FakeCloud():
+    def __init__(self, schedules):
+        self.schedules = schedules
+        self.reads = []
+
+    def get_charge_discharge_schedule(self, sn):
+        self.reads.append(sn)
+        return schedule(self.schedules[sn])
+
+    def set_inverter_charge_discharge_schedule(self, id, sn, value):
+        return SolisSetResult()
+
+
+class Clock():
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_schedules_compare_by_value_and_freeze():
+    a, b = schedule(50), schedule(50)
+    assert a == b and a != schedule(60)
+    with pytest.raises(TypeError):
+        hash(a)
+    a.freeze()
+    assert hash(a) == hash(b.freeze())
+    with pytest.raises(AttributeError):
+        a.one.charge.current = 10
+    editable = a.copy()
+    editable.one.charge.current = 10
+    assert not editable.frozen and a.one.charge.current == 50
+
+
+def test_cache_interns_and_expires():
+    clock = Clock()
+    cloud = FakeCloud({"A": 50, "B": 50, "C": 60})
+    cache = ScheduleCache(cloud, ttl=10, clock=clock)
+    schedules, errors = cache.get_many(["A", "B", "C", "A"])
+    assert not errors and schedules["A"] is schedules["B"] and schedules["A"].frozen
+    assert len(cache.templates()) == 2
+    groups = cache.group_by_schedule()
+    assert sorted(groups[schedule(50).freeze()]) == ["A", "B"] and groups[schedule(60).freeze()] == ["C"]
+    cache.get("A")
+    assert len(cloud.reads) == 3
+    clock.now = 11
+    assert "A" not in cache and cache.group_by_schedule() == {}
+    cache.get("A")
+    assert len(cloud.reads) == 4
+
+
+def test_cache_write_through():
+    cache = ScheduleCache(FakeCloud({}), clock=Clock())
+    new = schedule(70)
+    assert cache.set("1", "A", new).success
+    assert cache.get("A") == new and cache.get("A") is not new
@@ -0,0 +1,32 @@
+import json
+import multiprocessing
+from conftest import FakeResponse
+from soliscloud.sharding import ShardedPoller, partition_targets, shard_for
+from soliscloud.soliscloud import SolisCloud
+
+
+class FakeDetailClient():
+    def post(self, url, data=None, **kwargs):
+        request = json.loads(data)
+        if request["sn"] == "bad":
+            return FakeResponse({"success": False, "msg": "no such inverter"})
+        return FakeResponse({"success": True, "data": {"sn": request["sn"], "pac": 1.5, "state": 1}})
+
+
+def fake_client():
+    return SolisCloud("abc", "xyz", client=FakeDetailClient())
+
+
+def test_partition_is_stable_and_keeps_stations_together():
+    targets = [{"id": str(x), "sn": f"SN{x}", "stationId": "st1" if x < 5 else "st2"} for x in range(10)]
+    by_station = partition_targets(targets, 3, "station")
+    assert sorted(len(x) for x in by_station if x) == [5, 5]
+    assert shard_for("SN1", 7) == shard_for("SN1", 7)
+
+
+def test_sharded_poller_streams_results_and_errors():
+    poller = ShardedPoller("abc", "xyz", processes=2, rate=1000, mp_context=multiprocessing.get_context("fork"), client_factory=fake_client)
+    results = {sn: (data, error) for _, sn, data, error in poller.poll([("1", "A"), ("2", "B"), ("3", "bad")], fields=["pac", "state"])}
+    assert results["A"] == ({"pac": 1.5, "state": 1}, None)
+    assert results["B"][0] == {"pac": 1.5, "state": 1}
+    assert results["bad"][0] is None and "no such inverter" in results["bad"][1]
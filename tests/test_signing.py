@@ -0,0 +1,34 @@
+from base64 import b64encode
+import hashlib
+import hmac
+from soliscloud.signing import RequestSigner, parse_http_date
+
+
+def test_signature_matches_reference():
+    signer = RequestSigner("abc", "xyz")
+    payload = signer.serialize({"id": "1", "sn": "2"})
+    headers = signer.sign(payload, "/v1/api/inverterDetail", now=0)
+    assert payload == b'{"id":"1","sn":"2"}'
+    assert headers["Date"] == "Thu, 01 Jan 1970 00:00:00 GMT"
+    content_md5 = b64encode(hashlib.md5(payload).digest()).decode()
+    message = "\n".join(["POST", content_md5, "application/json", headers["Date"], "/v1/api/inverterDetail"])
+    sign = b64encode(hmac.new(b"xyz", msg=message.encode(), digestmod=hashlib.sha1).digest()).decode()
+    assert headers["Content-MD5"] == content_md5
+    assert headers["Authorization"] == f"API abc:{sign}"
+
+
+def test_date_is_cached_per_second():
+    signer = RequestSigner("abc", "xyz")
+    assert signer.date(10.1) is signer.date(10.9)
+    assert signer.date(11.0) == "Thu, 01 Jan 1970 00:00:11 GMT"
+
+
+def test_clock_offset_is_learnt_from_date_header():
+    assert parse_http_date("Thu, 01 Jan 1970 00:00:11 GMT") == 11
+    assert parse_http_date("garbage") is None and parse_http_date(None) is None
+    signer = RequestSigner("abc", "xyz")
+    server = signer.date(signer.now() + 120)
+    offset = signer.observe_date(server)
+    assert 119 < offset < 122
+    assert signer.observe_date(signer.date(signer.now() + 0.4)) == offset
+    assert abs(parse_http_date(signer.date()) - parse_http_date(server)) <= 1
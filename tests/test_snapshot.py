@@ -0,0 +1,33 @@
+import pytest
+from soliscloud.models import SolisEPM, SolisInverter, SolisStation
+from soliscloud.snapshot import SnapshotCodec, SnapshotDecoder, SnapshotEncoder, SnapshotError, codec_for
+
+
+def test_full_and_delta_round_trip():
+    first = SolisInverter()._from_json({"sn": "A1", "pac": 1.25, "state": 1, "eToday": -3, "uPv1": 2 ** 70})
+    second = SolisInverter()._from_json({"sn": "A1", "pac": 2.5, "state": 1, "eToday": -3, "uPv1": 2 ** 70})
+    codec = codec_for(SolisInverter)
+    full = codec.encode(first)
+    delta = codec.encode(second, first, compress=True)
+    assert codec.decode(full)["uPv1"] == 2 ** 70
+    assert codec.decode(full)["eToday"] == -3
+    assert codec.decode(delta, first)["pac"] == 2.5
+    assert len(delta) < len(full)
+    restored = codec.decode_into(full, SolisInverter())
+    assert restored.sn == "A1" and restored.pac == 1.25
+
+
+def test_frames_check_schema_and_base():
+    frame = codec_for(SolisStation).encode({"id": "1", "power": 3.0})
+    with pytest.raises(SnapshotError):
+        codec_for(SolisEPM).decode(frame)
+    with pytest.raises(SnapshotError):
+        codec_for(SolisStation).decode(codec_for(SolisStation).encode({"id": "2"}, {"id": "1"}))
+
+
+def test_stream_encoder_writes_keyframes():
+    encoder = SnapshotEncoder(SolisEPM, keyframe_interval=2)
+    decoder = SnapshotDecoder(SolisEPM)
+    for x in range(0, 5):
+        frame = encoder.encode("meter", {"sn": "meter", "pAc1": str(x)})
+        assert decoder.decode("meter", frame)["pAc1"] == str(x)
@@ -1,4 +1,15 @@
+from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+import hashlib
+import json
+import threading
+import time
+import pytest
+from conftest import FakeClient, FakeResponse, FakeRoutingClient
 from soliscloud import soliscloud
+from soliscloud.concurrency import AdaptiveConcurrency
+from soliscloud.signing import parse_http_date
 
 
 def test_var_input():
@@ -13,4 +24,389 @@ def test_failed_connection():
         s.get_station_list()
     except soliscloud.SolisConnectException as err:
         assert err.args[0] == "There was an error - 403 - Forbidden"
-    
\ No newline at end of file
+    
+
+def test_concurrent_identical_requests_are_coalesced():
+    s = soliscloud.SolisCloud("abc", "xyz")
+    s.client = FakeClient({"success": True, "data": {"id": "1", "stationName": "home"}}, delay=0.2)
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        stations = list(pool.map(lambda _: s.get_station_detail(1), range(5)))
+    assert len(s.client.calls) == 1
+    assert all(x.stationName == "home" for x in stations)
+    assert len({id(x) for x in stations}) == 5
+
+
+def test_control_writes_are_not_coalesced():
+    s = soliscloud.SolisCloud("abc", "xyz")
+    s.client = FakeClient({"success": True, "data": []}, delay=0.1)
+    schedule = soliscloud.ChargeDischargeSchedule()
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        list(pool.map(lambda _: s.set_inverter_charge_discharge_schedule("1", "sn", schedule), range(3)))
+    assert len(s.client.calls) == 3
+
+
+def test_sent_body_is_the_signed_body():
+    s = soliscloud.SolisCloud("abc", "xyz")
+    s.client = FakeClient({"success": True, "data": {}})
+    s.get_station_detail(1, nmiCode="x")
+    _, kwargs = s.client.calls[0]
+    assert kwargs["data"] == b'{"id":1,"nmiCode":"x"}'
+    assert kwargs["headers"]["Content-MD5"] == b64encode(hashlib.md5(kwargs["data"]).digest()).decode()
+
+
+class FakeDetailClient():
+    def __init__(self, throttled=()):
+        self.throttled = set(throttled)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def post(self, url, data=None, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.01)
+        with self.lock:
+            self.active -= 1
+        sn = json.loads(data)["sn"]
+        if sn in self.throttled:
+            self.throttled.discard(sn)
+            return FakeResponse({}, 429)
+        if sn == "bad":
+            return FakeResponse({"success": False, "msg": "not found"})
+        return FakeResponse({"success": True, "data": {"sn": sn, "pac": 1.0}})
+
+
+def test_get_inverter_details_many_reports_per_item_errors():
+    s = soliscloud.SolisCloud("abc", "xyz")
+    s.client = FakeDetailClient()
+    pairs = [(str(x), f"SN{x}") for x in range(20)] + [("x", "bad")]
+    results = {sn: (inverter, error) for _, sn, inverter, error in s.get_inverter_details_many(pairs, max_concurrency=6, initial_concurrency=2)}
+    assert len(results) == 21
+    assert results["SN3"][0].pac == 1.0
+    assert isinstance(results["bad"][1], soliscloud.SolisConnectException)
+    assert 2 <= s.client.peak <= 6
+
+
+def test_rate_limits_are_counted_per_call():
+    from soliscloud.concurrency import RateLimitCounter
+    s = soliscloud.SolisCloud("abc", "xyz")
+    s._sleep = lambda seconds: None
+    s.client = FakeDetailClient(throttled={"SN1"})
+
+    def fetch(id, sn):
+        with RateLimitCounter() as counter:
+            s.get_inverter_detail_data(id, sn)
+        return counter.count
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        counts = list(pool.map(fetch, ["1", "2"], ["SN1", "SN2"]))
+    # the 429 of SN1 is not blamed on SN2, which was in flight at the same time
+    assert counts == [1, 0]
+
+
+def test_adaptive_concurrency_is_aimd():
+    limiter = AdaptiveConcurrency(initial=4, maximum=8, target_latency=1.0)
+    for _ in range(8):
+        limiter.on_success(0.1)
+    assert limiter.current == 5
+    limiter.on_congestion()
+    limiter.on_congestion()
+    assert limiter.current == 2
+    limiter.on_success(5.0)
+    assert limiter.current == 2
+
+
+def test_refresh_updates_objects_in_place():
+    s = soliscloud.SolisCloud("abc", "xyz")
+    s.client = FakeRoutingClient({
+        "/v1/api/inverterDetail": {"success": True, "data": {"id": "1", "sn": "A", "pac": 2.0, "state": 1}},
+        "/v1/api/inverterList": lambda body: {"success": True, "data": {"page": {"pages": 2, "records": [
+            {"id": "1", "sn": "A", "pac": 3.0} if body["pageNo"] == 1 else {"id": "2", "sn": "B", "pac": 1.0}
+        ]}}},
+    })
+    inverter = soliscloud.SolisInverter(s)._from_json({"id": "1", "sn": "A", "pac": 1.0, "state": 1})
+    same = inverter
+    assert inverter.refresh() == {"pac"}
+    assert inverter.refresh() == set()
+    assert same.pac == 2.0
+    other = soliscloud.SolisInverter(s)._from_json({"id": "2", "sn": "B", "pac": 1.0})
+    assert s.refresh_inverters([inverter, other]) == {"A": {"pac"}, "B": set()}
+    assert inverter.pac == 3.0
+
+
+def test_list_collectors_fetches_all_pages_in_order():
+    def page(body):
+        records = [{"sn": f"C{body['pageNo']}-{x}", "state": 1 if x else 2} for x in range(2)]
+        return {"success": True, "data": {"collectorStatusVo": {"all": 10}, "page": {"pages": 5, "records": records}}}
+    s = soliscloud.SolisCloud("abc", "xyz")
+    s.client = FakeRoutingClient({"/v1/api/collectorList": page})
+    status, collectors = s.list_collectors(pageSize=2, stationId="st1", concurrency=3)
+    assert status.all == 10
+    assert [x.sn for x in collectors][::2] == ["C1-0", "C2-0", "C3-0", "C4-0", "C5-0"]
+    assert sum(x.online for x in collectors) == 5
+    assert {body["stationId"] for _, body in s.client.calls} == {"st1"}
+    assert "page_number" not in s.client.calls[0][1]
+
+
+def test_inverter_history_range_is_columnar_and_ordered():
+    def day(body):
+        base = int(datetime(2024, 3, int(body["time"][-2:]), tzinfo=timezone.utc).timestamp() * 1000)
+        return {"success": True, "data": [
+            {"dataTimestamp": str(base), "pac": 1.5, "eToday": 0.1},
+            {"dataTimestamp": str(base + 300000), "pac": 2.5, "eToday": 0.3, "batteryPower": 1},
+            {"dataTimestamp": "bad", "pac": 9},
+        ]}
+    s = soliscloud.SolisCloud("abc", "xyz")
+    s.client = FakeRoutingClient({"/v1/api/inverterDay": day})
+    history = s.get_inverter_history("1", "A", date(2024, 3, 1), date(2024, 3, 3), timeZone=0, money="GBP", concurrency=3)
+    assert len(history) == 6 and list(history.timestamps) == sorted(history.timestamps)
+    assert history.numeric("pac").tolist() == [1.5, 2.5] * 3
+    assert history.column("batteryPower") == [None, 1] * 3
+    assert [x[0] for x in history.dropped] == [2, 5, 8]
+    assert sorted(body["time"] for _, body in s.client.calls) == ["2024-03-01", "2024-03-02", "2024-03-03"]
+    assert s.client.calls[0][1]["money"] == "GBP" and s.client.calls[0][1]["sn"] == "A"
+
+
+def test_history_periods():
+    assert soliscloud.history_periods(date(2023, 11, 20), date(2024, 2, 1), "month") == [
+        date(2023, 11, 1), date(2023, 12, 1), date(2024, 1, 1), date(2024, 2, 1)
+    ]
+    assert len(soliscloud.history_periods(date(2024, 2, 27), date(2024, 3, 1))) == 4
+
+
+def test_iter_alarms_reads_records_without_page_wrapper():
+    def page(body):
+        return {"success": True, "data": {"pages": 2, "records": [{"id": str(body["pageNo"]), "alarmDeviceSn": "A", "state": "2"}]}}
+    s = soliscloud.SolisCloud("abc", "xyz")
+    s.client = FakeRoutingClient({"/v1/api/alarmList": page})
+    alarms = list(s.iter_alarms(alarmBeginTime=date(2024, 3, 1), stationId="st1"))
+    assert [x.id for x in alarms] == ["1", "2"] and alarms[0].cleared
+    assert s.client.calls[0][1]["alarmBeginTime"] == "2024-03-01"
+
+
+def test_middleware_wraps_every_endpoint_call():
+    from soliscloud.middleware import RequestMetrics, ResponseCache
+    seen = []
+    s = soliscloud.SolisCloud("abc", "xyz", middleware=[lambda request, call_next: seen.append(request.uri) or call_next(request)])
+    metrics = s.use(RequestMetrics())
+    cache = s.use(ResponseCache(ttl=60))
+    s.client = FakeRoutingClient({
+        "/v1/api/inverterDetail": {"success": True, "data": {"id": "1", "sn": "A"}},
+        "/v2/api/control": {"success": True, "data": []},
+    })
+    assert s.get_inverter_detail_data("1", "A") == s.get_inverter_detail_data("1", "A")
+    s.set_inverter_charge_discharge_schedule("1", "A", soliscloud.ChargeDischargeSchedule())
+    s.set_inverter_charge_discharge_schedule("1", "A", soliscloud.ChargeDischargeSchedule())
+    assert seen == ["/v1/api/inverterDetail"] * 2 + ["/v2/api/control"] * 2
+    assert cache.hits == 1 and len(s.client.calls) == 3
+    assert metrics._to_json()["/v1/api/inverterDetail"]["requests"] == 2 and metrics._to_json()["/v2/api/control"]["errors"] == 0
+
+
+def test_response_cache_keeps_only_successful_responses_and_is_bounded():
+    from soliscloud.middleware import ResponseCache
+    clock = [0.0]
+    s = soliscloud.SolisCloud("abc", "xyz")
+    cache = s.use(ResponseCache(ttl=60, clock=lambda: clock[0], max_entries=2))
+    replies = [{"success": False, "code": "1", "msg": "busy"}, {"success": True, "data": {"id": "1", "sn": "A"}}]
+    s.client = FakeRoutingClient({"/v1/api/inverterDetail": lambda body: replies.pop(0) if len(replies) > 1 else replies[0]})
+    with pytest.raises(soliscloud.SolisConnectException):
+        s.get_inverter_detail_data("1", "A")
+    assert len(cache) == 0
+    s.get_inverter_detail_data("1", "A")
+    s.get_inverter_detail_data("1", "A")
+    assert cache.hits == 1 and len(s.client.calls) == 2
+    s.get_inverter_detail_data("2", "B")
+    s.get_inverter_detail_data("3", "C")
+    assert len(cache) == 2
+    clock[0] = 61.0
+    s.get_inverter_detail_data("4", "D")
+    assert len(cache) == 1
+
+class FakeDelayClient():
+    def __init__(self, delays):
+        self.delays = list(delays)
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def post(self, url, data=None, **kwargs):
+        with self.lock:
+            delay = self.delays[self.calls] if self.calls < len(self.delays) else 0.0
+            self.calls += 1
+        time.sleep(delay)
+        if url.endswith("/v2/api/control"):
+            return FakeResponse({"success": True, "data": []})
+        return FakeResponse({"success": True, "data": {"id": "1", "slow": delay > 0.5}})
+
+
+def test_slow_reads_are_hedged_within_budget():
+    from soliscloud.middleware import HedgedRequests
+    hedging = HedgedRequests(rate=1.0, budget=0.1, min_samples=3, min_delay=0.05)
+    s = soliscloud.SolisCloud("abc", "xyz", middleware=[hedging])
+    s.client = FakeDelayClient([0.01, 0.01, 0.01, 0.8, 0.01, 0.8])
+    for _ in range(3):
+        s.get_station_detail_data(1)
+    assert hedging.delay("/v1/api/stationDetail") == 0.05
+    assert s.get_station_detail_data(1) == {"id": "1", "slow": False}
+    assert hedging.hedges == 1 and hedging.hedge_wins == 1
+    # the budget allows one hedge every ten seconds
+    assert s.get_station_detail_data(1) == {"id": "1", "slow": True}
+    assert hedging.hedges == 1
+    s.client = FakeDelayClient([0.3])
+    s.set_inverter_charge_discharge_schedule("1", "A", soliscloud.ChargeDischargeSchedule())
+    assert s.client.calls == 1
+    hedging.close()
+
+
+class FakeBarrierClient():
+    """Holds each read until ``parties`` reads are in flight together."""
+    def __init__(self, parties):
+        self.barrier = threading.Barrier(parties, timeout=5)
+
+    def post(self, url, data=None, **kwargs):
+        self.barrier.wait()
+        return FakeResponse({"success": True, "data": {"id": "1"}})
+
+
+def test_hedged_reads_are_not_capped_by_the_hedge_workers():
+    from soliscloud.middleware import HedgedRequests
+    hedging = HedgedRequests(rate=1.0, min_samples=3, min_delay=5.0, max_workers=2)
+    s = soliscloud.SolisCloud("abc", "xyz", coalesce_requests=False, middleware=[hedging])
+    s.client = FakeDelayClient([0.0] * 3)
+    for _ in range(3):
+        s.get_station_detail_data(1)
+    # twelve reads in flight at once, not two at a time: with a cap the
+    # barrier would break and the reads fail
+    s.client = FakeBarrierClient(12)
+    with ThreadPoolExecutor(max_workers=12) as pool:
+        assert list(pool.map(lambda _: s.get_station_detail_data(1), range(12))) == [{"id": "1"}] * 12
+    assert hedging.hedges == 0
+    hedging.close()
+
+
+def test_deadline_bounds_pagination_and_keeps_partial_results():
+    s = soliscloud.SolisCloud("abc", "xyz")
+    s._sleep = lambda seconds: None
+    pages = {1: 200, 2: 200, 3: 429}
+    s.client = FakeRoutingClient({"/v1/api/inverterList": lambda body: {"success": True, "data": {"page": {"pages": 3, "records": [{"id": str(body["pageNo"]), "sn": str(body["pageNo"])}]}}}})
+    post = s.client.post
+
+    def rate_limited_post(url, data=None, **kwargs):
+        res = post(url, data=data, **kwargs)
+        res.status_code = pages[json.loads(data)["pageNo"]]
+        return res
+    s.client.post = rate_limited_post
+    started = time.monotonic()
+    with s.deadline(0.5):
+        try:
+            s.list_inverters()
+            assert False
+        except soliscloud.SolisTimeoutException as err:
+            _, inverters = err.partial
+            assert [x.id for x in inverters] == ["1", "2"]
+    # the 1 s backoff would overrun, so the call gives up without waiting
+    assert time.monotonic() - started < 0.4
+    assert len(s.client.calls) == 3
+
+
+def test_pagination_retries_pages_reports_failures_and_drops_duplicates():
+    s = soliscloud.SolisCloud("abc", "xyz")
+    s._sleep = lambda seconds: None
+    failures = {2: 1, 3: 5}
+    pages = {1: ["A", "B"], 2: ["B", "C"], 3: ["D"], 4: ["E"]}
+    s.client = FakeRoutingClient({"/v1/api/inverterList": lambda body: {"success": True, "data": {"page": {"pages": 4, "records": [{"id": x, "sn": x} for x in pages[body["pageNo"]]]}}}})
+    post = s.client.post
+
+    def flaky_post(url, data=None, **kwargs):
+        res = post(url, data=data, **kwargs)
+        pageNo = json.loads(data)["pageNo"]
+        if failures.get(pageNo):
+            failures[pageNo] -= 1
+            res.status_code, res.reason = 502, "Bad Gateway"
+        return res
+    s.client.post = flaky_post
+    errors = {}
+    _, inverters = s.list_inverters(concurrency=2, errors=errors)
+    assert [x.sn for x in inverters] == ["A", "B", "C", "E"]
+    assert list(errors) == [3] and "502" in errors[3].args[0]
+    failures[3] = 5
+    try:
+        s.list_inverters()
+        assert False
+    except soliscloud.SolisConnectException as err:
+        _, inverters = err.partial
+        assert [x.sn for x in inverters] == ["A", "B", "C"]
+
+
+def test_list_stations_passes_kwargs_and_checks_success():
+    s = soliscloud.SolisCloud("abc", "xyz")
+    s.client = FakeRoutingClient({"/v1/api/userStationList": {"success": True, "data": {
+        "stationStatusVo": {"all": 1}, "page": {"pages": 1, "records": [{"id": "1"}]}
+    }}})
+    status, stations = s.list_stations(NmiCode="N1", state=1)
+    assert status.all == 1 and stations[0].id == "1"
+    assert s.client.calls[0][1] == {"pageNo": 1, "pageSize": 20, "nmiCode": "N1", "state": 1}
+    s.client = FakeRoutingClient({"/v1/api/userStationList": {"success": False, "msg": "denied", "data": None}})
+    try:
+        s.list_stations()
+        assert False
+    except soliscloud.SolisConnectException as err:
+        assert "denied" in err.args[0]
+
+
+class FakeSequenceClient():
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def post(self, url, data=None, headers=None, **kwargs):
+        self.calls.append(dict(headers))
+        status_code, date = self.responses.pop(0)
+        return FakeResponse({"success": True, "data": {"id": "1"}}, status_code, headers={"Date": date})
+
+
+def test_retries_are_signed_with_the_server_clock():
+    s = soliscloud.SolisCloud("abc", "xyz")
+    waits = []
+    s._sleep = waits.append
+    ahead = s.signer.date(s.signer.now() + 300)
+    s.client = FakeSequenceClient([(403, ahead), (429, ahead), (200, ahead)])
+    assert s.get_station_detail_data(1) == {"id": "1"}
+    first, second, third = s.client.calls
+    assert first["Date"] != second["Date"] and first["Authorization"] != second["Authorization"]
+    assert abs(parse_http_date(second["Date"]) - parse_http_date(ahead)) <= 1
+    assert 298 < s.signer.clock_offset < 302
+    assert waits == [1.0]
+    s.client = FakeSequenceClient([(429, ahead)] * 5)
+    res = s.__send__("/v1/api/stationDetail", {"id": 1})
+    assert res.status_code == 429 and len(s.client.calls) == 5
+    assert waits == [1.0, 1.0, 2.0, 4.0, 8.0]
+
+
+class FakeFailingClient(FakeRoutingClient):
+    def __init__(self, routes, errors):
+        super().__init__(routes)
+        self.errors = list(errors)
+
+    def post(self, url, data=None, **kwargs):
+        res = super().post(url, data=data, **kwargs)
+        if self.errors:
+            raise self.errors.pop(0)
+        return res
+
+
+def test_writes_are_not_sent_again_after_a_read_timeout():
+    from requests.exceptions import ConnectTimeout, ReadTimeout
+    s = soliscloud.SolisCloud("abc", "xyz")
+    s._sleep = lambda seconds: None
+    s.client = FakeFailingClient({"/v2/api/control": {"success": True, "data": []}}, [ReadTimeout()])
+    with pytest.raises(ReadTimeout):
+        s.set_inverter_charge_discharge_schedule("1", "A", soliscloud.ChargeDischargeSchedule())
+    assert [uri for uri, _ in s.client.calls] == ["/v2/api/control"]
+    # a write that could not connect never arrived, so it is retried
+    s.client = FakeFailingClient({"/v2/api/control": {"success": True, "data": []}}, [ConnectTimeout()])
+    s.set_inverter_charge_discharge_schedule("1", "A", soliscloud.ChargeDischargeSchedule())
+    assert len(s.client.calls) == 2
+    # reads are retried after a read timeout
+    s.client = FakeFailingClient({"/v1/api/stationDetail": {"success": True, "data": {"id": "1"}}}, [ReadTimeout()])
+    assert s.get_station_detail_data(1) == {"id": "1"}
+    assert len(s.client.calls) == 2
@@ -0,0 +1,49 @@
+from soliscloud.models import EPMDayData, SolisInverter
+from soliscloud.store import TelemetryStore
+
+
+def test_inverter_polls_and_range_queries(tmp_path):
+    with TelemetryStore(str(tmp_path / "telemetry.db")) as store:
+        for x in range(0, 6):
+            inverter = SolisInverter()._from_json({"sn": "A1", "pac": float(x), "dataTimestamp": str(1000 * 60 * x)})
+            store.append_inverters([inverter], fields=("pac",))
+        store.append_inverters([{"sn": "A1", "pac": 99.0, "dataTimestamp": "0"}], fields=("pac",))
+        timestamps, values = store.query("A1", "pac", 60000, 240000)
+        assert list(timestamps) == [60000, 120000, 180000]
+        assert list(values) == [1.0, 2.0, 3.0]
+        assert list(store.downsample("A1", "pac", 0, 360000, 180)[1]) == [1.0, 4.0]
+        assert list(store.downsample("A1", "pac", 0, 360000, 180, how="last")[1]) == [2.0, 5.0]
+        assert store.latest("A1", "pac") == (300000, 5.0)
+    with TelemetryStore(str(tmp_path / "telemetry.db")) as store:
+        assert store.serials() == ["A1"]
+        assert len(store.query("A1", "pac")[0]) == 6
+
+
+def test_epm_day_columns_are_stored():
+    store = TelemetryStore()
+    day = EPMDayData()._from_json_({"data_timestamp": [0, 300000], "p_load": [10, "n/a"], "u_ac1": [230, 231]})
+    assert store.append_epm_day("M1", day) == 3
+    assert store.fields("M1") == ["p_load", "u_ac1"]
+
+
+def test_series_of_a_failed_append_are_not_cached():
+    store = TelemetryStore()
+    try:
+        store.append_many([("A", "pac", 1000, 1.0), ("B", "pac", "not a time", 2.0)])
+        assert False
+    except ValueError:
+        pass
+    assert store.serials() == []
+    assert store.append("A", "pac", 1000, 1.0) == 1
+    assert list(store.query("A", "pac")[1]) == [1.0]
+
+
+def test_series_created_by_another_store_are_seen(tmp_path):
+    path = str(tmp_path / "telemetry.db")
+    with TelemetryStore(path) as reader, TelemetryStore(path) as writer:
+        assert reader.serials() == []
+        writer.append_many([("B1", "pac", 1000, 2.0), ("B1", "eToday", 1000, 0.5)])
+        assert reader.serials() == ["B1"] and reader.fields("B1") == ["eToday", "pac"]
+        assert list(reader.query("B1", "pac")[1]) == [2.0]
+        assert reader.latest("B1", "eToday") == (1000, 0.5)
+        assert list(reader.downsample("B1", "pac", 0, 2000, 1)[1]) == [2.0]
@@ -0,0 +1,48 @@
+from math import isnan
+from soliscloud.table import InverterTable
+
+
+def records():
+    return [
+        {"id": "1", "sn": "A", "stationId": "s1", "pac": 2.0, "eToday": 10, "batteryCapacitySoc": 80},
+        {"id": "2", "sn": "B", "stationId": "s1", "pac": "3.5", "eToday": 12, "batteryCapacitySoc": 20},
+        {"id": "3", "sn": "C", "stationId": "s2", "pac": None, "eToday": 30, "batteryCapacitySoc": 50},
+        {"id": "4", "sn": "D", "stationId": "s2", "pac": 1.0, "eToday": 5},
+    ]
+
+
+class FakeCloud():
+    def iter_inverter_pages(self, concurrency=1, **kwargs):
+        yield records()[:2]
+        yield records()[2:]
+
+
+def test_columns_are_typed_and_dictionary_encoded():
+    table = InverterTable.from_cloud(FakeCloud())
+    assert len(table) == 4
+    assert table.column("pac").typecode == "d" and isnan(table.column("pac")[2])
+    assert list(table.codes["stationId"]) == [0, 0, 1, 1]
+    assert table.dictionaries["stationId"] == ["s1", "s2"]
+    assert table.row(1)["sn"] == "B" and table.row(1)["pac"] == 3.5
+
+
+def test_group_by_filter_and_rank():
+    table = InverterTable.from_records(records())
+    assert table.group_by("stationId", "pac") == {"s1": 5.5, "s2": 1.0}
+    assert table.group_by("stationId", "eToday", "max") == {"s1": 12, "s2": 30}
+    assert table.group_by("stationId", "pac", "count") == {"s1": 2, "s2": 1}
+    assert list(table.where(("batteryCapacitySoc", "<", 60), ("stationId", "in", ["s1", "s9"]))) == [1]
+    low = table.filter(("stationId", "==", "s2"))
+    assert low.strings("sn") == ["C", "D"]
+    assert table.strings("sn", table.top("eToday", 2)) == ["C", "B"]
+    assert table.sum("eToday", table.mask("stationId", "==", "s1")) == 22
+
+
+def test_derived_tables_do_not_share_dictionaries():
+    table = InverterTable.from_records(records())
+    low = table.filter(("stationId", "==", "s2"))
+    low.extend([{"id": "5", "sn": "E", "stationId": "s3", "pac": 4.0}])
+    table.extend([{"id": "6", "sn": "F", "stationId": "s4", "pac": 1.5}])
+    assert low.strings("stationId") == ["s2", "s2", "s3"]
+    assert table.strings("stationId")[-1] == "s4" and "s3" not in table.dictionaries["stationId"]
+    assert list(table.where(("stationId", "==", "s3"))) == []